@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+One-off job: rebuild activity_rollups from the raw tables
+
+Usage: python backfill_rollups.py [metric ...]   (default: all metrics)
+
+Afterwards the API keeps the rollups current on every write. Rerunning is safe:
+each metric is deleted and recounted inside one transaction.
+
+menu_changes can only be rebuilt where menu_items has updated_at/created_at columns
+(databases created from mysql_schema.sql). The backend's own schema has neither, so
+there it is left alone and counts menu changes from the first write onwards.
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+load_dotenv(Path(__file__).parent / '.env')
+
+from mysql_pool import MySQLPool  # noqa: E402
+from migrations import migrate  # noqa: E402
+from rollups import METRICS, backfill  # noqa: E402
+
+
+async def main(metrics):
+    unknown = [metric for metric in metrics if metric not in METRICS]
+    if unknown:
+        sys.exit(f"Unknown metrics: {', '.join(unknown)} (known: {', '.join(METRICS)})")
+    pool = MySQLPool.from_env()
+    await pool.init()
+    try:
+        await migrate(pool)
+        async with pool.transaction() as conn:
+            cursor = await conn.cursor()
+            written = await backfill(cursor, metrics or None)
+        for metric, rows in written.items():
+            if rows is None:
+                table, columns = METRICS[metric]
+                print(f"ℹ️  {metric}: {table} has no {'/'.join(columns)} column, no history to rebuild; "
+                      f"counted from new writes only")
+            else:
+                print(f"✅ {metric}: {rows} rollup rows" if rows else f"⚠️  {metric}: no data")
+    finally:
+        await pool.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(sys.argv[1:]))
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark: GET /api/menu/items via per-request Pydantic models vs. the pre-serialized snapshot
+
+Usage: python benchmark_menu_snapshot.py [sizes...]   (default: 100 1000 10000)
+
+Runs in-process without MySQL; rows are synthetic but shaped like menu_items.
+"""
+import asyncio
+import sys
+import time
+from typing import List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from starlette.requests import Request
+
+from menu_snapshot import MenuSnapshot, MenuSnapshotEngine
+from http_cache import payload_response
+from server import MenuItem
+
+CATEGORIES = ['inicio', 'salat', 'tapa paella', 'tapas vegetarian', 'tapas de carne', 'tapas de pescado', 'dessert']
+
+
+def make_rows(count):
+    return [{
+        "id": f"00000000-0000-0000-0000-{i:012d}",
+        "name": f"Gericht {i}",
+        "description": "Klassische spanische Knoblauchgarnelen in bestem Olivenöl",
+        "detailed_description": "Frische Garnelen in bestem Olivenöl mit viel Knoblauch, Chili und Petersilie",
+        "price": "12,90",
+        "category": CATEGORIES[i % len(CATEGORIES)],
+        "origin": "Andalusien",
+        "allergens": "Krebstiere",
+        "additives": "",
+        "preparation_method": "In der Pfanne gebraten",
+        "ingredients": "Garnelen, Olivenöl, Knoblauch, Chili, Petersilie",
+        "vegan": 0, "vegetarian": i % 3 == 0, "glutenfree": 1,
+        "order_index": i, "is_active": 1,
+    } for i in range(count)]
+
+
+def make_request(accept_encoding=""):
+    headers = [(b"accept-encoding", accept_encoding.encode())] if accept_encoding else []
+    return Request({"type": "http", "method": "GET", "path": "/api/menu/items", "headers": headers})
+
+
+async def current_path(rows, field):
+    # What get_menu_items did before: models per row, re-validation via response_model, JSON render
+    models = [MenuItem(**row) for row in rows]
+    content = await serialize_response(field=field, response_content=models)
+    return JSONResponse(content).body
+
+
+async def bench(func, repeat):
+    await func()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        await func()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+async def run(sizes):
+    field = create_response_field(name="Response_get_menu_items", type_=List[MenuItem])
+    print(f"{'items':>7} {'current ms':>11} {'snapshot hit ms':>16} {'rebuild ms':>11} {'speedup':>8} {'json KB':>8} {'gzip KB':>8}")
+    for size in sizes:
+        rows = make_rows(size)
+        repeat = max(5, 20000 // size)
+        engine = MenuSnapshotEngine(lambda: _loaded(rows), MenuItem)
+        request = make_request("gzip, deflate, br")
+
+        async def snapshot_hit():
+            return payload_response(request, (await engine.get()).payload)
+
+        async def rebuild():
+            return MenuSnapshot.build(rows, "bench", MenuItem)
+
+        current = await bench(lambda: current_path(rows, field), repeat)
+        hit = await bench(snapshot_hit, repeat * 10)
+        rebuilt = await bench(rebuild, repeat)
+        snapshot = await engine.get()
+        assert snapshot.payload.body == await current_path(rows, field), "snapshot differs from live response"
+        sizes_kb = snapshot.payload.sizes()
+        print(f"{size:>7} {current:>11.3f} {hit:>16.4f} {rebuilt:>11.3f} {current / hit:>7.0f}x "
+              f"{sizes_kb['identity'] / 1024:>8.1f} {sizes_kb.get('gzip', 0) / 1024:>8.1f}")
+
+
+async def _loaded(rows):
+    return rows, "bench"
+
+
+if __name__ == "__main__":
+    asyncio.run(run([int(arg) for arg in sys.argv[1:]] or [100, 1000, 10000]))
@@ -0,0 +1,21 @@
+def placeholders(values):
+    return ", ".join(["%s"] * len(values))
+
+
+def case_update(table, rows, key="id"):
+    """A single UPDATE giving each row its own values: `rows` maps key -> {column: value}
+
+    Every column becomes one CASE over the keys that set it; rows that do not mention a
+    column keep their current value. Returns (sql, params).
+    """
+    columns = sorted({column for values in rows.values() for column in values})
+    assignments, params = [], []
+    for column in columns:
+        cases = [(row_key, values[column]) for row_key, values in rows.items() if column in values]
+        assignments.append(f"{column} = CASE {key} " + " ".join(["WHEN %s THEN %s"] * len(cases))
+                           + f" ELSE {column} END")
+        for row_key, value in cases:
+            params += [row_key, value]
+    keys = list(rows)
+    sql = f"UPDATE {table} SET {', '.join(assignments)} WHERE {key} IN ({placeholders(keys)})"
+    return sql, params + keys
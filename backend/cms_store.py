@@ -0,0 +1,66 @@
+import json
+import uuid
+
+from http_cache import PayloadCache
+
+
+def section_key(key):
+    """content_sections (page, section) for a CMS key: "website-texts/footer" -> ("website-texts", "footer")"""
+    page, _, section = key.partition("/")
+    return page, section or "main"
+
+
+class CMSStore:
+    """CMS content persisted in content_sections and served from encoded in-memory payloads
+
+    Each row carries a version that every write increments. The cache keeps the newest
+    version it has seen per key and swaps in a new payload only after the write committed,
+    so readers see either the old or the new content, never a mix. Keys nobody has saved
+    yet fall back to the built-in defaults of the GET handlers.
+    """
+
+    def __init__(self):
+        self.payloads = PayloadCache()
+        self.versions = {}
+
+    async def load(self, db):
+        async with db.acquire() as conn:
+            cursor = await conn.cursor()
+            await cursor.execute("SELECT page, section, content, version FROM content_sections")
+            rows = await cursor.fetchall()
+        for row in rows:
+            key = row["page"] if row["section"] == "main" else "%s/%s" % (row["page"], row["section"])
+            content = row["content"]
+            self._swap(key, json.loads(content) if isinstance(content, (str, bytes)) else content, row["version"])
+
+    def get(self, key, default):
+        """Encoded payload for `key`; `default()` supplies the content until the first save"""
+        return self.payloads.get(key, default)
+
+    async def put(self, pool, conn, key, content, updated_by):
+        """Persist `content` as the next version of `key` and make it the served payload"""
+        page, section = section_key(key)
+        async with pool.transaction(conn):
+            cursor = await conn.cursor()
+            await cursor.execute("""
+                INSERT INTO content_sections (id, page, section, content, updated_by, version)
+                VALUES (%s, %s, %s, %s, %s, 1)
+                ON DUPLICATE KEY UPDATE content = VALUES(content), updated_by = VALUES(updated_by),
+                                        version = version + 1
+            """, (str(uuid.uuid4()), page, section, json.dumps(content, ensure_ascii=False), updated_by))
+            await cursor.execute("SELECT version FROM content_sections WHERE page = %s AND section = %s",
+                                 (page, section))
+            version = (await cursor.fetchone())["version"]
+        self._swap(key, content, version)
+        return version
+
+    def _swap(self, key, content, version):
+        # A slower concurrent write that committed earlier must not replace a newer version
+        if version >= self.versions.get(key, 0):
+            self.versions[key] = version
+            self.payloads.put(key, content)
+
+    def stats(self):
+        stats = self.payloads.stats()
+        stats["versions"] = dict(self.versions)
+        return stats
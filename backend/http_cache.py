@@ -0,0 +1,164 @@
+import gzip
+import hashlib
+import json
+
+from starlette.responses import Response
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, gzip is always available
+    brotli = None
+
+# Browsers must revalidate, but an unchanged resource then costs a bodiless 304
+REVALIDATE = "no-cache"
+
+# Below this size compression costs more than it saves
+MIN_COMPRESS_SIZE = 512
+
+
+def make_etag(*parts):
+    """Strong ETag from arbitrary version parts (digests, counters, query params)"""
+    raw = "|".join(str(part) for part in parts)
+    return '"%s"' % hashlib.sha1(raw.encode()).hexdigest()[:20]
+
+
+def content_etag(content):
+    """ETag for a JSON-serializable payload, e.g. a static CMS dict"""
+    return make_etag(json.dumps(content, sort_keys=True, ensure_ascii=False, default=str))
+
+
+def etag_matches(request, etag):
+    """If-None-Match uses weak comparison; nginx weakens our ETags when it gzips the body"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in header.split(",")]
+    return any((tag[2:] if tag.startswith("W/") else tag) == etag for tag in candidates)
+
+
+def not_modified(etag):
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": REVALIDATE})
+
+
+def set_etag(response, etag):
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = REVALIDATE
+
+
+def dumps(content):
+    """Serialize like starlette's JSONResponse, so cached bytes match a live response"""
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None,
+                      separators=(",", ":"), default=str).encode("utf-8")
+
+
+class EncodedPayload:
+    """A JSON body serialized once, with gzip/brotli variants compressed once"""
+
+    def __init__(self, body, etag=None):
+        self.body = body
+        self.etag = etag or make_etag(hashlib.sha1(body).hexdigest())
+        self.variants = {"identity": body}
+        if len(body) >= MIN_COMPRESS_SIZE:
+            self.variants["gzip"] = gzip.compress(body, compresslevel=6, mtime=0)
+            if brotli is not None:
+                self.variants["br"] = brotli.compress(body, quality=9)
+
+    @classmethod
+    def from_content(cls, content, etag=None):
+        return cls(dumps(content), etag)
+
+    def sizes(self):
+        return {encoding: len(data) for encoding, data in self.variants.items()}
+
+
+class PayloadCache:
+    """Encoded payloads by key; a payload is re-encoded only when its content changes"""
+
+    def __init__(self):
+        self._payloads = {}
+        self.builds = 0
+
+    def get(self, key, build):
+        """The cached payload for `key`, calling `build()` for its content on first use"""
+        payload = self._payloads.get(key)
+        if payload is None:
+            payload = self.put(key, build())
+        return payload
+
+    def put(self, key, content):
+        etag = content_etag(content)
+        payload = self._payloads.get(key)
+        if payload is None or payload.etag != etag:
+            payload = self._payloads[key] = EncodedPayload.from_content(content, etag)
+            self.builds += 1
+        return payload
+
+    def pop(self, key):
+        self._payloads.pop(key, None)
+
+    def stats(self):
+        return {
+            "entries": len(self._payloads),
+            "builds": self.builds,
+            "bytes": {key: payload.sizes() for key, payload in self._payloads.items()},
+        }
+
+
+class BundleCache:
+    """JSON objects assembled from other encoded payloads, rebuilt only when a member's ETag changes"""
+
+    def __init__(self):
+        self._bundles = {}
+        self.builds = 0
+
+    def get(self, key, members):
+        """`members` is a list of (name, EncodedPayload); their bodies are spliced in without re-parsing"""
+        etags = tuple(payload.etag for _, payload in members)
+        cached = self._bundles.get(key)
+        if cached is None or cached[0] != etags:
+            body = b"{" + b",".join(dumps(name) + b":" + payload.body for name, payload in members) + b"}"
+            cached = self._bundles[key] = (etags, EncodedPayload(body, make_etag("bundle", key, *etags)))
+            self.builds += 1
+        return cached[1]
+
+    def stats(self):
+        return {
+            "entries": len(self._bundles),
+            "builds": self.builds,
+            "bytes": {key: payload.sizes() for key, (_, payload) in self._bundles.items()},
+        }
+
+
+def _accepted_encodings(request):
+    accepted = {}
+    for part in request.headers.get("accept-encoding", "").split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        if name:
+            accepted[name.lower()] = q
+    return accepted
+
+
+def payload_response(request, payload, media_type="application/json"):
+    """Send the best pre-encoded variant, or a 304 if the client's copy is current"""
+    accepted = _accepted_encodings(request)
+    encoding = "identity"
+    for candidate in ("br", "gzip"):
+        if candidate in payload.variants and accepted.get(candidate, 0) > 0:
+            encoding = candidate
+            break
+    # Each content-coding is a different representation, so it gets its own strong ETag
+    etag = payload.etag if encoding == "identity" else payload.etag[:-1] + "-" + encoding + '"'
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    headers = {"ETag": etag, "Cache-Control": REVALIDATE, "Vary": "Accept-Encoding"}
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    return Response(content=payload.variants[encoding], media_type=media_type, headers=headers)
@@ -0,0 +1,110 @@
+import math
+import os
+import time
+from collections import OrderedDict, deque
+
+
+class SlidingWindowLimiter:
+    """At most `limit` attempts per key within any `window` seconds"""
+
+    def __init__(self, limit, window, max_keys=10000):
+        self.limit = limit
+        self.window = window
+        self.max_keys = max_keys
+        self.blocked = 0
+        self._attempts = OrderedDict()   # key -> deque of attempt times, least recently used first
+
+    def _prune(self, key, now):
+        attempts = self._attempts.get(key)
+        if attempts is None:
+            return None
+        while attempts and attempts[0] <= now - self.window:
+            attempts.popleft()
+        if not attempts:
+            del self._attempts[key]
+            return None
+        return attempts
+
+    def retry_after(self, key, now):
+        """Seconds until `key` may try again, 0 if it may try now"""
+        attempts = self._prune(key, now)
+        if attempts is None or len(attempts) < self.limit:
+            return 0
+        return attempts[0] + self.window - now
+
+    def hit(self, key, now):
+        attempts = self._attempts.get(key)
+        if attempts is None:
+            attempts = self._attempts[key] = deque()
+        self._attempts.move_to_end(key)
+        attempts.append(now)
+        # Only after the append: eviction prunes empty windows, which would include this one
+        if len(self._attempts) > self.max_keys:
+            self._evict(now)
+
+    def reset(self, key):
+        self._attempts.pop(key, None)
+
+    def _evict(self, now):
+        for key in list(self._attempts):
+            self._prune(key, now)
+        while len(self._attempts) > self.max_keys:
+            self._attempts.popitem(last=False)
+
+    def locked(self, now):
+        return sorted(key for key in list(self._attempts) if self.retry_after(key, now) > 0)
+
+    def stats(self, now):
+        locked = self.locked(now)
+        return {
+            "limit": self.limit,
+            "window_seconds": self.window,
+            "tracked": len(self._attempts),
+            "locked": len(locked),
+            "locked_keys": locked[:20],
+            "blocked_total": self.blocked,
+        }
+
+
+class LoginThrottle:
+    """Sliding-window limits on login attempts per username and per client IP
+
+    Every attempt that gets past the check counts, successful or not, so a burst of
+    parallel requests is cut off before it reaches the database or bcrypt. A successful
+    login clears its username's window; the IP window keeps running.
+    """
+
+    def __init__(self, per_user=5, per_ip=20, window=300):
+        self.users = SlidingWindowLimiter(per_user, window)
+        self.ips = SlidingWindowLimiter(per_ip, window)
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            per_user=int(os.environ.get('LOGIN_MAX_ATTEMPTS_PER_USER', 5)),
+            per_ip=int(os.environ.get('LOGIN_MAX_ATTEMPTS_PER_IP', 20)),
+            window=int(os.environ.get('LOGIN_THROTTLE_WINDOW', 300)),
+        )
+
+    def acquire(self, username, ip):
+        """Record an attempt and return 0, or return the seconds to wait without recording it"""
+        now = time.monotonic()
+        username = (username or "").strip().lower()
+        wait = 0
+        for limiter, key in ((self.users, username), (self.ips, ip)):
+            key_wait = limiter.retry_after(key, now)
+            if key_wait:
+                limiter.blocked += 1
+                wait = max(wait, key_wait)
+        if wait:
+            return math.ceil(wait)
+        self.users.hit(username, now)
+        self.ips.hit(ip, now)
+        return 0
+
+    def succeeded(self, username):
+        self.users.reset((username or "").strip().lower())
+
+    def stats(self):
+        now = time.monotonic()
+        return {"perUser": self.users.stats(now), "perIp": self.ips.stats(now)}
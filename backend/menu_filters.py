@@ -0,0 +1,113 @@
+import re
+
+from menu_search import normalize
+
+# Canonical allergen keys and the spellings found in menu_items.allergens, including the
+# plural/dative forms of the trace wording ("kann Spuren von Schalentieren enthalten")
+ALLERGEN_SYNONYMS = {
+    "gluten": ("gluten", "weizen", "glutenhaltiges getreide"),
+    "krebstiere": ("krebstiere", "krebstier", "krebstieren", "krustentiere", "krustentier", "krustentieren",
+                   "schalentiere", "schalentier", "schalentieren"),
+    "eier": ("eier", "ei", "eiern"),
+    "fisch": ("fisch",),
+    "erdnuesse": ("erdnuesse", "erdnuss", "erdnuessen"),
+    "soja": ("soja",),
+    "milch": ("milch", "laktose", "milchprodukte", "milchprodukten"),
+    "nuesse": ("nuesse", "nuessen", "schalenfruechte", "schalenfruechten", "nuss"),
+    "sellerie": ("sellerie",),
+    "senf": ("senf",),
+    "sesam": ("sesam",),
+    "sulfite": ("sulfite", "sulfit", "sulfiten", "schwefeldioxid"),
+    "lupinen": ("lupinen", "lupine"),
+    "weichtiere": ("weichtiere", "weichtier", "weichtieren"),
+    # Not one of the 14 declarable allergens, but listed in the allergens column
+    "konservierungsstoffe": ("konservierungsstoffe", "konservierungsstoff", "konservierungsstoffen"),
+}
+_ALLERGEN_KEYS = {spelling: key for key, spellings in ALLERGEN_SYNONYMS.items() for spelling in spellings}
+# Whole-word spellings, longest first so "eier" wins over "ei"
+_SPELLINGS = re.compile(r"\b(%s)\b" % "|".join(sorted(map(re.escape, _ALLERGEN_KEYS), key=len, reverse=True)))
+# "Keine", "Keine bekannten Allergene" and "kann Spuren von ... enthalten" / "enthält ein wenig ..." wording
+_FILLER = re.compile(r"\b(keine bekannten allergene|keine|kann spuren von|spuren von|enthalten|enthaelt|ein wenig|eine|ein)\b")
+# Notes such as "Sulfite (im Wein)"
+_NOTE = re.compile(r"\([^)]*\)")
+
+DIET_FLAGS = ("vegan", "vegetarian", "glutenfree")
+
+
+def allergen_keys(name):
+    """Canonical keys of every allergen named in one part (Nüsse -> nuesse, "Milch Ei" -> milch, eier)
+
+    Words left over once the known spellings and the filler wording are removed stay
+    together as one key of their own, which MenuBitmapIndex.stats lists as unrecognized.
+    """
+    text = _FILLER.sub(" ", _NOTE.sub(" ", normalize(name)))
+    keys = {_ALLERGEN_KEYS[spelling] for spelling in _SPELLINGS.findall(text)}
+    rest = " ".join(re.split(r"[^a-z0-9]+", _SPELLINGS.sub(" ", text))).strip()
+    if rest:
+        keys.add(rest)
+    return keys
+
+
+def parse_allergens(text):
+    """Canonical allergen keys of a free-text allergens column
+
+    Traces ("kann Spuren von Nüssen enthalten") count as containing the allergen,
+    so excluding it never lets a dish with traces through.
+    """
+    keys = set()
+    for part in re.split(r"[,;/]|\bund\b", normalize(text)):
+        keys |= allergen_keys(part)
+    return keys
+
+
+def parse_allergen_list(value):
+    """Canonical keys of a comma separated query parameter such as "Sesam,Krebstiere" """
+    return {key for part in (value or "").split(",") for key in allergen_keys(part)}
+
+
+class MenuBitmapIndex:
+    """Bitsets over snapshot item positions per diet flag, allergen and category
+
+    Bit i stands for snapshot.items[i], so a combined filter is a few int AND/ANDNOT
+    operations followed by one walk over the set bits in menu order.
+    """
+
+    def __init__(self, items, category_positions):
+        self.size = len(items)
+        self.all = (1 << self.size) - 1
+        self.flags = {flag: 0 for flag in DIET_FLAGS}
+        self.allergens = {}
+        for position, item in enumerate(items):
+            bit = 1 << position
+            for flag in DIET_FLAGS:
+                if item.get(flag):
+                    self.flags[flag] |= bit
+            for key in parse_allergens(item.get("allergens")):
+                self.allergens[key] = self.allergens.get(key, 0) | bit
+        # Vegan dishes are vegetarian too, even where only the vegan flag was ticked
+        self.flags["vegetarian"] |= self.flags["vegan"]
+        self.categories = {key: sum(1 << i for i in positions) for key, positions in category_positions.items()}
+
+    def select(self, flags=(), exclude_allergens=(), category=None):
+        bits = self.all if category is None else self.categories.get(category, 0)
+        for flag in flags:
+            bits &= self.flags[flag]
+        for key in exclude_allergens:
+            bits &= ~self.allergens.get(key, 0)
+        return bits
+
+    @staticmethod
+    def positions(bits):
+        while bits:
+            low = bits & -bits
+            yield low.bit_length() - 1
+            bits ^= low
+
+    def stats(self):
+        return {
+            "items": self.size,
+            "flags": {flag: bin(bits).count("1") for flag, bits in self.flags.items()},
+            "allergens": {key: bin(bits).count("1") for key, bits in sorted(self.allergens.items())},
+            # Spellings missing from ALLERGEN_SYNONYMS; these dishes slip through other spellings' filters
+            "unrecognized": sorted(key for key in self.allergens if key not in ALLERGEN_SYNONYMS),
+        }
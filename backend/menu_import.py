@@ -0,0 +1,144 @@
+import csv
+import io
+import json
+import uuid
+
+TEXT_FIELDS = ("name", "description", "detailed_description", "price", "category", "origin",
+               "allergens", "additives", "preparation_method", "ingredients")
+BOOL_FIELDS = ("vegan", "vegetarian", "glutenfree", "is_active")
+INT_FIELDS = ("order_index",)
+REQUIRED_FIELDS = ("name", "category", "price")
+# MenuItem requires a string here; NULL would make the menu snapshot fail for every visitor
+NOT_NULL_TEXT_FIELDS = ("description",)
+IMPORT_FIELDS = ("id",) + TEXT_FIELDS + BOOL_FIELDS + INT_FIELDS
+
+TRUE_VALUES = {"1", "true", "yes", "ja", "x", "y", "j"}
+FALSE_VALUES = {"0", "false", "no", "nein", "", "n"}
+
+
+class MenuImportError(ValueError):
+    """The document as a whole cannot be read"""
+
+
+def menu_key(category, name):
+    """Stable identity of a dish without an id: category and name, trimmed and case-folded"""
+    return (" ".join(str(category or "").split()).casefold(), " ".join(str(name or "").split()).casefold())
+
+
+def parse_document(body, fmt):
+    """Rows of a CSV (comma or semicolon separated, header line) or JSON (list or {"items": [...]}) document"""
+    text = body.decode("utf-8-sig") if isinstance(body, bytes) else body
+    if fmt == "json":
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise MenuImportError(f"Invalid JSON: {e}")
+        rows = data.get("items") if isinstance(data, dict) else data
+        if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+            raise MenuImportError("JSON must be a list of objects or {\"items\": [...]}")
+        return rows
+    try:
+        dialect = csv.Sniffer().sniff(text[:4096], delimiters=",;\t")
+    except csv.Error:
+        dialect = csv.excel
+    reader = csv.DictReader(io.StringIO(text), dialect=dialect)
+    if not reader.fieldnames:
+        raise MenuImportError("CSV has no header line")
+    return [{key.strip(): value for key, value in row.items() if key} for row in reader]
+
+
+def _bool(value):
+    if isinstance(value, bool):
+        return value
+    text = str(value if value is not None else "").strip().lower()
+    if text in TRUE_VALUES:
+        return True
+    if text in FALSE_VALUES:
+        return False
+    raise ValueError(f"not a yes/no value: {value!r}")
+
+
+def normalize_row(raw):
+    """Known columns of one document row, converted for menu_items; raises ValueError on bad values"""
+    values = {}
+    for field in TEXT_FIELDS:
+        if field in raw:
+            value = raw[field]
+            if value is None:
+                values[field] = "" if field in NOT_NULL_TEXT_FIELDS else None
+            else:
+                values[field] = str(value).strip()
+    for field in BOOL_FIELDS:
+        if field in raw:
+            try:
+                values[field] = _bool(raw[field])
+            except ValueError as e:
+                raise ValueError(f"{field}: {e}")
+    for field in INT_FIELDS:
+        if field in raw and str(raw[field]).strip() != "":
+            try:
+                values[field] = int(str(raw[field]).strip())
+            except ValueError:
+                raise ValueError(f"{field}: not a whole number: {raw[field]!r}")
+    missing = [field for field in REQUIRED_FIELDS if not values.get(field)]
+    if missing:
+        raise ValueError(f"missing {', '.join(missing)}")
+    if raw.get("id"):
+        values["id"] = str(raw["id"]).strip()
+    return values
+
+
+def validate(rows):
+    """One pass over the document: (valid rows, errors as {"row", "error"}); later duplicates are skipped"""
+    valid, errors, seen = [], [], {}
+    for number, raw in enumerate(rows, start=1):
+        try:
+            values = normalize_row(raw)
+        except ValueError as e:
+            errors.append({"row": number, "error": str(e)})
+            continue
+        key = values.get("id") or menu_key(values["category"], values["name"])
+        if key in seen:
+            errors.append({"row": number, "error": f"duplicate of row {seen[key]}"})
+            continue
+        seen[key] = number
+        valid.append(values)
+    return valid, errors
+
+
+async def load_menu_keys(cursor):
+    """Existing ids and the (category, name) -> id map, in one query"""
+    await cursor.execute("SELECT id, category, name FROM menu_items")
+    rows = await cursor.fetchall()
+    return {row["id"] for row in rows}, {menu_key(row["category"], row["name"]): row["id"] for row in rows}
+
+
+async def upsert_rows(cursor, rows):
+    """INSERT … ON DUPLICATE KEY UPDATE `rows` batched with executemany; returns (inserted, updated)
+
+    Rows without an id are matched to existing dishes by category and name. Rows sharing
+    the same set of columns go into one executemany, which aiomysql sends as one
+    multi-row INSERT, so a full menu is a handful of statements.
+    """
+    ids, keys = await load_menu_keys(cursor)
+    inserted = updated = 0
+    groups = {}
+    for values in rows:
+        values = dict(values)
+        item_id = values.get("id") or keys.get(menu_key(values["category"], values["name"]))
+        if item_id in ids:
+            updated += 1
+        else:
+            inserted += 1
+            values.setdefault("description", "")
+        values["id"] = item_id or str(uuid.uuid4())
+        columns = tuple(field for field in IMPORT_FIELDS if field in values)
+        groups.setdefault(columns, []).append(tuple(values[column] for column in columns))
+    for columns, params in groups.items():
+        updates = ", ".join(f"{column} = VALUES({column})" for column in columns if column != "id")
+        await cursor.executemany(f"""
+            INSERT INTO menu_items ({', '.join(columns)})
+            VALUES ({', '.join(['%s'] * len(columns))})
+            ON DUPLICATE KEY UPDATE {updates}
+        """, params)
+    return inserted, updated
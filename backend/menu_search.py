@@ -0,0 +1,204 @@
+import bisect
+import re
+import unicodedata
+
+from http_cache import dumps
+
+# Field weights: a hit in the dish name counts more than one in the long description
+SEARCH_FIELDS = {
+    "name": 3.0,
+    "ingredients": 2.0,
+    "allergens": 2.0,
+    "description": 1.0,
+    "detailed_description": 1.0,
+}
+# Diet flags are searchable as words, so "glutenfrei" finds dishes flagged glutenfree
+DIET_TERMS = {"vegan": "vegan", "vegetarian": "vegetarisch", "glutenfree": "glutenfrei"}
+STOPWORDS = {"und", "mit", "der", "die", "das", "den", "dem", "des", "ein", "eine", "in", "im",
+             "auf", "aus", "von", "vom", "zum", "zur", "oder", "y", "con", "de", "la", "el", "al"}
+
+_UMLAUTS = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss"})
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+EXACT, PREFIX, COMPOUND, FUZZY = 1.0, 0.8, 0.6, 0.5
+
+
+def normalize(text):
+    """Lowercase, fold umlauts/ß the German way and strip other accents (Jamón -> jamon)"""
+    text = (text or "").lower().translate(_UMLAUTS)
+    text = unicodedata.normalize("NFKD", text)
+    return "".join(ch for ch in text if not unicodedata.combining(ch))
+
+
+def tokenize(text):
+    return [t for t in _NON_WORD.split(normalize(text)) if len(t) > 1 and t not in STOPWORDS]
+
+
+def _max_edits(term):
+    return 0 if len(term) < 4 else 1 if len(term) < 8 else 2
+
+
+def _deletes(term, depth):
+    """All strings reachable from `term` by up to `depth` deletions (symmetric-delete fuzzy lookup)"""
+    found = {term}
+    frontier = {term}
+    for _ in range(depth):
+        frontier = {word[:i] + word[i + 1:] for word in frontier for i in range(len(word))}
+        found |= frontier
+    return found
+
+
+def _edit_distance(a, b, limit):
+    """Optimal string alignment distance, giving up once it exceeds `limit`"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    prev2, prev = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+        if min(cur) > limit:
+            return limit + 1
+        prev2, prev = prev, cur
+    return prev[-1]
+
+
+class MenuSearchIndex:
+    """Inverted index over the active menu with German normalization and typo tolerance
+
+    The index follows MenuSnapshot versions: sync() re-tokenizes only items whose
+    serialized form changed, so a write to one dish touches one document.
+    """
+
+    def __init__(self):
+        self.digest = None
+        self._postings = {}       # term -> {item_id: weight}
+        self._doc_terms = {}      # item_id -> set of terms
+        self._doc_bytes = {}      # item_id -> serialized item, to detect changes
+        self._docs = {}           # item_id -> item dict
+        self._order = {}          # item_id -> menu position, for stable ranking ties
+        self._vocabulary = []     # sorted terms, for prefix lookups
+        self._deletes = {}        # deletion variant -> terms, for fuzzy lookups
+        self.updates = 0
+
+    def sync(self, snapshot):
+        if snapshot.digest == self.digest:
+            return
+        seen = set()
+        for position, (item, data) in enumerate(zip(snapshot.items, snapshot.item_bytes)):
+            item_id = item["id"]
+            seen.add(item_id)
+            self._order[item_id] = position
+            if self._doc_bytes.get(item_id) != data:
+                self.upsert(item, data)
+        for item_id in [i for i in self._docs if i not in seen]:
+            self.remove(item_id)
+            self._order.pop(item_id, None)
+        self.digest = snapshot.digest
+
+    def upsert(self, item, data=None):
+        item_id = item["id"]
+        self.remove(item_id)
+        weights = {}
+        for field, weight in SEARCH_FIELDS.items():
+            for term in tokenize(item.get(field)):
+                weights[term] = max(weights.get(term, 0.0), weight)
+        for flag, term in DIET_TERMS.items():
+            if item.get(flag):
+                weights[term] = max(weights.get(term, 0.0), 2.0)
+        for term, weight in weights.items():
+            if term not in self._postings:
+                self._add_term(term)
+            self._postings[term][item_id] = weight
+        self._doc_terms[item_id] = set(weights)
+        self._doc_bytes[item_id] = data if data is not None else dumps(item)
+        self._docs[item_id] = item
+        self._order.setdefault(item_id, len(self._order))
+        self.updates += 1
+
+    def remove(self, item_id):
+        for term in self._doc_terms.pop(item_id, ()):
+            postings = self._postings[term]
+            postings.pop(item_id, None)
+            if not postings:
+                self._drop_term(term)
+        self._doc_bytes.pop(item_id, None)
+        self._docs.pop(item_id, None)
+
+    def _add_term(self, term):
+        self._postings[term] = {}
+        bisect.insort(self._vocabulary, term)
+        for variant in _deletes(term, _max_edits(term)):
+            self._deletes.setdefault(variant, set()).add(term)
+
+    def _drop_term(self, term):
+        del self._postings[term]
+        del self._vocabulary[bisect.bisect_left(self._vocabulary, term)]
+        for variant in _deletes(term, _max_edits(term)):
+            terms = self._deletes.get(variant)
+            if terms is not None:
+                terms.discard(term)
+                if not terms:
+                    del self._deletes[variant]
+
+    def _expand(self, token):
+        """Index terms matching a query token, with a match-quality factor"""
+        matches = {}
+        if token in self._postings:
+            matches[token] = EXACT
+        if len(token) >= 3:
+            i = bisect.bisect_left(self._vocabulary, token)
+            while i < len(self._vocabulary) and self._vocabulary[i].startswith(token):
+                matches.setdefault(self._vocabulary[i], PREFIX)
+                i += 1
+        if len(token) >= 4:
+            # German compounds: "garnelen" should find "riesengarnelen"
+            for term in self._vocabulary:
+                if token in term:
+                    matches.setdefault(term, COMPOUND)
+        limit = _max_edits(token)
+        if limit:
+            candidates = set()
+            for variant in _deletes(token, limit):
+                candidates |= self._deletes.get(variant, set())
+            for term in candidates:
+                if term not in matches and _edit_distance(token, term, limit) <= limit:
+                    matches[term] = FUZZY
+        return matches
+
+    def search(self, query, limit=20):
+        """Ids of the best matching dishes, best first"""
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        scores = None
+        for token in tokens:
+            token_scores = {}
+            for term, quality in self._expand(token).items():
+                for item_id, weight in self._postings[term].items():
+                    score = weight * quality
+                    if score > token_scores.get(item_id, 0.0):
+                        token_scores[item_id] = score
+            # Every query word has to match somewhere in the dish
+            if scores is None:
+                scores = token_scores
+            else:
+                scores = {i: s + token_scores[i] for i, s in scores.items() if i in token_scores}
+            if not scores:
+                return []
+        ranked = sorted(scores, key=lambda i: (-scores[i], self._order.get(i, 0)))
+        return ranked[:limit]
+
+    def serialized(self, item_ids):
+        """JSON array of the given items, joined from their pre-serialized fragments"""
+        return b"[" + b",".join(self._doc_bytes[item_id] for item_id in item_ids) + b"]"
+
+    def stats(self):
+        return {
+            "documents": len(self._docs),
+            "terms": len(self._postings),
+            "updates": self.updates,
+        }
@@ -0,0 +1,139 @@
+from http_cache import EncodedPayload, dumps, make_etag
+from menu_filters import MenuBitmapIndex
+
+# Display order and names for menu_items.category (food first, drinks last).
+# Categories not listed here follow in menu order under their own name.
+CATEGORY_ORDER = [
+    # Speisen
+    ('inicio', 'Vorspeisen'),
+    ('salat', 'Salate'),
+    ('kleiner salat', 'Kleine Salate'),
+    ('tapa paella', 'Paella'),
+    ('tapas vegetarian', 'Vegetarisch'),
+    ('tapas de pollo', 'Hähnchen'),
+    ('tapas de carne', 'Fleisch'),
+    ('tapas de pescado', 'Fisch'),
+    ('kroketten', 'Kroketten'),
+    ('pasta', 'Pasta'),
+    ('pizza', 'Pizza'),
+    ('für den kleinen und großen hunger', 'Snacks'),
+    ('dessert', 'Dessert'),
+    ('heledos', 'Eis-Spezialitäten'),
+    # Getränke zuletzt
+    ('heißgetränke', 'Heißgetränke'),
+    ('softgetränke', 'Softdrinks'),
+    ('cocktails alkoholfrei', 'Cocktails alkoholfrei'),
+    ('cocktails mit alkohol', 'Cocktails'),
+    ('spanische getränke', 'Sangria & Spanische Getränke'),
+]
+_CATEGORY_RANK = {key: rank for rank, (key, _) in enumerate(CATEGORY_ORDER)}
+_CATEGORY_NAMES = dict(CATEGORY_ORDER)
+
+# Distinct diet/allergen filter combinations kept encoded per menu version
+MAX_FILTERED_PAYLOADS = 128
+
+
+def category_key(category):
+    return (category or '').strip().lower()
+
+
+def _encode_list(fragments, etag):
+    return EncodedPayload(b"[" + b",".join(fragments) + b"]", etag)
+
+
+class MenuSnapshot:
+    """The active menu serialized once: per-item JSON fragments, the full encoded body
+    and one encoded body per category, all sharing the menu version in their ETags"""
+
+    def __init__(self, items, digest):
+        self.items = items
+        self.digest = digest
+        self.item_bytes = [dumps(item) for item in items]
+        self.payload = _encode_list(self.item_bytes, make_etag("menu_items", digest))
+
+        positions = {}
+        labels = {}
+        for position, item in enumerate(items):
+            key = category_key(item["category"])
+            positions.setdefault(key, []).append(position)
+            labels.setdefault(key, item["category"])
+        first_seen = {key: i for i, key in enumerate(positions)}
+        ordered = sorted(first_seen, key=lambda key: (_CATEGORY_RANK.get(key, len(_CATEGORY_RANK)),
+                                                      first_seen[key]))
+        self.category_positions = {key: positions[key] for key in ordered}
+        self.categories = [{
+            "key": labels[key],
+            "name": _CATEGORY_NAMES.get(key, labels[key]),
+            "count": len(positions[key]),
+            "order": order,
+        } for order, key in enumerate(ordered)]
+        self._category_lookup = {}
+        for category in self.categories:
+            self._category_lookup[category_key(category["key"])] = category_key(category["key"])
+            self._category_lookup.setdefault(category_key(category["name"]), category_key(category["key"]))
+        self.categories_payload = EncodedPayload.from_content(self.categories,
+                                                              make_etag("menu_categories", digest))
+        self.category_payloads = {
+            key: _encode_list([self.item_bytes[i] for i in positions[key]],
+                              make_etag("menu_items", digest, key))
+            for key in ordered
+        }
+        self._empty_payload = _encode_list([], make_etag("menu_items", digest, None))
+        self.filters = MenuBitmapIndex(items, self.category_positions)
+        self._filtered_payloads = {}
+
+    def category_payload(self, category):
+        """Items of one category, looked up by its database value or display name"""
+        key = self._category_lookup.get(category_key(category))
+        return self.category_payloads[key] if key is not None else self._empty_payload
+
+    def filtered_payload(self, flags=(), exclude_allergens=(), category=None):
+        """Items matching all diet flags and none of the allergens, optionally within a category"""
+        if category is not None:
+            category = self._category_lookup.get(category_key(category))
+            if category is None:
+                return self._empty_payload
+        bits = self.filters.select(flags, exclude_allergens, category)
+        payload = self._filtered_payloads.get(bits)
+        if payload is None:
+            fragments = [self.item_bytes[i] for i in self.filters.positions(bits)]
+            payload = _encode_list(fragments, make_etag("menu_items", self.digest, "filter", bits))
+            if len(self._filtered_payloads) < MAX_FILTERED_PAYLOADS:
+                self._filtered_payloads[bits] = payload
+        return payload
+
+    @classmethod
+    def build(cls, rows, digest, model):
+        # Validate each row exactly once per menu version instead of once per request
+        return cls([model(**row).model_dump(mode="json") for row in rows], digest)
+
+
+class MenuSnapshotEngine:
+    """Keeps the current MenuSnapshot and rebuilds it only when the menu rows change
+
+    `load` is a coroutine returning (rows, digest), normally a QueryCache.fetch, so a
+    request while nothing changed costs one cache lookup and one digest comparison.
+    """
+
+    def __init__(self, load, model):
+        self._load = load
+        self._model = model
+        self._snapshot = None
+        self.builds = 0
+
+    async def get(self):
+        rows, digest = await self._load()
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.digest != digest:
+            snapshot = self._snapshot = MenuSnapshot.build(rows, digest, self._model)
+            self.builds += 1
+        return snapshot
+
+    def stats(self):
+        snapshot = self._snapshot
+        return {
+            "builds": self.builds,
+            "items": len(snapshot.items) if snapshot else 0,
+            "bytes": snapshot.payload.sizes() if snapshot else {},
+            "filters": snapshot.filters.stats() if snapshot else {},
+        }
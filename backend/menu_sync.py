@@ -0,0 +1,100 @@
+import uuid
+
+from bulk_sql import case_update, placeholders
+from menu_import import IMPORT_FIELDS, NOT_NULL_TEXT_FIELDS, menu_key
+
+
+def _same(current, desired):
+    if isinstance(desired, bool):
+        return current is not None and bool(current) == desired
+    if current is None or current == "":
+        return desired is None or desired == ""
+    return str(current) == str(desired)
+
+
+class MenuSyncPlan:
+    """The minimal set of changes that turns the current menu_items into the desired menu
+
+    Dishes match by id when the desired row has one, else by normalized category and
+    name. Matched dishes are updated only in the columns whose values differ, unmatched
+    desired rows are inserted, and active dishes missing from the desired menu are
+    deactivated rather than deleted, so their ids, reviews of them and links survive.
+    """
+
+    def __init__(self, current, desired):
+        self.inserts = []      # full rows with fresh ids
+        self.updates = {}      # id -> {column: new value}
+        self.deactivate = []   # ids
+        self.unchanged = 0
+        self.names = {row["id"]: row["name"] for row in current}
+        by_id = {row["id"]: row for row in current}
+        by_key = {menu_key(row["category"], row["name"]): row for row in current}
+        matched = set()
+        for values in desired:
+            # validate() already does this; plans built from other sources must not write NULL either
+            values = {**values, **{field: "" for field in NOT_NULL_TEXT_FIELDS if field in values and values[field] is None}}
+            row = by_id.get(values.get("id")) or by_key.get(menu_key(values["category"], values["name"]))
+            if row is None or row["id"] in matched:
+                insert = {"id": values.get("id") or str(uuid.uuid4()), "description": ""}
+                insert.update(values)
+                self.inserts.append(insert)
+                continue
+            matched.add(row["id"])
+            wanted = {"is_active": True, **values}
+            changes = {column: value for column, value in wanted.items()
+                       if column != "id" and not _same(row.get(column), value)}
+            if changes:
+                self.updates[row["id"]] = changes
+            else:
+                self.unchanged += 1
+        self.deactivate = [row["id"] for row in current if row["id"] not in matched and row.get("is_active")]
+
+    @property
+    def changes(self):
+        return len(self.inserts) + len(self.updates) + len(self.deactivate)
+
+    def summary(self):
+        return {
+            "inserted": len(self.inserts),
+            "updated": len(self.updates),
+            "deactivated": len(self.deactivate),
+            "unchanged": self.unchanged,
+            "inserts": [row["name"] for row in self.inserts],
+            "updates": [{"id": item_id, "name": self.names[item_id], "changes": changes}
+                        for item_id, changes in self.updates.items()],
+            "deactivations": [{"id": item_id, "name": self.names[item_id]} for item_id in self.deactivate],
+        }
+
+    def lines(self):
+        """Human-readable plan for the CLI dry run"""
+        for row in self.inserts:
+            yield f"+ {row['category']} / {row['name']}"
+        for item_id, changes in self.updates.items():
+            yield f"~ {self.names[item_id]}: " + ", ".join(f"{column}={value!r}" for column, value in changes.items())
+        for item_id in self.deactivate:
+            yield f"- {self.names[item_id]} (deactivated)"
+        yield (f"{len(self.inserts)} to insert, {len(self.updates)} to update, "
+               f"{len(self.deactivate)} to deactivate, {self.unchanged} unchanged")
+
+
+async def plan_sync(cursor, desired, lock=False):
+    """Plan against the current menu_items; with `lock`, the rows stay locked until the transaction ends"""
+    await cursor.execute(f"SELECT {', '.join(IMPORT_FIELDS)} FROM menu_items" + (" FOR UPDATE" if lock else ""))
+    return MenuSyncPlan(await cursor.fetchall(), desired)
+
+
+async def apply_sync(cursor, plan):
+    """Write `plan` with at most one statement per kind of change; the caller owns the transaction"""
+    groups = {}
+    for row in plan.inserts:
+        columns = tuple(field for field in IMPORT_FIELDS if field in row)
+        groups.setdefault(columns, []).append(tuple(row[column] for column in columns))
+    for columns, params in groups.items():
+        await cursor.executemany(
+            f"INSERT INTO menu_items ({', '.join(columns)}) VALUES ({placeholders(columns)})", params)
+    if plan.updates:
+        sql, params = case_update("menu_items", plan.updates)
+        await cursor.execute(sql, params)
+    if plan.deactivate:
+        await cursor.execute(f"UPDATE menu_items SET is_active = FALSE WHERE id IN ({placeholders(plan.deactivate)})",
+                             plan.deactivate)
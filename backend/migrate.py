@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Apply pending schema migrations (see migrations.py)
+
+Usage: python migrate.py            apply everything not yet in schema_version
+       python migrate.py --status   list migrations and when they were applied
+
+The server runs the same migrations at startup; running this first at deploy time
+just moves the work out of the first boot.
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+load_dotenv(Path(__file__).parent / '.env')
+
+from mysql_pool import MySQLPool  # noqa: E402
+from migrations import migrate, migration_status  # noqa: E402
+
+
+async def main(args):
+    pool = MySQLPool.from_env()
+    await pool.init()
+    try:
+        if "--status" in args:
+            for version, description, applied_at in await migration_status(pool):
+                print(f"{version:>4}  {applied_at or 'pending':<19}  {description}")
+        else:
+            applied = await migrate(pool)
+            print(f"✅ Applied migrations: {', '.join(map(str, applied))}" if applied else "✅ Schema is up to date")
+    finally:
+        await pool.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(sys.argv[1:]))
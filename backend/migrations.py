@@ -0,0 +1,212 @@
+from rollups import ROLLUP_TABLE_DDL
+
+SCHEMA_VERSION_DDL = """
+    CREATE TABLE IF NOT EXISTS schema_version (
+        version INT PRIMARY KEY,
+        description VARCHAR(255) NOT NULL,
+        applied_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+# Serializes runners across processes (server startup, migrate.py, backfill_rollups.py)
+MIGRATION_LOCK = "jimmys_tapas_bar_schema_migrations"
+
+MIGRATIONS = []   # (version, description, async function taking a cursor)
+
+
+def migration(version, description):
+    """Register the decorated coroutine as schema migration `version`"""
+    def register(func):
+        if any(existing == version for existing, _, _ in MIGRATIONS):
+            raise ValueError(f"Duplicate migration version {version}")
+        MIGRATIONS.append((version, description, func))
+        return func
+    return register
+
+
+async def _columns(cursor, table):
+    await cursor.execute("""
+        SELECT COLUMN_NAME FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+    """, (table,))
+    return {row["COLUMN_NAME"] for row in await cursor.fetchall()}
+
+
+async def _indexes(cursor, table):
+    await cursor.execute("""
+        SELECT DISTINCT INDEX_NAME FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+    """, (table,))
+    return {row["INDEX_NAME"] for row in await cursor.fetchall()}
+
+
+# MySQL DDL commits implicitly, so a migration that fails halfway is rerun from the start;
+# every step therefore checks first whether it is already done.
+
+@migration(1, "Base tables")
+async def create_base_tables(cursor):
+    await cursor.execute("""
+        CREATE TABLE IF NOT EXISTS menu_items (
+            id VARCHAR(36) PRIMARY KEY,
+            name VARCHAR(255) NOT NULL,
+            description TEXT,
+            detailed_description TEXT,
+            price VARCHAR(20) NOT NULL,
+            category VARCHAR(100) NOT NULL,
+            origin VARCHAR(255),
+            allergens TEXT,
+            additives TEXT,
+            preparation_method TEXT,
+            ingredients TEXT,
+            vegan BOOLEAN DEFAULT FALSE,
+            vegetarian BOOLEAN DEFAULT FALSE,
+            glutenfree BOOLEAN DEFAULT FALSE,
+            order_index INT DEFAULT 0,
+            is_active BOOLEAN DEFAULT TRUE
+        )
+    """)
+    await cursor.execute("""
+        CREATE TABLE IF NOT EXISTS reviews (
+            id VARCHAR(36) PRIMARY KEY,
+            customer_name VARCHAR(255) NOT NULL,
+            rating INT NOT NULL,
+            comment TEXT NOT NULL,
+            date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            is_approved BOOLEAN DEFAULT FALSE
+        )
+    """)
+    await cursor.execute("""
+        CREATE TABLE IF NOT EXISTS users (
+            id VARCHAR(36) PRIMARY KEY,
+            username VARCHAR(100) UNIQUE NOT NULL,
+            email VARCHAR(255) NOT NULL,
+            password_hash VARCHAR(255) NOT NULL,
+            role ENUM('admin', 'editor', 'viewer') DEFAULT 'viewer',
+            is_active BOOLEAN DEFAULT TRUE
+        )
+    """)
+    await cursor.execute("""
+        CREATE TABLE IF NOT EXISTS contact_messages (
+            id VARCHAR(36) PRIMARY KEY,
+            name VARCHAR(255) NOT NULL,
+            email VARCHAR(255) NOT NULL,
+            phone VARCHAR(50),
+            subject VARCHAR(255),
+            message TEXT NOT NULL,
+            date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            is_read BOOLEAN DEFAULT FALSE
+        )
+    """)
+    await cursor.execute("""
+        CREATE TABLE IF NOT EXISTS newsletter_subscribers (
+            id VARCHAR(36) PRIMARY KEY,
+            email VARCHAR(255) UNIQUE NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            is_active BOOLEAN DEFAULT TRUE
+        )
+    """)
+    await cursor.execute("""
+        CREATE TABLE IF NOT EXISTS content_sections (
+            id VARCHAR(36) PRIMARY KEY,
+            page VARCHAR(50) NOT NULL,
+            section VARCHAR(50) NOT NULL,
+            content JSON NOT NULL,
+            images JSON NULL,
+            version INT NOT NULL DEFAULT 1,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+            updated_by VARCHAR(50) NOT NULL,
+            UNIQUE KEY unique_page_section (page, section)
+        )
+    """)
+
+
+@migration(2, "content_sections.version for tables created from mysql_schema.sql")
+async def add_content_version(cursor):
+    if "version" not in await _columns(cursor, "content_sections"):
+        await cursor.execute("ALTER TABLE content_sections ADD COLUMN version INT NOT NULL DEFAULT 1 AFTER images")
+
+
+@migration(3, "Reconcile contact_messages and newsletter_subscribers with older shapes")
+async def reconcile_legacy_shapes(cursor):
+    # The old contact form handler created contact_messages with a status column instead of is_read
+    columns = await _columns(cursor, "contact_messages")
+    if "is_read" not in columns:
+        await cursor.execute("ALTER TABLE contact_messages ADD COLUMN is_read BOOLEAN DEFAULT FALSE")
+        if "status" in columns:
+            await cursor.execute("UPDATE contact_messages SET is_read = (status <> 'new')")
+    # mysql_schema.sql named the newsletter columns subscribe_date / subscribed
+    columns = await _columns(cursor, "newsletter_subscribers")
+    if "created_at" not in columns:
+        await cursor.execute(
+            "ALTER TABLE newsletter_subscribers ADD COLUMN created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP")
+        if "subscribe_date" in columns:
+            await cursor.execute("UPDATE newsletter_subscribers SET created_at = subscribe_date")
+    if "is_active" not in columns:
+        await cursor.execute("ALTER TABLE newsletter_subscribers ADD COLUMN is_active BOOLEAN DEFAULT TRUE")
+        if "subscribed" in columns:
+            await cursor.execute("UPDATE newsletter_subscribers SET is_active = subscribed")
+
+
+@migration(4, "Contact inbox indexes")
+async def add_contact_indexes(cursor):
+    indexes = await _indexes(cursor, "contact_messages")
+    if "idx_contact_read" not in indexes:
+        await cursor.execute("CREATE INDEX idx_contact_read ON contact_messages(is_read, date DESC)")
+    if "idx_contact_date" not in indexes:
+        await cursor.execute("CREATE INDEX idx_contact_date ON contact_messages(date DESC)")
+
+
+@migration(5, "Activity rollups")
+async def create_activity_rollups(cursor):
+    await cursor.execute(ROLLUP_TABLE_DDL)
+
+
+@migration(6, "Review keyset pagination indexes")
+async def add_review_indexes(cursor):
+    # Match ORDER BY date DESC, id DESC with and without the is_approved filter
+    indexes = await _indexes(cursor, "reviews")
+    if "idx_reviews_approved" not in indexes:
+        await cursor.execute("CREATE INDEX idx_reviews_approved ON reviews(is_approved, date, id)")
+    if "idx_reviews_date" not in indexes:
+        await cursor.execute("CREATE INDEX idx_reviews_date ON reviews(date, id)")
+
+
+async def applied_versions(cursor):
+    await cursor.execute(SCHEMA_VERSION_DDL)
+    await cursor.execute("SELECT version, applied_at FROM schema_version")
+    return {row["version"]: row["applied_at"] for row in await cursor.fetchall()}
+
+
+async def migrate(pool):
+    """Apply the pending migrations in version order; returns the versions applied
+
+    Each migration is recorded in schema_version right after it ran, so startup after
+    the first deploy costs one lock round trip and one SELECT.
+    """
+    async with pool.acquire() as conn:
+        cursor = await conn.cursor()
+        await cursor.execute("SELECT GET_LOCK(%s, 60) AS locked", (MIGRATION_LOCK,))
+        if not (await cursor.fetchone())["locked"]:
+            raise RuntimeError("Timed out waiting for another schema migration run")
+        try:
+            done = await applied_versions(cursor)
+            applied = []
+            for version, description, func in sorted(MIGRATIONS, key=lambda m: m[0]):
+                if version in done:
+                    continue
+                await func(cursor)
+                await cursor.execute("INSERT INTO schema_version (version, description) VALUES (%s, %s)",
+                                     (version, description))
+                print(f"🧱 Schema migration {version} applied: {description}")
+                applied.append(version)
+            return applied
+        finally:
+            await cursor.execute("SELECT RELEASE_LOCK(%s)", (MIGRATION_LOCK,))
+
+
+async def migration_status(pool):
+    """(version, description, applied_at or None) for every known migration"""
+    async with pool.acquire() as conn:
+        cursor = await conn.cursor()
+        done = await applied_versions(cursor)
+    return [(version, description, done.get(version))
+            for version, description, _ in sorted(MIGRATIONS, key=lambda m: m[0])]
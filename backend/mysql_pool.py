@@ -0,0 +1,156 @@
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+
+import aiomysql
+import pymysql
+
+
+class MySQLPool:
+    """Managed aiomysql pool with health checks, recycling and statistics"""
+
+    def __init__(self, minsize=2, maxsize=20, pool_recycle=3600, health_check_interval=30,
+                 unix_socket='/run/mysqld/mysqld.sock', **connect_kwargs):
+        self.minsize = minsize
+        self.maxsize = maxsize
+        self.pool_recycle = pool_recycle
+        self.health_check_interval = health_check_interval
+        self.unix_socket = unix_socket
+        self.connect_kwargs = connect_kwargs
+        self.transport = None
+        self._pool = None
+        self._init_lock = asyncio.Lock()
+        self._stats = {
+            "acquired": 0,
+            "waited": 0,
+            "wait_time_ms": 0.0,
+            "health_checks": 0,
+            "health_check_failures": 0,
+        }
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            minsize=int(os.environ.get('MYSQL_POOL_MIN_SIZE', 2)),
+            maxsize=int(os.environ.get('MYSQL_POOL_MAX_SIZE', 20)),
+            pool_recycle=int(os.environ.get('MYSQL_POOL_RECYCLE', 3600)),
+            health_check_interval=int(os.environ.get('MYSQL_POOL_HEALTH_CHECK_INTERVAL', 30)),
+            unix_socket=os.environ.get('MYSQL_UNIX_SOCKET', '/run/mysqld/mysqld.sock'),
+            host=os.environ.get('MYSQL_HOST', 'localhost'),
+            port=int(os.environ.get('MYSQL_PORT', 3306)),
+            user=os.environ.get('MYSQL_USER', 'root'),
+            password=os.environ.get('MYSQL_PASSWORD', ''),
+            db=os.environ.get('MYSQL_DATABASE', 'jimmys_tapas_bar'),
+        )
+
+    async def _create_pool(self, unix_socket=None):
+        params = dict(self.connect_kwargs)
+        if unix_socket:
+            params.pop('host', None)
+            params.pop('port', None)
+            params['unix_socket'] = unix_socket
+        return await aiomysql.create_pool(
+            minsize=self.minsize,
+            maxsize=self.maxsize,
+            pool_recycle=self.pool_recycle,
+            charset='utf8mb4',
+            cursorclass=aiomysql.DictCursor,
+            autocommit=True,
+            **params
+        )
+
+    async def init(self):
+        async with self._init_lock:
+            if self._pool is not None:
+                return
+            try:
+                # Try socket connection first (Linux default)
+                self._pool = await self._create_pool(unix_socket=self.unix_socket)
+                self.transport = "socket"
+            except (OSError, pymysql.err.OperationalError):
+                # Fallback to TCP connection
+                self._pool = await self._create_pool()
+                self.transport = "tcp"
+
+    async def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            await self._pool.wait_closed()
+            self._pool = None
+
+    async def _is_healthy(self, conn):
+        if conn.closed:
+            return False
+        if time.time() - conn.last_usage < self.health_check_interval:
+            return True
+        self._stats["health_checks"] += 1
+        try:
+            await conn.ping(reconnect=False)
+            return True
+        except Exception:
+            self._stats["health_check_failures"] += 1
+            return False
+
+    async def _acquire(self):
+        if self._pool is None:
+            await self.init()
+        waiting = self._pool.freesize == 0 and self._pool.size >= self.maxsize
+        started = time.perf_counter()
+        # Bounded retry: a pool can hand out several stale connections after a server restart
+        for _ in range(self.maxsize + 1):
+            conn = await self._pool.acquire()
+            if await self._is_healthy(conn):
+                break
+            conn.close()
+            self._pool.release(conn)
+        else:
+            raise pymysql.err.OperationalError(2006, "No healthy MySQL connection available")
+        self._stats["acquired"] += 1
+        if waiting:
+            self._stats["waited"] += 1
+            self._stats["wait_time_ms"] += (time.perf_counter() - started) * 1000
+        return conn
+
+    @asynccontextmanager
+    async def acquire(self):
+        conn = await self._acquire()
+        try:
+            yield conn
+        finally:
+            self._pool.release(conn)
+
+    @asynccontextmanager
+    async def transaction(self, conn=None):
+        """Run the block in one transaction, on `conn` or a freshly acquired connection"""
+        if conn is None:
+            async with self.acquire() as conn:
+                async with self.transaction(conn) as conn:
+                    yield conn
+            return
+        await conn.begin()
+        try:
+            yield conn
+        except BaseException:
+            await conn.rollback()
+            raise
+        else:
+            await conn.commit()
+
+    def stats(self):
+        stats = dict(self._stats)
+        stats["wait_time_ms"] = round(stats["wait_time_ms"], 2)
+        stats.update({
+            "transport": self.transport,
+            "minsize": self.minsize,
+            "maxsize": self.maxsize,
+            "pool_recycle": self.pool_recycle,
+            "health_check_interval": self.health_check_interval,
+        })
+        if self._pool is not None:
+            stats.update({
+                "size": self._pool.size,
+                "free": self._pool.freesize,
+                "in_use": self._pool.size - self._pool.freesize,
+            })
+        return stats
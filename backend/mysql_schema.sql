@@ -1,5 +1,7 @@
 -- Jimmy's Tapas Bar CMS - MySQL Schema
 -- Generated for migration from MongoDB to MySQL
+-- Reference only: the backend creates and upgrades the schema itself through
+-- backend/migrations.py (recorded in schema_version); keep both in step.
 
 -- Users table
 CREATE TABLE users (
@@ -70,6 +72,7 @@ CREATE TABLE content_sections (
     section VARCHAR(50) NOT NULL,
     content JSON NOT NULL,
     images JSON NULL,
+    version INT NOT NULL DEFAULT 1,
     updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     updated_by VARCHAR(50) NOT NULL,
     UNIQUE KEY unique_page_section (page, section)
@@ -151,8 +154,8 @@ CREATE TABLE newsletter_subscribers (
     id VARCHAR(36) PRIMARY KEY,
     email VARCHAR(100) NOT NULL UNIQUE,
     name VARCHAR(100) NULL,
-    subscribed BOOLEAN DEFAULT TRUE,
-    subscribe_date DATETIME DEFAULT CURRENT_TIMESTAMP,
+    is_active BOOLEAN DEFAULT TRUE,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
     unsubscribe_date DATETIME NULL,
     ip_address VARCHAR(45) NULL,
     user_agent TEXT NULL
@@ -224,12 +227,22 @@ CREATE TABLE system_backups (
     INDEX idx_type (type)
 );
 
+-- Activity rollups for the dashboard trend charts (one row per metric, period and bucket)
+CREATE TABLE activity_rollups (
+    metric VARCHAR(32) NOT NULL,
+    period ENUM('day', 'week') NOT NULL,
+    bucket DATE NOT NULL,
+    count INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (metric, period, bucket)
+);
+
 -- Create indexes for better performance
 CREATE INDEX idx_users_username ON users(username);
-CREATE INDEX idx_reviews_approved ON reviews(is_approved, date DESC);
-CREATE INDEX idx_reviews_date ON reviews(date DESC);
+CREATE INDEX idx_reviews_approved ON reviews(is_approved, date, id);
+CREATE INDEX idx_reviews_date ON reviews(date, id);
 CREATE INDEX idx_menu_items_category ON menu_items(category, order_index);
 CREATE INDEX idx_menu_items_active ON menu_items(is_active);
 CREATE INDEX idx_contact_read ON contact_messages(is_read, date DESC);
-CREATE INDEX idx_newsletter_subscribed ON newsletter_subscribers(subscribed);
+CREATE INDEX idx_contact_date ON contact_messages(date DESC);
+CREATE INDEX idx_newsletter_active ON newsletter_subscribers(is_active);
 CREATE INDEX idx_content_page_section ON content_sections(page, section);
\ No newline at end of file
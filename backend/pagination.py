@@ -0,0 +1,41 @@
+import base64
+import json
+from datetime import datetime
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(*values):
+    """Opaque token for the sort key of the last row on a page"""
+    raw = json.dumps([v.isoformat() if isinstance(v, datetime) else v for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token, *types):
+    """Sort key values of a cursor, converted with `types`; raises ValueError if the token is malformed"""
+    raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+    values = json.loads(raw)
+    if not isinstance(values, list) or len(values) != len(types):
+        raise ValueError("cursor does not match the sort key")
+    # A well-formed token can still hold any JSON; only strings and numbers are sort key values
+    if not all(isinstance(value, (str, int, float)) and not isinstance(value, bool) for value in values):
+        raise ValueError("cursor does not match the sort key")
+    try:
+        return [datetime.fromisoformat(value) if kind is datetime else kind(value) for value, kind in zip(values, types)]
+    except TypeError:
+        raise ValueError("cursor does not match the sort key")
+
+
+def keyset_page(rows, limit, key):
+    """Split rows fetched with LIMIT limit + 1 into the page and the cursor of the next one"""
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(*key(rows[-1]))
+
+
+def set_next_cursor(request, response, cursor):
+    """Advertise the next page as X-Next-Cursor and as an RFC 8288 Link header"""
+    if cursor:
+        response.headers[NEXT_CURSOR_HEADER] = cursor
+        response.headers["Link"] = '<%s>; rel="next"' % request.url.include_query_params(cursor=cursor)
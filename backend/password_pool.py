@@ -0,0 +1,73 @@
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from passlib.context import CryptContext
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+def _hash(password):
+    return pwd_context.hash(password)
+
+
+def _verify(password, hashed_password):
+    return pwd_context.verify(password, hashed_password)
+
+
+class PasswordPoolBusy(Exception):
+    """More password operations are queued than the pool accepts"""
+
+
+class PasswordHasher:
+    """bcrypt hashing and verification in worker processes, off the event loop
+
+    At most `max_queue` operations may be running or waiting; beyond that callers get
+    PasswordPoolBusy straight away instead of piling up behind a login storm.
+    """
+
+    def __init__(self, workers=None, max_queue=32):
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.max_queue = max_queue
+        self.in_flight = 0
+        self.rejected = 0
+        self.completed = 0
+        self._executor = None
+
+    @classmethod
+    def from_env(cls):
+        workers = int(os.environ.get('PASSWORD_POOL_WORKERS', 0))
+        return cls(workers=workers or None, max_queue=int(os.environ.get('PASSWORD_POOL_MAX_QUEUE', 32)))
+
+    async def _run(self, func, *args):
+        if self.in_flight >= self.max_queue:
+            self.rejected += 1
+            raise PasswordPoolBusy()
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        self.in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+
+    async def hash(self, password):
+        return await self._run(_hash, password)
+
+    async def verify(self, password, hashed_password):
+        return await self._run(_verify, password, hashed_password)
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self):
+        return {
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
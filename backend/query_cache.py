@@ -0,0 +1,142 @@
+import hashlib
+import time
+from collections import OrderedDict
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Bounded LRU mapping whose entries expire `ttl` seconds after they were stored"""
+
+    def __init__(self, maxsize=256, ttl=300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def get(self, key, default=None):
+        entry = self._entries.get(key, _MISSING)
+        if entry is _MISSING or entry[0] < time.monotonic():
+            if entry is not _MISSING:
+                self._remove(key)
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key, value):
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        while len(self._entries) > self.maxsize:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def pop(self, key):
+        if key in self._entries:
+            self._remove(key)
+
+    def pop_where(self, predicate):
+        """Drop every entry whose value satisfies `predicate`"""
+        for key in [key for key, (_, value) in self._entries.items() if predicate(value)]:
+            self._remove(key)
+
+    def _remove(self, key):
+        del self._entries[key]
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+
+class QueryCache(TTLCache):
+    """Result cache keyed by (sql, params) and tagged with the tables a query reads"""
+
+    def __init__(self, maxsize=256, ttl=300):
+        super().__init__(maxsize, ttl)
+        self.invalidations = 0
+        self._tags = {}
+        self._keys_by_tag = {}
+        self.versions = {}
+
+    def set(self, key, value, tags=()):
+        super().set(key, value)
+        self._tags[key] = tuple(tags)
+        for tag in tags:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+
+    def _remove(self, key):
+        super()._remove(key)
+        for tag in self._tags.pop(key, ()):
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+
+    def clear(self):
+        super().clear()
+        self._tags.clear()
+        self._keys_by_tag.clear()
+
+    def invalidate(self, *tags):
+        """Drop every entry tagged with one of `tags` and bump their data versions"""
+        for tag in tags:
+            self.versions[tag] = self.versions.get(tag, 0) + 1
+            for key in list(self._keys_by_tag.pop(tag, ())):
+                if key in self._entries:
+                    self._remove(key)
+            self.invalidations += 1
+
+    async def fetch(self, db, sql, params=None, tags=()):
+        """Cached SELECT returning (rows, digest); `db` is a connection, or a pool to acquire one from on a miss
+
+        The digest is a content hash taken when the rows are stored, so it changes exactly
+        when the data does, including writes made outside this process once the TTL expires.
+        """
+        key = (sql, tuple(params) if params else ())
+        entry = self.get(key, _MISSING)
+        if entry is not _MISSING:
+            return entry
+        versions = [self.versions.get(tag, 0) for tag in tags]
+        if hasattr(db, "acquire"):
+            async with db.acquire() as conn:
+                rows = await self._query(conn, sql, params)
+        else:
+            rows = await self._query(db, sql, params)
+        entry = (rows, hashlib.sha1(repr(rows).encode()).hexdigest()[:20])
+        # A write that landed while the query ran makes this result stale, so don't keep it
+        if versions == [self.versions.get(tag, 0) for tag in tags]:
+            self.set(key, entry, tags)
+        return entry
+
+    async def fetchall(self, db, sql, params=None, tags=()):
+        rows, _ = await self.fetch(db, sql, params, tags)
+        return rows
+
+    @staticmethod
+    async def _query(conn, sql, params):
+        cursor = await conn.cursor()
+        await cursor.execute(sql, params)
+        return await cursor.fetchall()
+
+    def stats(self):
+        stats = super().stats()
+        stats["invalidations"] = self.invalidations
+        stats["tags"] = {tag: len(keys) for tag, keys in self._keys_by_tag.items() if keys}
+        return stats
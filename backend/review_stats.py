@@ -0,0 +1,56 @@
+RATINGS = (1, 2, 3, 4, 5)
+
+
+class ReviewStats:
+    """Review counts per (rating, approved), loaded once and then kept current by the write paths
+
+    Every handler that inserts, approves or deletes reviews reports the change here after
+    its commit, so reading the statistics never touches the reviews table.
+    """
+
+    def __init__(self):
+        self.counts = {}
+        self.loaded = False
+
+    async def load(self, db):
+        async with db.acquire() as conn:
+            cursor = await conn.cursor()
+            await cursor.execute(
+                "SELECT rating, is_approved, COUNT(*) AS count FROM reviews GROUP BY rating, is_approved")
+            rows = await cursor.fetchall()
+        self.counts = {}
+        for row in rows:
+            self.add(row["rating"], row["is_approved"], row["count"])
+        self.loaded = True
+
+    def add(self, rating, approved, count=1):
+        key = (int(rating), bool(approved))
+        self.counts[key] = self.counts.get(key, 0) + count
+        if self.counts[key] <= 0:
+            del self.counts[key]
+
+    def remove(self, rating, approved, count=1):
+        self.add(rating, approved, -count)
+
+    def approve(self, rating, count=1):
+        self.remove(rating, False, count)
+        self.add(rating, True, count)
+
+    def reject(self, rating, count=1):
+        self.remove(rating, True, count)
+        self.add(rating, False, count)
+
+    def summary(self, approved_only=True):
+        counts = {}
+        for (rating, approved), count in self.counts.items():
+            if approved or not approved_only:
+                counts[rating] = counts.get(rating, 0) + count
+        total = sum(counts.values())
+        approved = sum(count for (_, is_approved), count in self.counts.items() if is_approved)
+        return {
+            "count": total,
+            "average": round(sum(rating * count for rating, count in counts.items()) / total, 2) if total else None,
+            "histogram": {str(rating): counts.get(rating, 0) for rating in RATINGS},
+            "approved": approved,
+            "pending": sum(self.counts.values()) - approved,
+        }
@@ -0,0 +1,107 @@
+from datetime import date, datetime, timedelta
+
+# metric -> (table, timestamp column candidates) used by the backfill
+METRICS = {
+    "reviews": ("reviews", ("date",)),
+    "contact_messages": ("contact_messages", ("date",)),
+    "newsletter_signups": ("newsletter_subscribers", ("created_at", "subscribe_date")),
+    # The menu_items schema of migration 1 has neither column, so on backend-created databases
+    # this metric has no history to rebuild and only counts from the first write onwards
+    "menu_changes": ("menu_items", ("updated_at", "created_at")),
+}
+PERIODS = ("day", "week")
+MAX_BUCKETS = {"day": 731, "week": 260}
+
+ROLLUP_TABLE_DDL = """
+    CREATE TABLE IF NOT EXISTS activity_rollups (
+        metric VARCHAR(32) NOT NULL,
+        period ENUM('day', 'week') NOT NULL,
+        bucket DATE NOT NULL,
+        count INT NOT NULL DEFAULT 0,
+        PRIMARY KEY (metric, period, bucket)
+    )
+"""
+
+
+def bucket_start(day, period):
+    """First day of the bucket containing `day`; weeks start on Monday"""
+    return day - timedelta(days=day.weekday()) if period == "week" else day
+
+
+def buckets(start, end, period):
+    current = bucket_start(start, period)
+    step = timedelta(days=7 if period == "week" else 1)
+    while current <= end:
+        yield current
+        current += step
+
+
+async def record_activity(cursor, metric, when=None, count=1):
+    """Count `count` events of `metric` into their day and week buckets, on the caller's connection"""
+    day = (when or datetime.utcnow()).date()
+    await cursor.execute("""
+        INSERT INTO activity_rollups (metric, period, bucket, count)
+        VALUES (%s, 'day', %s, %s), (%s, 'week', %s, %s)
+        ON DUPLICATE KEY UPDATE count = count + VALUES(count)
+    """, (metric, day, count, metric, bucket_start(day, "week"), count))
+
+
+async def activity_series(cursor, metrics, period, start, end):
+    """Zero-filled counts per bucket for each metric between `start` and `end` (inclusive)"""
+    labels = list(buckets(start, end, period))
+    if len(labels) > MAX_BUCKETS[period]:
+        raise ValueError(f"At most {MAX_BUCKETS[period]} {period} buckets per request")
+    placeholders = ", ".join(["%s"] * len(metrics))
+    await cursor.execute(f"""
+        SELECT metric, bucket, count FROM activity_rollups
+        WHERE period = %s AND metric IN ({placeholders}) AND bucket BETWEEN %s AND %s
+    """, (period, *metrics, labels[0], end))
+    counts = {(row["metric"], row["bucket"]): row["count"] for row in await cursor.fetchall()}
+    return {
+        "period": period,
+        "buckets": [label.isoformat() for label in labels],
+        "series": {metric: [counts.get((metric, label), 0) for label in labels] for metric in metrics},
+    }
+
+
+async def backfill(cursor, metrics=None):
+    """Rebuild the rollups of `metrics` (default: all) from the raw tables; returns rows written per metric
+
+    A metric whose table has none of its timestamp columns maps to None and keeps the
+    rollups recorded so far.
+    """
+    written = {}
+    for metric in metrics or METRICS:
+        table, candidates = METRICS[metric]
+        await cursor.execute("""
+            SELECT COLUMN_NAME FROM information_schema.COLUMNS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+        """, (table,))
+        columns = {row["COLUMN_NAME"] for row in await cursor.fetchall()}
+        column = next((c for c in candidates if c in columns), None)
+        if column is None:
+            written[metric] = None
+            continue
+        await cursor.execute("DELETE FROM activity_rollups WHERE metric = %s", (metric,))
+        await cursor.execute(f"""
+            INSERT INTO activity_rollups (metric, period, bucket, count)
+            SELECT %s, 'day', DATE({column}), COUNT(*) FROM {table}
+            WHERE {column} IS NOT NULL GROUP BY DATE({column})
+        """, (metric,))
+        days = cursor.rowcount
+        await cursor.execute(f"""
+            INSERT INTO activity_rollups (metric, period, bucket, count)
+            SELECT %s, 'week', DATE_SUB(DATE({column}), INTERVAL WEEKDAY({column}) DAY), COUNT(*) FROM {table}
+            WHERE {column} IS NOT NULL GROUP BY DATE_SUB(DATE({column}), INTERVAL WEEKDAY({column}) DAY)
+        """, (metric,))
+        written[metric] = days + cursor.rowcount
+    return written
+
+
+def parse_range(start, end, default_days=30):
+    """Date range from ISO strings; defaults to the last `default_days` days"""
+    end_day = date.fromisoformat(end) if end else datetime.utcnow().date()
+    start_day = date.fromisoformat(start) if start else end_day - timedelta(days=default_days - 1)
+    if start_day > end_day:
+        raise ValueError("start must not be after end")
+    return start_day, end_day
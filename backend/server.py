@@ -1,44 +1,51 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Request, Response
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
-import pymysql
 import os
 from pathlib import Path
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 from typing import List, Optional
 import uuid
 from datetime import datetime, timedelta
 import jwt
-from passlib.context import CryptContext
 import json
+from mysql_pool import MySQLPool
+from query_cache import QueryCache, TTLCache
+from http_cache import make_etag, etag_matches, not_modified, set_etag, payload_response, EncodedPayload, BundleCache
+from menu_snapshot import MenuSnapshotEngine
+from menu_search import MenuSearchIndex
+from menu_filters import parse_allergen_list
+from review_stats import ReviewStats
+from password_pool import PasswordHasher, PasswordPoolBusy
+from login_throttle import LoginThrottle
+from cms_store import CMSStore
+from rollups import (METRICS as ROLLUP_METRICS, PERIODS as ROLLUP_PERIODS,
+                     record_activity, activity_series, parse_range)
+from migrations import migrate
+from table_export import EXPORT_TABLES, EXPORT_FORMATS, stream_table
+from menu_import import MenuImportError, parse_document, validate as validate_menu_rows, upsert_rows
+from menu_sync import plan_sync, apply_sync
+from bulk_sql import case_update, placeholders
+from pagination import decode_cursor, keyset_page, set_next_cursor, NEXT_CURSOR_HEADER
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
-# SIMPLE MYSQL CONNECTION FOR WEBSPACE COMPATIBILITY
-def get_mysql_connection():
-    try:
-        # Try socket connection first (Linux default)
-        return pymysql.connect(
-            unix_socket='/run/mysqld/mysqld.sock',
-            user=os.environ.get('MYSQL_USER', 'root'),
-            password=os.environ.get('MYSQL_PASSWORD', ''),
-            database=os.environ.get('MYSQL_DATABASE', 'jimmys_tapas_bar'),
-            charset='utf8mb4',
-            cursorclass=pymysql.cursors.DictCursor
-        )
-    except:
-        # Fallback to TCP connection
-        return pymysql.connect(
-            host=os.environ.get('MYSQL_HOST', 'localhost'),
-            port=int(os.environ.get('MYSQL_PORT', 3306)),
-            user=os.environ.get('MYSQL_USER', 'root'),
-            password=os.environ.get('MYSQL_PASSWORD', ''),
-            database=os.environ.get('MYSQL_DATABASE', 'jimmys_tapas_bar'),
-            charset='utf8mb4',
-            cursorclass=pymysql.cursors.DictCursor
-        )
+# MYSQL CONNECTION POOL (socket first, TCP fallback)
+mysql_pool = MySQLPool.from_env()
+
+# In-process result cache for read-mostly tables; writes invalidate by table tag
+query_cache = QueryCache(
+    maxsize=int(os.environ.get('QUERY_CACHE_MAX_ENTRIES', 256)),
+    ttl=int(os.environ.get('QUERY_CACHE_TTL', 300))
+)
+
+async def get_db():
+    """Request-scoped connection: get_current_user and the handler share one acquire"""
+    async with mysql_pool.acquire() as conn:
+        yield conn
 
 app = FastAPI()
 api_router = APIRouter(prefix="/api")
@@ -62,6 +69,23 @@ class MenuItem(BaseModel):
     order_index: int = 0
     is_active: bool = True
 
+class MenuBulkIds(BaseModel):
+    ids: List[str]
+
+class MenuBulkActivate(MenuBulkIds):
+    is_active: bool
+
+class MenuOrderEntry(BaseModel):
+    id: str
+    order_index: int
+
+class MenuBulkReorder(BaseModel):
+    items: List[MenuOrderEntry]
+
+class MenuBulkUpdate(BaseModel):
+    # Each entry is {"id": ..., <column>: <value>, ...}; unnamed columns stay as they are
+    items: List[dict]
+
 class Review(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     customer_name: str
@@ -70,6 +94,9 @@ class Review(BaseModel):
     date: datetime = Field(default_factory=datetime.utcnow)
     is_approved: bool = False
 
+class ReviewBulkIds(BaseModel):
+    ids: List[str]
+
 class ReviewCreate(BaseModel):
     customer_name: str
     rating: int
@@ -91,78 +118,162 @@ class Token(BaseModel):
     token_type: str
 
 # Auth setup
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+password_hasher = PasswordHasher.from_env()
+login_throttle = LoginThrottle.from_env()
 security = HTTPBearer(auto_error=True)
 SECRET_KEY = os.environ.get("JWT_SECRET_KEY", "jimmy-secret-2024")
 ALGORITHM = "HS256"
 
-def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
+async def verify_password(plain_password, hashed_password):
+    try:
+        return await password_hasher.verify(plain_password, hashed_password)
+    except PasswordPoolBusy:
+        raise HTTPException(status_code=503, detail="Too many login attempts in progress, please retry",
+                            headers={"Retry-After": "1"})
+
+async def get_password_hash(password):
+    try:
+        return await password_hasher.hash(password)
+    except PasswordPoolBusy:
+        raise HTTPException(status_code=503, detail="Server busy, please retry", headers={"Retry-After": "1"})
+
+# Resolved users by (username, token iat); update_user/delete_user clear it so revocation is immediate
+auth_cache = TTLCache(
+    maxsize=int(os.environ.get('AUTH_CACHE_MAX_ENTRIES', 512)),
+    ttl=int(os.environ.get('AUTH_CACHE_TTL', 60))
+)
 
 def create_access_token(data: dict):
     to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(minutes=60)
-    to_encode.update({"exp": expire})
+    now = datetime.utcnow()
+    to_encode.update({"iat": now, "exp": now + timedelta(minutes=60)})
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
+# Active menu, serialized once per change of menu_items
+MENU_ITEMS_QUERY = "SELECT * FROM menu_items WHERE is_active = TRUE ORDER BY order_index, category, name"
+
+async def load_menu_rows():
+    return await query_cache.fetch(mysql_pool, MENU_ITEMS_QUERY, tags=("menu_items",))
+
+menu_snapshots = MenuSnapshotEngine(load_menu_rows, MenuItem)
+menu_search = MenuSearchIndex()
+review_stats = ReviewStats()
+
 # Routes
 @api_router.get("/menu/items", response_model=List[MenuItem])
-async def get_menu_items():
-    conn = get_mysql_connection()
-    try:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM menu_items WHERE is_active = TRUE ORDER BY order_index, category, name")
-        items = cursor.fetchall()
-        return [MenuItem(**item) for item in items]
-    finally:
-        conn.close()
+async def get_menu_items(request: Request, category: Optional[str] = None,
+                         vegan: bool = False, vegetarian: bool = False, glutenfree: bool = False,
+                         exclude_allergens: Optional[str] = None):
+    """Active menu items; diet flags and exclude_allergens (e.g. "Sesam,Krebstiere") combine with AND"""
+    snapshot = await menu_snapshots.get()
+    flags = [flag for flag, wanted in (("vegan", vegan), ("vegetarian", vegetarian), ("glutenfree", glutenfree)) if wanted]
+    excluded = parse_allergen_list(exclude_allergens)
+    if flags or excluded:
+        return payload_response(request, snapshot.filtered_payload(flags, excluded, category or None))
+    if category:
+        return payload_response(request, snapshot.category_payload(category))
+    return payload_response(request, snapshot.payload)
+
+@api_router.get("/menu/search", response_model=List[MenuItem])
+async def search_menu(q: str, limit: int = 20):
+    """Search dishes by name, description, ingredients, allergens and diet (typo tolerant)"""
+    snapshot = await menu_snapshots.get()
+    menu_search.sync(snapshot)
+    item_ids = menu_search.search(q, max(1, min(limit, 100)))
+    return Response(content=menu_search.serialized(item_ids), media_type="application/json")
+
+@api_router.get("/menu/categories")
+async def get_menu_categories(request: Request):
+    """Get menu categories in display order with display names and item counts"""
+    snapshot = await menu_snapshots.get()
+    return payload_response(request, snapshot.categories_payload)
+
+# Upper bound for one page of reviews; also what a request without `limit` gets
+REVIEWS_MAX_PAGE_SIZE = 1000
 
 @api_router.get("/reviews", response_model=List[Review])
-async def get_reviews(approved_only: bool = True):
-    conn = get_mysql_connection()
-    try:
-        cursor = conn.cursor()
-        if approved_only:
-            cursor.execute("SELECT * FROM reviews WHERE is_approved = TRUE ORDER BY date DESC LIMIT 1000")
-        else:
-            cursor.execute("SELECT * FROM reviews ORDER BY date DESC LIMIT 1000")
-        reviews = cursor.fetchall()
-        return [Review(**review) for review in reviews]
-    finally:
-        conn.close()
+async def get_reviews(request: Request, response: Response, approved_only: bool = True,
+                      limit: Optional[int] = None, cursor: Optional[str] = None):
+    """Newest reviews first; with `limit`, one keyset page and the next page's cursor in X-Next-Cursor"""
+    where, params = [], []
+    if approved_only:
+        where.append("is_approved = TRUE")
+    if cursor:
+        try:
+            cursor_date, cursor_id = decode_cursor(cursor, datetime, str)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        # Seeks straight to the position via idx_reviews_approved / idx_reviews_date
+        # (migration 6), so page 100 costs the same as page 1
+        where.append("(date < %s OR (date = %s AND id < %s))")
+        params += [cursor_date, cursor_date, cursor_id]
+    page_size = max(1, min(limit, REVIEWS_MAX_PAGE_SIZE)) if limit else REVIEWS_MAX_PAGE_SIZE
+    sql = "SELECT * FROM reviews"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " ORDER BY date DESC, id DESC LIMIT %s"
+    params.append(page_size + 1)
+    rows, digest = await query_cache.fetch(mysql_pool, sql, params, tags=("reviews",))
+    reviews, next_cursor = keyset_page(rows, page_size, lambda row: (row["date"], row["id"]))
+    etag = make_etag("reviews", digest, next_cursor)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    set_next_cursor(request, response, next_cursor)
+    return [Review(**review) for review in reviews]
 
 @api_router.post("/reviews", response_model=Review)
 async def create_review(review_data: ReviewCreate):
     review = Review(**review_data.dict())
-    conn = get_mysql_connection()
-    try:
-        cursor = conn.cursor()
-        cursor.execute("""
+    async with mysql_pool.transaction() as conn:
+        cursor = await conn.cursor()
+        await cursor.execute("""
             INSERT INTO reviews (id, customer_name, rating, comment, date, is_approved)
             VALUES (%s, %s, %s, %s, %s, %s)
         """, (review.id, review.customer_name, review.rating, review.comment, review.date, review.is_approved))
-        conn.commit()
-        return review
-    finally:
-        conn.close()
+        await record_activity(cursor, "reviews", review.date)
+    query_cache.invalidate("reviews")
+    review_stats.add(review.rating, review.is_approved)
+    return review
+
+@api_router.get("/reviews/stats")
+async def get_review_stats(request: Request, approved_only: bool = True):
+    """Average rating, count and 1-5 star histogram, plus the approved/pending split"""
+    return payload_response(request, EncodedPayload.from_content(review_stats.summary(approved_only)))
+
+# Peers allowed to set X-Real-IP: the nginx in front of uvicorn, on loopback unless configured
+TRUSTED_PROXIES = {host.strip() for host in os.environ.get('TRUSTED_PROXIES', '127.0.0.1,::1').split(',') if host.strip()}
+
+def client_ip(request: Request):
+    """Client address as forwarded by a trusted proxy (X-Real-IP), else the socket peer
+
+    Direct callers of the published backend port cannot pick their own address per request.
+    """
+    peer = request.client.host if request.client else "unknown"
+    if peer in TRUSTED_PROXIES:
+        return request.headers.get("x-real-ip") or peer
+    return peer
 
 @api_router.post("/auth/login", response_model=Token)
-async def login(user_credentials: UserLogin):
-    conn = get_mysql_connection()
-    try:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM users WHERE username = %s", (user_credentials.username,))
-        user = cursor.fetchone()
-        
-        if not user or not verify_password(user_credentials.password, user['password_hash']):
-            raise HTTPException(status_code=401, detail="Invalid credentials")
-        
-        access_token = create_access_token(data={"sub": user['username']})
-        return {"access_token": access_token, "token_type": "bearer"}
-    finally:
-        conn.close()
+async def login(user_credentials: UserLogin, request: Request):
+    # Turned away before any DB lookup or bcrypt work
+    retry_after = login_throttle.acquire(user_credentials.username, client_ip(request))
+    if retry_after:
+        raise HTTPException(status_code=429, detail="Too many login attempts, please try again later",
+                            headers={"Retry-After": str(retry_after)})
+    async with mysql_pool.acquire() as conn:
+        cursor = await conn.cursor()
+        await cursor.execute("SELECT * FROM users WHERE username = %s", (user_credentials.username,))
+        user = await cursor.fetchone()
+    
+    if not user or not await verify_password(user_credentials.password, user['password_hash']):
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+    
+    login_throttle.succeeded(user_credentials.username)
+    access_token = create_access_token(data={"sub": user['username']})
+    return {"access_token": access_token, "token_type": "bearer"}
 
-async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
+async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security), conn=Depends(get_db)):
     try:
         token = credentials.credentials
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
@@ -172,16 +283,108 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     except jwt.PyJWTError:
         raise HTTPException(status_code=401, detail="Invalid token")
     
-    conn = get_mysql_connection()
-    try:
-        cursor = conn.cursor()
-        cursor.execute("SELECT id, username, email, role, is_active FROM users WHERE username = %s", (username,))
-        user = cursor.fetchone()
-        if user is None:
+    key = (username, payload.get("iat"))
+    user = auth_cache.get(key)
+    if user is None:
+        version = query_cache.versions.get("users", 0)
+        cursor = await conn.cursor()
+        await cursor.execute("SELECT id, username, email, role, is_active FROM users WHERE username = %s", (username,))
+        row = await cursor.fetchone()
+        if row is None:
             raise HTTPException(status_code=401, detail="User not found")
-        return User(**user)
-    finally:
-        conn.close()
+        user = User(**row)
+        # As in QueryCache.fetch: an update_user/delete_user that landed meanwhile makes the row stale
+        if query_cache.versions.get("users", 0) == version:
+            auth_cache.set(key, user)
+    return user
+
+async def require_admin(current_user: User = Depends(get_current_user)):
+    """Only the admin role may manage users and backups"""
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Admin role required")
+    return current_user
+
+@api_router.put("/reviews/{review_id}/approve")
+async def approve_review(review_id: str, current_user: User = Depends(get_current_user), conn=Depends(get_db)):
+    async with mysql_pool.transaction(conn):
+        cursor = await conn.cursor()
+        await cursor.execute("SELECT rating, is_approved FROM reviews WHERE id = %s FOR UPDATE", (review_id,))
+        review = await cursor.fetchone()
+        if not review:
+            raise HTTPException(status_code=404, detail="Review not found")
+        if not review["is_approved"]:
+            await cursor.execute("UPDATE reviews SET is_approved = TRUE WHERE id = %s", (review_id,))
+    if not review["is_approved"]:
+        query_cache.invalidate("reviews")
+        review_stats.approve(review["rating"])
+    return {"message": "Review approved successfully"}
+
+@api_router.delete("/admin/reviews/{review_id}")
+async def delete_review(review_id: str, current_user: User = Depends(get_current_user), conn=Depends(get_db)):
+    async with mysql_pool.transaction(conn):
+        cursor = await conn.cursor()
+        await cursor.execute("SELECT rating, is_approved FROM reviews WHERE id = %s FOR UPDATE", (review_id,))
+        review = await cursor.fetchone()
+        if not review:
+            raise HTTPException(status_code=404, detail="Review not found")
+        await cursor.execute("DELETE FROM reviews WHERE id = %s", (review_id,))
+    query_cache.invalidate("reviews")
+    review_stats.remove(review["rating"], review["is_approved"])
+    return {"message": "Review deleted successfully"}
+
+async def moderate_reviews(conn, ids, statement, approved=None):
+    """Apply `statement` to the reviews in `ids` (optionally only those with is_approved = `approved`)
+
+    The statement is one set-based UPDATE/DELETE whose {where} is filled in here. The
+    matching rows are first counted per (rating, is_approved) under row locks, so the
+    caller can adjust review_stats by exactly what changed. Returns (groups, affected).
+    """
+    if not ids:
+        raise HTTPException(status_code=400, detail="No reviews given")
+    if len(ids) > REVIEWS_MAX_PAGE_SIZE:
+        raise HTTPException(status_code=400, detail=f"At most {REVIEWS_MAX_PAGE_SIZE} reviews per request")
+    where, params = f"id IN ({placeholders(ids)})", list(ids)
+    if approved is not None:
+        where += " AND is_approved = %s"
+        params.append(approved)
+    affected = 0
+    async with mysql_pool.transaction(conn):
+        cursor = await conn.cursor()
+        await cursor.execute(f"""
+            SELECT rating, is_approved, COUNT(*) AS count FROM reviews
+            WHERE {where} GROUP BY rating, is_approved FOR UPDATE
+        """, params)
+        groups = await cursor.fetchall()
+        if groups:
+            await cursor.execute(statement.format(where=where), params)
+            affected = cursor.rowcount
+    if affected:
+        query_cache.invalidate("reviews")
+    return groups, affected
+
+@api_router.post("/admin/reviews/bulk-approve")
+async def bulk_approve_reviews(data: ReviewBulkIds, current_user: User = Depends(get_current_user), conn=Depends(get_db)):
+    groups, approved = await moderate_reviews(
+        conn, data.ids, "UPDATE reviews SET is_approved = TRUE WHERE {where}", approved=False)
+    for group in groups:
+        review_stats.approve(group["rating"], group["count"])
+    return {"message": f"{approved} Bewertungen genehmigt", "approved": approved, "requested": len(data.ids)}
+
+@api_router.post("/admin/reviews/bulk-reject")
+async def bulk_reject_reviews(data: ReviewBulkIds, current_user: User = Depends(get_current_user), conn=Depends(get_db)):
+    """Withdraw approval: the reviews go back to pending and disappear from the public list"""
+    groups, rejected = await moderate_reviews(
+        conn, data.ids, "UPDATE reviews SET is_approved = FALSE WHERE {where}", approved=True)
+    for group in groups:
+        review_stats.reject(group["rating"], group["count"])
+    return {"message": f"{rejected} Bewertungen zurückgezogen", "rejected": rejected, "requested": len(data.ids)}
+
+@api_router.post("/admin/reviews/bulk-delete")
+async def bulk_delete_reviews(data: ReviewBulkIds, current_user: User = Depends(get_current_user), conn=Depends(get_db)):
+    groups, deleted = await moderate_reviews(conn, data.ids, "DELETE FROM reviews WHERE {where}")
+    for group in groups:
+        review_stats.remove(group["rating"], group["is_approved"], group["count"])
+    return {"message": f"{deleted} Bewertungen gelöscht", "deleted": deleted, "requested": len(data.ids)}
 
 @api_router.get("/auth/me", response_model=User)
 async def read_users_me(current_user: User = Depends(get_current_user)):
@@ -189,23 +392,43 @@ async def read_users_me(current_user: User = Depends(get_current_user)):
 
 @api_router.post("/contact")
 async def create_contact_message(message_data: dict):
-    conn = get_mysql_connection()
-    try:
-        cursor = conn.cursor()
-        cursor.execute("""
+    async with mysql_pool.transaction() as conn:
+        cursor = await conn.cursor()
+        await cursor.execute("""
             INSERT INTO contact_messages (id, name, email, phone, subject, message, date, is_read)
             VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
         """, (str(uuid.uuid4()), message_data.get("name"), message_data.get("email"), 
               message_data.get("phone"), message_data.get("subject"), message_data.get("message"), 
               datetime.utcnow(), False))
-        conn.commit()
-        return {"message": "Contact message sent successfully"}
-    finally:
-        conn.close()
+        await record_activity(cursor, "contact_messages")
+    query_cache.invalidate("contact_messages")
+    return {"message": "Contact message sent successfully"}
 
 # CMS Endpoints with static data for webspace compatibility
-@api_router.get("/cms/homepage")
-async def get_homepage_content():
+cms_store = CMSStore()
+
+# Built-in content per CMS key, served until an editor saves that key for the first time
+CMS_DEFAULTS = {}
+
+def cms_default(key: str):
+    def register(build):
+        CMS_DEFAULTS[key] = build
+        return build
+    return register
+
+def cms_payload(key: str):
+    """Saved CMS content (the built-in defaults until the first save), encoded once per version"""
+    return cms_store.get(key, CMS_DEFAULTS[key])
+
+def cms_response(request: Request, key: str):
+    return payload_response(request, cms_payload(key))
+
+async def cms_update(key: str, content: dict, current_user: User, conn):
+    version = await cms_store.put(mysql_pool, conn, key, content, current_user.username)
+    return {"version": version, "data": content}
+
+@cms_default("homepage")
+def homepage_defaults():
     return {
         "hero": {
             "title": "JIMMY'S TAPAS BAR",
@@ -233,64 +456,80 @@ async def get_homepage_content():
         }
     }
 
+@api_router.get("/cms/homepage")
+async def get_homepage_content(request: Request):
+    return cms_response(request, "homepage")
+
 @api_router.put("/cms/homepage")
-async def update_homepage_content(content_data: dict, current_user: User = Depends(get_current_user)):
-    # Store updated content in database or file
-    return {"message": "Homepage content updated successfully", "data": content_data}
+async def update_homepage_content(content_data: dict, current_user: User = Depends(get_current_user), conn=Depends(get_db)):
+    result = await cms_update("homepage", content_data, current_user, conn)
+    return {"message": "Homepage content updated successfully", **result}
 
 @api_router.put("/cms/standorte-enhanced")
-async def update_standorte_enhanced(content_data: dict, current_user: User = Depends(get_current_user)):
-    return {"message": "Standorte content updated successfully", "data": content_data}
+async def update_standorte_enhanced(content_data: dict, current_user: User = Depends(get_current_user), conn=Depends(get_db)):
+    result = await cms_update("standorte-enhanced", content_data, current_user, conn)
+    return {"message": "Standorte content updated successfully", **result}
 
 @api_router.put("/cms/ueber-uns-enhanced")
-async def update_ueber_uns_enhanced(content_data: dict, current_user: User = Depends(get_current_user)):
+async def update_ueber_uns_enhanced(content_data: dict, current_user: User = Depends(get_current_user), conn=Depends(get_db)):
     """Update about us content"""
-    # In a real implementation, this would save to database
-    return {"message": "Über uns content updated successfully", "data": content_data}
+    result = await cms_update("ueber-uns-enhanced", content_data, current_user, conn)
+    return {"message": "Über uns content updated successfully", **result}
+
+WEBSITE_TEXT_SECTIONS = ("navigation", "footer", "buttons")
+
+@cms_default("website-texts/navigation")
+def website_texts_navigation_defaults():
+    return {
+        "home": "Startseite",
+        "locations": "Standorte",
+        "menu": "Speisekarte",
+        "reviews": "Bewertungen",
+        "about": "Über uns",
+        "contact": "Kontakt",
+        "privacy": "Datenschutz",
+        "imprint": "Impressum"
+    }
+
+@cms_default("website-texts/footer")
+def website_texts_footer_defaults():
+    return {
+        "opening_hours_title": "Öffnungszeiten",
+        "contact_title": "Kontakt",
+        "follow_us_title": "Folgen Sie uns",
+        "copyright": "© 2024 Jimmy's Tapas Bar. Alle Rechte vorbehalten."
+    }
+
+@cms_default("website-texts/buttons")
+def website_texts_buttons_defaults():
+    return {
+        "menu_button": "Speisekarte ansehen",
+        "locations_button": "Standorte entdecken",
+        "contact_button": "Kontakt aufnehmen",
+        "reserve_button": "Tisch reservieren",
+        "order_button": "Online bestellen"
+    }
 
 @api_router.get("/cms/website-texts/{section}")
-async def get_website_texts(section: str):
+async def get_website_texts(section: str, request: Request):
     """Get website texts for a specific section (navigation, footer, buttons)"""
-    if section == "navigation":
-        return {
-            "home": "Startseite",
-            "locations": "Standorte",
-            "menu": "Speisekarte",
-            "reviews": "Bewertungen",
-            "about": "Über uns",
-            "contact": "Kontakt",
-            "privacy": "Datenschutz",
-            "imprint": "Impressum"
-        }
-    elif section == "footer":
-        return {
-            "opening_hours_title": "Öffnungszeiten",
-            "contact_title": "Kontakt",
-            "follow_us_title": "Folgen Sie uns",
-            "copyright": "© 2024 Jimmy's Tapas Bar. Alle Rechte vorbehalten."
-        }
-    elif section == "buttons":
-        return {
-            "menu_button": "Speisekarte ansehen",
-            "locations_button": "Standorte entdecken",
-            "contact_button": "Kontakt aufnehmen",
-            "reserve_button": "Tisch reservieren",
-            "order_button": "Online bestellen"
-        }
-    else:
+    if section not in WEBSITE_TEXT_SECTIONS:
         raise HTTPException(status_code=404, detail=f"Section '{section}' not found")
+    return cms_response(request, f"website-texts/{section}")
 
 @api_router.put("/cms/website-texts/{section}")
-async def update_website_texts(section: str, content_data: dict, current_user: User = Depends(get_current_user)):
-    return {"message": f"Website texts for {section} updated successfully", "data": content_data}
+async def update_website_texts(section: str, content_data: dict, current_user: User = Depends(get_current_user), conn=Depends(get_db)):
+    if section not in WEBSITE_TEXT_SECTIONS:
+        raise HTTPException(status_code=404, detail=f"Section '{section}' not found")
+    result = await cms_update(f"website-texts/{section}", content_data, current_user, conn)
+    return {"message": f"Website texts for {section} updated successfully", **result}
 
 # Menu Items CRUD für CMS
 @api_router.put("/menu/items/{item_id}")
-async def update_menu_item(item_id: str, item_data: dict, current_user: User = Depends(get_current_user)):
-    conn = get_mysql_connection()
-    try:
-        cursor = conn.cursor()
-        cursor.execute("""
+async def update_menu_item(item_id: str, item_data: dict, current_user: User = Depends(get_current_user), conn=Depends(get_db)):
+    async with mysql_pool.transaction(conn):
+        cursor = await conn.cursor()
+        await cursor.execute("""
             UPDATE menu_items SET 
             name = %s, description = %s, detailed_description = %s, price = %s, 
             category = %s, origin = %s, allergens = %s, ingredients = %s,
@@ -305,29 +544,25 @@ async def update_menu_item(item_id: str, item_data: dict, current_user: User = D
             item_data.get('glutenfree', False), item_data.get('order_index', 0),
             item_id
         ))
-        conn.commit()
-        return {"message": "Menu item updated successfully"}
-    finally:
-        conn.close()
+        await record_activity(cursor, "menu_changes")
+    query_cache.invalidate("menu_items")
+    return {"message": "Menu item updated successfully"}
 
 @api_router.delete("/menu/items/{item_id}")
-async def delete_menu_item(item_id: str, current_user: User = Depends(get_current_user)):
-    conn = get_mysql_connection()
-    try:
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM menu_items WHERE id = %s", (item_id,))
-        conn.commit()
-        return {"message": "Menu item deleted successfully"}
-    finally:
-        conn.close()
+async def delete_menu_item(item_id: str, current_user: User = Depends(get_current_user), conn=Depends(get_db)):
+    async with mysql_pool.transaction(conn):
+        cursor = await conn.cursor()
+        await cursor.execute("DELETE FROM menu_items WHERE id = %s", (item_id,))
+        await record_activity(cursor, "menu_changes")
+    query_cache.invalidate("menu_items")
+    return {"message": "Menu item deleted successfully"}
 
 @api_router.post("/menu/items")
-async def create_menu_item(item_data: dict, current_user: User = Depends(get_current_user)):
-    conn = get_mysql_connection()
-    try:
-        cursor = conn.cursor()
+async def create_menu_item(item_data: dict, current_user: User = Depends(get_current_user), conn=Depends(get_db)):
+    async with mysql_pool.transaction(conn):
+        cursor = await conn.cursor()
         item_id = str(uuid.uuid4())
-        cursor.execute("""
+        await cursor.execute("""
             INSERT INTO menu_items (id, name, description, detailed_description, price, category, 
                                    origin, allergens, ingredients, vegan, vegetarian, glutenfree, 
                                    order_index, is_active)
@@ -340,13 +575,148 @@ async def create_menu_item(item_data: dict, current_user: User = Depends(get_cur
             item_data.get('vegan', False), item_data.get('vegetarian', False),
             item_data.get('glutenfree', False), item_data.get('order_index', 0), True
         ))
-        conn.commit()
-        return {"message": "Menu item created successfully", "id": item_id}
-    finally:
-        conn.close()
+        await record_activity(cursor, "menu_changes")
+    query_cache.invalidate("menu_items")
+    return {"message": "Menu item created successfully", "id": item_id}
 
-@api_router.get("/cms/standorte-enhanced")
-async def get_standorte_enhanced():
+# Admin listing: inactive dishes too, so deactivated ones can be found and reactivated
+ADMIN_MENU_ITEMS_QUERY = "SELECT * FROM menu_items ORDER BY order_index, category, name"
+
+@api_router.get("/admin/menu/items")
+async def get_admin_menu_items(current_user: User = Depends(get_current_user), conn=Depends(get_db)):
+    """All menu items including inactive ones, in menu order"""
+    return await query_cache.fetchall(conn, ADMIN_MENU_ITEMS_QUERY, tags=("menu_items",))
+
+# Bulk menu operations: one statement, one transaction and one cache invalidation per request
+MENU_BULK_MAX_ITEMS = 1000
+# Per-column validators from MenuItem, so bulk values are checked before they reach MySQL
+MENU_ITEM_ADAPTERS = {name: TypeAdapter(field.annotation) for name, field in MenuItem.model_fields.items() if name != "id"}
+MENU_ITEM_FIELDS = set(MENU_ITEM_ADAPTERS)
+
+def check_bulk_size(count):
+    if not count:
+        raise HTTPException(status_code=400, detail="No menu items given")
+    if count > MENU_BULK_MAX_ITEMS:
+        raise HTTPException(status_code=400, detail=f"At most {MENU_BULK_MAX_ITEMS} menu items per request")
+
+async def run_menu_bulk(conn, sql, params):
+    async with mysql_pool.transaction(conn):
+        cursor = await conn.cursor()
+        await cursor.execute(sql, params)
+        affected = cursor.rowcount
+        if affected:
+            await record_activity(cursor, "menu_changes", count=affected)
+    query_cache.invalidate("menu_items")
+    return affected
+
+@api_router.post("/admin/menu/items/bulk-update")
+async def bulk_update_menu_items(data: MenuBulkUpdate, current_user: User = Depends(get_current_user), conn=Depends(get_db)):
+    check_bulk_size(len(data.items))
+    rows = {}
+    for item in data.items:
+        values = dict(item)
+        item_id = values.pop("id", None)
+        unknown = set(values) - MENU_ITEM_FIELDS
+        if not item_id or not values or unknown:
+            raise HTTPException(status_code=400, detail=f"Each item needs an id and known fields (unknown: {', '.join(sorted(unknown)) or '-'})")
+        for column, value in values.items():
+            try:
+                values[column] = MENU_ITEM_ADAPTERS[column].validate_python(value)
+            except ValidationError as e:
+                raise HTTPException(status_code=400, detail=f"Item {item_id}: invalid {column}: {e.errors()[0]['msg']}")
+        rows.setdefault(str(item_id), {}).update(values)
+    sql, params = case_update("menu_items", rows)
+    updated = await run_menu_bulk(conn, sql, params)
+    return {"message": f"{updated} Menu-Items aktualisiert", "updated": updated}
+
+@api_router.post("/admin/menu/items/bulk-delete")
+async def bulk_delete_menu_items(data: MenuBulkIds, current_user: User = Depends(get_current_user), conn=Depends(get_db)):
+    check_bulk_size(len(data.ids))
+    deleted = await run_menu_bulk(conn, f"DELETE FROM menu_items WHERE id IN ({placeholders(data.ids)})",
+                                  data.ids)
+    return {"message": f"{deleted} Menu-Items gelöscht", "deleted": deleted}
+
+@api_router.post("/admin/menu/items/bulk-activate")
+async def bulk_activate_menu_items(data: MenuBulkActivate, current_user: User = Depends(get_current_user), conn=Depends(get_db)):
+    check_bulk_size(len(data.ids))
+    updated = await run_menu_bulk(conn, f"UPDATE menu_items SET is_active = %s WHERE id IN ({placeholders(data.ids)})",
+                                  [data.is_active, *data.ids])
+    state = "aktiviert" if data.is_active else "deaktiviert"
+    return {"message": f"{updated} Menu-Items {state}", "updated": updated}
+
+@api_router.post("/admin/menu/items/bulk-reorder")
+async def bulk_reorder_menu_items(data: MenuBulkReorder, current_user: User = Depends(get_current_user), conn=Depends(get_db)):
+    check_bulk_size(len(data.items))
+    sql, params = case_update("menu_items", {entry.id: {"order_index": entry.order_index} for entry in data.items})
+    updated = await run_menu_bulk(conn, sql, params)
+    return {"message": f"Reihenfolge von {updated} Menu-Items gespeichert", "updated": updated}
+
+MENU_IMPORT_MAX_BYTES = 5 * 1024 * 1024
+MENU_IMPORT_MAX_ERRORS = 50
+
+async def read_menu_document(request: Request, format: Optional[str]):
+    """Validated rows and row errors of the CSV/JSON menu document in the request body"""
+    fmt = format or ("csv" if "csv" in request.headers.get("content-type", "") else "json")
+    if fmt not in ("csv", "json"):
+        raise HTTPException(status_code=400, detail="format must be csv or json")
+    body = await request.body()
+    if len(body) > MENU_IMPORT_MAX_BYTES:
+        raise HTTPException(status_code=413, detail="Menu document too large")
+    try:
+        rows = parse_document(body, fmt)
+    except (MenuImportError, UnicodeDecodeError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    check_bulk_size(len(rows))
+    return validate_menu_rows(rows)
+
+@api_router.post("/admin/menu/import")
+async def import_menu(request: Request, format: Optional[str] = None,
+                      current_user: User = Depends(get_current_user), conn=Depends(get_db)):
+    """Upsert a CSV or JSON menu document (raw request body) in one transaction
+
+    Rows are matched by id, else by category and name; invalid and duplicate rows are
+    skipped and listed in `errors`, everything else is written.
+    """
+    valid, errors = await read_menu_document(request, format)
+    inserted = updated = 0
+    if valid:
+        async with mysql_pool.transaction(conn):
+            cursor = await conn.cursor()
+            inserted, updated = await upsert_rows(cursor, valid)
+            await record_activity(cursor, "menu_changes", count=inserted + updated)
+        query_cache.invalidate("menu_items")
+    return {
+        "message": f"Import: {inserted} neu, {updated} aktualisiert, {len(errors)} übersprungen",
+        "inserted": inserted,
+        "updated": updated,
+        "skipped": len(errors),
+        "errors": errors[:MENU_IMPORT_MAX_ERRORS],
+    }
+
+@api_router.post("/admin/menu/sync")
+async def sync_menu(request: Request, format: Optional[str] = None, dry_run: bool = False,
+                    current_user: User = Depends(get_current_user), conn=Depends(get_db)):
+    """Make menu_items match the CSV/JSON document with the fewest writes; `dry_run` only returns the plan
+
+    Unlike the import, the document is the whole menu: active dishes it does not list are
+    deactivated. A document with any invalid row is therefore rejected as a whole.
+    """
+    desired, errors = await read_menu_document(request, format)
+    if errors:
+        raise HTTPException(status_code=400, detail={"message": "Menu document has invalid rows",
+                                                     "errors": errors[:MENU_IMPORT_MAX_ERRORS]})
+    async with mysql_pool.transaction(conn):
+        cursor = await conn.cursor()
+        plan = await plan_sync(cursor, desired, lock=not dry_run)
+        if not dry_run and plan.changes:
+            await apply_sync(cursor, plan)
+            await record_activity(cursor, "menu_changes", count=plan.changes)
+    if not dry_run and plan.changes:
+        query_cache.invalidate("menu_items")
+    return {"dryRun": dry_run, **plan.summary()}
+
+@cms_default("standorte-enhanced")
+def standorte_enhanced_defaults():
     return {
         "page_title": "Unsere Standorte",
         "page_subtitle": "Besuchen Sie uns an der malerischen Ostseeküste",
@@ -374,13 +744,12 @@ async def get_standorte_enhanced():
         }
     }
 
-@api_router.put("/cms/standorte-enhanced")
-async def update_standorte_enhanced(content_data: dict, current_user: User = Depends(get_current_user)):
-    return {"message": "Standorte content updated successfully", "data": content_data}
+@api_router.get("/cms/standorte-enhanced")
+async def get_standorte_enhanced(request: Request):
+    return cms_response(request, "standorte-enhanced")
 
-@api_router.get("/cms/locations")
-async def get_locations():
-    """Get locations data - returns current live data structure"""
+@cms_default("locations")
+def locations_defaults():
     return {
         "page_title": "Unsere Standorte",
         "page_description": "Besuchen Sie uns an der malerischen Ostseeküste",
@@ -418,12 +787,18 @@ async def get_locations():
         ]
     }
 
+@api_router.get("/cms/locations")
+async def get_locations(request: Request):
+    """Get locations data - returns current live data structure"""
+    return cms_response(request, "locations")
+
 @api_router.put("/cms/locations")
-async def update_locations(content_data: dict, current_user: User = Depends(get_current_user)):
-    return {"message": "Standorte content updated successfully", "data": content_data}
+async def update_locations(content_data: dict, current_user: User = Depends(get_current_user), conn=Depends(get_db)):
+    result = await cms_update("locations", content_data, current_user, conn)
+    return {"message": "Standorte content updated successfully", **result}
 
-@api_router.get("/cms/kontakt-page")
-async def get_kontakt_page():
+@cms_default("kontakt-page")
+def kontakt_page_defaults():
     return {
         "page_title": "Kontakt",
         "page_subtitle": "Wir freuen uns auf Ihren Besuch",
@@ -434,9 +809,12 @@ async def get_kontakt_page():
         "additional_info": "Wir sind täglich für Sie da."
     }
 
-@api_router.get("/cms/ueber-uns-enhanced")
-async def get_ueber_uns_enhanced():
-    """Get about us data - matches the live website structure exactly"""
+@api_router.get("/cms/kontakt-page")
+async def get_kontakt_page(request: Request):
+    return cms_response(request, "kontakt-page")
+
+@cms_default("ueber-uns-enhanced")
+def ueber_uns_enhanced_defaults():
     return {
         "page_title": "Über uns",
         "page_subtitle": "Die Geschichte hinter Jimmy's Tapas Bar",
@@ -460,107 +838,127 @@ async def get_ueber_uns_enhanced():
         }
     }
 
+@api_router.get("/cms/ueber-uns-enhanced")
+async def get_ueber_uns_enhanced(request: Request):
+    """Get about us data - matches the live website structure exactly"""
+    return cms_response(request, "ueber-uns-enhanced")
+
 # Fehlende Admin-Endpunkte hinzufügen
 @api_router.get("/admin/newsletter/subscribers")
-async def get_newsletter_subscribers(current_user: User = Depends(get_current_user)):
-    conn = get_mysql_connection()
+async def get_newsletter_subscribers(current_user: User = Depends(get_current_user), conn=Depends(get_db)):
     try:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM newsletter_subscribers ORDER BY created_at DESC")
-        subscribers = cursor.fetchall()
+        cursor = await conn.cursor()
+        await cursor.execute("SELECT * FROM newsletter_subscribers ORDER BY created_at DESC")
+        subscribers = await cursor.fetchall()
         return subscribers
     except Exception as e:
         # Falls Tabelle nicht existiert, leere Liste zurückgeben
         return []
-    finally:
-        conn.close()
 
 @api_router.get("/users")
-async def get_users(current_user: User = Depends(get_current_user)):
-    conn = get_mysql_connection()
+async def get_users(current_user: User = Depends(get_current_user), conn=Depends(get_db)):
+    users = await query_cache.fetchall(conn, "SELECT id, username, email, role, is_active FROM users", tags=("users",))
+    return [User(**user) for user in users]
+
+# Inbox page sizes: default and upper bound for `limit`
+CONTACT_PAGE_SIZE = 50
+CONTACT_MAX_PAGE_SIZE = 200
+CONTACT_SORTS = {"date_desc": ("DESC", "<"), "date_asc": ("ASC", ">")}
+
+def parse_day(value, name):
     try:
-        cursor = conn.cursor()
-        cursor.execute("SELECT id, username, email, role, is_active FROM users")
-        users = cursor.fetchall()
-        return [User(**user) for user in users]
-    finally:
-        conn.close()
+        return datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid {name} date, expected YYYY-MM-DD")
 
 @api_router.get("/admin/contact")
-async def get_contact_messages(current_user: User = Depends(get_current_user)):
-    conn = get_mysql_connection()
-    try:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM contact_messages ORDER BY date DESC")
-        messages = cursor.fetchall()
-        return messages
-    finally:
-        conn.close()
+async def get_contact_messages(request: Request, response: Response, is_read: Optional[bool] = None,
+                               start: Optional[str] = None, end: Optional[str] = None,
+                               subject: Optional[str] = None, sort: str = "date_desc",
+                               limit: int = CONTACT_PAGE_SIZE, cursor: Optional[str] = None,
+                               current_user: User = Depends(get_current_user), conn=Depends(get_db)):
+    """One keyset page of the inbox, filtered by read state, day range (inclusive) and subject text"""
+    if sort not in CONTACT_SORTS:
+        raise HTTPException(status_code=400, detail=f"sort must be one of: {', '.join(CONTACT_SORTS)}")
+    direction, seek = CONTACT_SORTS[sort]
+    where, params = [], []
+    if is_read is not None:
+        where.append("is_read = %s")
+        params.append(is_read)
+    if start:
+        where.append("date >= %s")
+        params.append(parse_day(start, "start"))
+    if end:
+        where.append("date < %s")
+        params.append(parse_day(end, "end") + timedelta(days=1))
+    if subject:
+        where.append("subject LIKE %s")
+        params.append("%" + subject.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%")
+    if cursor:
+        try:
+            cursor_date, cursor_id = decode_cursor(cursor, datetime, str)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        where.append(f"(date {seek} %s OR (date = %s AND id {seek} %s))")
+        params += [cursor_date, cursor_date, cursor_id]
+    page_size = max(1, min(limit, CONTACT_MAX_PAGE_SIZE))
+    # Read-state filters range-scan idx_contact_read (is_read, date), the rest walk idx_contact_date
+    sql = "SELECT * FROM contact_messages"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += f" ORDER BY date {direction}, id {direction} LIMIT %s"
+    params.append(page_size + 1)
+    rows, _ = await query_cache.fetch(conn, sql, params, tags=("contact_messages",))
+    messages, next_cursor = keyset_page(rows, page_size, lambda row: (row["date"], row["id"]))
+    set_next_cursor(request, response, next_cursor)
+    return messages
 
-@api_router.post("/contact")
-async def submit_contact_form(contact_data: dict):
-    conn = get_mysql_connection()
-    try:
-        cursor = conn.cursor()
-        # Versuche Tabelle zu erstellen falls sie nicht existiert
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS contact_messages (
-                id VARCHAR(36) PRIMARY KEY,
-                name VARCHAR(255) NOT NULL,
-                email VARCHAR(255) NOT NULL,
-                phone VARCHAR(50),
-                subject VARCHAR(255) NOT NULL,
-                message TEXT NOT NULL,
-                date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                status VARCHAR(50) DEFAULT 'new'
-            )
-        """)
-        
-        cursor.execute("""
-            INSERT INTO contact_messages (id, name, email, phone, subject, message)
-            VALUES (%s, %s, %s, %s, %s, %s)
-        """, (
-            str(uuid.uuid4()), 
-            contact_data.get("name"), 
-            contact_data.get("email"),
-            contact_data.get("phone", ""),
-            contact_data.get("subject"),
-            contact_data.get("message")
-        ))
-        conn.commit()
-        return {"message": "Contact form submitted successfully"}
-    except Exception as e:
-        return {"message": "Contact form submission failed", "error": str(e)}
-    finally:
-        conn.close()
+@api_router.get("/admin/contact/counts")
+async def get_contact_counts(current_user: User = Depends(get_current_user), conn=Depends(get_db)):
+    """Read/unread totals for the inbox header, counted from idx_contact_read alone"""
+    rows = await query_cache.fetchall(
+        conn, "SELECT is_read, COUNT(*) AS count FROM contact_messages GROUP BY is_read",
+        tags=("contact_messages",)
+    )
+    unread = sum(row["count"] for row in rows if not row["is_read"])
+    total = sum(row["count"] for row in rows)
+    return {"total": total, "unread": unread, "read": total - unread}
+
+@api_router.put("/admin/contact/{message_id}/read")
+async def mark_contact_message_read(message_id: str, current_user: User = Depends(get_current_user),
+                                    conn=Depends(get_db)):
+    cursor = await conn.cursor()
+    await cursor.execute("UPDATE contact_messages SET is_read = TRUE WHERE id = %s", (message_id,))
+    query_cache.invalidate("contact_messages")
+    return {"message": "Message marked as read"}
+
+@api_router.delete("/admin/contact/{message_id}")
+async def delete_contact_message(message_id: str, current_user: User = Depends(get_current_user),
+                                 conn=Depends(get_db)):
+    cursor = await conn.cursor()
+    await cursor.execute("DELETE FROM contact_messages WHERE id = %s", (message_id,))
+    if cursor.rowcount == 0:
+        raise HTTPException(status_code=404, detail="Message not found")
+    query_cache.invalidate("contact_messages")
+    return {"message": "Message deleted successfully"}
 
 @api_router.post("/newsletter/subscribe")
 async def newsletter_subscribe(email_data: dict):
-    conn = get_mysql_connection()
     try:
-        cursor = conn.cursor()
-        # Versuche Tabelle zu erstellen falls sie nicht existiert
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS newsletter_subscribers (
-                id VARCHAR(36) PRIMARY KEY,
-                email VARCHAR(255) UNIQUE NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                is_active BOOLEAN DEFAULT TRUE
-            )
-        """)
-        
-        cursor.execute("""
-            INSERT INTO newsletter_subscribers (id, email)
-            VALUES (%s, %s)
-        """, (str(uuid.uuid4()), email_data.get("email")))
-        conn.commit()
-        return {"message": "Newsletter subscription successful"}
+        # Subscriber and rollup commit together, or neither does
+        async with mysql_pool.transaction() as conn:
+            cursor = await conn.cursor()
+            await cursor.execute("""
+                INSERT INTO newsletter_subscribers (id, email)
+                VALUES (%s, %s)
+            """, (str(uuid.uuid4()), email_data.get("email")))
+            await record_activity(cursor, "newsletter_signups")
     except Exception as e:
         if "Duplicate entry" in str(e):
             return {"message": "Email already subscribed"}
         return {"message": "Subscription failed", "error": str(e)}
-    finally:
-        conn.close()
+    query_cache.invalidate("newsletter_subscribers")
+    return {"message": "Newsletter subscription successful"}
 
 # CORS
 app.add_middleware(
@@ -569,122 +967,53 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Link", NEXT_CURSOR_HEADER],
 )
 
-app.include_router(api_router)
-
-# Initialize database with sample data
-def init_database():
-    conn = get_mysql_connection()
-    try:
-        cursor = conn.cursor()
+# Seed an empty database with the admin user and sample data; the schema comes from migrations.py
+async def init_database():
+    async with mysql_pool.acquire() as conn:
+        try:
+            cursor = await conn.cursor()
         
-        # Create tables
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS menu_items (
-                id VARCHAR(36) PRIMARY KEY,
-                name VARCHAR(255) NOT NULL,
-                description TEXT,
-                detailed_description TEXT,
-                price VARCHAR(20) NOT NULL,
-                category VARCHAR(100) NOT NULL,
-                origin VARCHAR(255),
-                allergens TEXT,
-                additives TEXT,
-                preparation_method TEXT,
-                ingredients TEXT,
-                vegan BOOLEAN DEFAULT FALSE,
-                vegetarian BOOLEAN DEFAULT FALSE,
-                glutenfree BOOLEAN DEFAULT FALSE,
-                order_index INT DEFAULT 0,
-                is_active BOOLEAN DEFAULT TRUE
-            )
-        """)
+            # Check if admin user exists
+            await cursor.execute("SELECT COUNT(*) as count FROM users WHERE username = 'admin'")
+            result = await cursor.fetchone()
         
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS reviews (
-                id VARCHAR(36) PRIMARY KEY,
-                customer_name VARCHAR(255) NOT NULL,
-                rating INT NOT NULL,
-                comment TEXT NOT NULL,
-                date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                is_approved BOOLEAN DEFAULT FALSE
-            )
-        """)
+            if result['count'] == 0:
+                admin_hash = await get_password_hash("jimmy2024")
+                await cursor.execute("""
+                    INSERT INTO users (id, username, email, password_hash, role)
+                    VALUES (%s, %s, %s, %s, %s)
+                """, (str(uuid.uuid4()), "admin", "admin@jimmys-tapasbar.de", admin_hash, "admin"))
         
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS users (
-                id VARCHAR(36) PRIMARY KEY,
-                username VARCHAR(100) UNIQUE NOT NULL,
-                email VARCHAR(255) NOT NULL,
-                password_hash VARCHAR(255) NOT NULL,
-                role ENUM('admin', 'editor', 'viewer') DEFAULT 'viewer',
-                is_active BOOLEAN DEFAULT TRUE
-            )
-        """)
+            # Check if menu items exist
+            await cursor.execute("SELECT COUNT(*) as count FROM menu_items")
+            result = await cursor.fetchone()
         
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS contact_messages (
-                id VARCHAR(36) PRIMARY KEY,
-                name VARCHAR(255) NOT NULL,
-                email VARCHAR(255) NOT NULL,
-                phone VARCHAR(50),
-                subject VARCHAR(255),
-                message TEXT NOT NULL,
-                date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                is_read BOOLEAN DEFAULT FALSE
-            )
-        """)
-        
-        # Check if admin user exists
-        cursor.execute("SELECT COUNT(*) as count FROM users WHERE username = 'admin'")
-        result = cursor.fetchone()
-        
-        if result['count'] == 0:
-            admin_hash = pwd_context.hash("jimmy2024")
-            cursor.execute("""
-                INSERT INTO users (id, username, email, password_hash, role)
-                VALUES (%s, %s, %s, %s, %s)
-            """, (str(uuid.uuid4()), "admin", "admin@jimmys-tapasbar.de", admin_hash, "admin"))
-        
-        # Check if menu items exist
-        cursor.execute("SELECT COUNT(*) as count FROM menu_items")
-        result = cursor.fetchone()
-        
-        if result['count'] == 0:
-            # Add sample menu items
-            menu_items = [
-                ("Gambas al Ajillo", "Klassische spanische Knoblauchgarnelen", "Frische Garnelen in bestem Olivenöl mit viel Knoblauch, Chili und Petersilie", "12,90", "Vorspeisen", "Andalusien", "Krustentiere", "", "In der Pfanne gebraten", "Garnelen, Olivenöl, Knoblauch, Chili, Petersilie", 0, 0, 1),
-                ("Patatas Bravas", "Würzig gebratene Kartoffeln mit Aioli", "Knusprig gebratene Kartoffelwürfel mit hausgemachter Aioli und scharfer Bravas-Sauce", "8,50", "Vorspeisen", "Madrid", "Eier", "", "Frittiert und gebacken", "Kartoffeln, Tomaten, Aioli, Paprika", 0, 1, 1),
-                ("Paella Valenciana", "Original Paella mit Huhn und grünen Bohnen", "Die klassische Paella aus Valencia mit echtem Safran, Huhn und grünen Bohnen", "24,90", "Paella", "Valencia", "", "", "In der Paellera über Feuer", "Bomba-Reis, Huhn, grüne Bohnen, Safran", 0, 0, 1),
-                ("Jamón Ibérico", "Hauchdünn geschnittener iberischer Schinken", "24 Monate gereifter Jamón Ibérico serviert mit Manchego-Käse", "16,90", "Vorspeisen", "Extremadura", "Milch", "", "24 Monate luftgetrocknet", "Iberischer Schinken, Manchego", 0, 0, 1),
-                ("Sangría de la Casa", "Hausgemachte Sangría mit Früchten", "Erfrischende Sangría mit Rotwein, Orangen und Äpfeln", "6,90", "Getränke", "Spanien", "Sulfite", "", "24h ziehen lassen", "Rotwein, Orangen, Äpfel, Brandy", 1, 1, 1)
-            ]
+            if result['count'] == 0:
+                # Add sample menu items
+                menu_items = [
+                    ("Gambas al Ajillo", "Klassische spanische Knoblauchgarnelen", "Frische Garnelen in bestem Olivenöl mit viel Knoblauch, Chili und Petersilie", "12,90", "Vorspeisen", "Andalusien", "Krustentiere", "", "In der Pfanne gebraten", "Garnelen, Olivenöl, Knoblauch, Chili, Petersilie", 0, 0, 1),
+                    ("Patatas Bravas", "Würzig gebratene Kartoffeln mit Aioli", "Knusprig gebratene Kartoffelwürfel mit hausgemachter Aioli und scharfer Bravas-Sauce", "8,50", "Vorspeisen", "Madrid", "Eier", "", "Frittiert und gebacken", "Kartoffeln, Tomaten, Aioli, Paprika", 0, 1, 1),
+                    ("Paella Valenciana", "Original Paella mit Huhn und grünen Bohnen", "Die klassische Paella aus Valencia mit echtem Safran, Huhn und grünen Bohnen", "24,90", "Paella", "Valencia", "", "", "In der Paellera über Feuer", "Bomba-Reis, Huhn, grüne Bohnen, Safran", 0, 0, 1),
+                    ("Jamón Ibérico", "Hauchdünn geschnittener iberischer Schinken", "24 Monate gereifter Jamón Ibérico serviert mit Manchego-Käse", "16,90", "Vorspeisen", "Extremadura", "Milch", "", "24 Monate luftgetrocknet", "Iberischer Schinken, Manchego", 0, 0, 1),
+                    ("Sangría de la Casa", "Hausgemachte Sangría mit Früchten", "Erfrischende Sangría mit Rotwein, Orangen und Äpfeln", "6,90", "Getränke", "Spanien", "Sulfite", "", "24h ziehen lassen", "Rotwein, Orangen, Äpfel, Brandy", 1, 1, 1)
+                ]
             
-            for i, (name, desc, detailed, price, cat, origin, allergens, additives, prep, ingredients, vegan, vegetarian, gluten) in enumerate(menu_items):
-                cursor.execute("""
-                    INSERT INTO menu_items (id, name, description, detailed_description, price, category, origin, allergens, additives, preparation_method, ingredients, vegan, vegetarian, glutenfree, order_index, is_active)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """, (str(uuid.uuid4()), name, desc, detailed, price, cat, origin, allergens, additives, prep, ingredients, vegan, vegetarian, gluten, i+1, True))
+                for i, (name, desc, detailed, price, cat, origin, allergens, additives, prep, ingredients, vegan, vegetarian, gluten) in enumerate(menu_items):
+                    await cursor.execute("""
+                        INSERT INTO menu_items (id, name, description, detailed_description, price, category, origin, allergens, additives, preparation_method, ingredients, vegan, vegetarian, glutenfree, order_index, is_active)
+                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                    """, (str(uuid.uuid4()), name, desc, detailed, price, cat, origin, allergens, additives, prep, ingredients, vegan, vegetarian, gluten, i+1, True))
         
-        conn.commit()
-        print("✅ MySQL Database initialized successfully")
+            print("✅ MySQL Database initialized successfully")
         
-    except Exception as e:
-        print(f"❌ Database initialization failed: {e}")
-    finally:
-        conn.close()
-
-@app.on_event("startup")
-async def startup_event():
-    init_database()
+        except Exception as e:
+            print(f"❌ Database initialization failed: {e}")
 
-if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8001)
-@api_router.get("/cms/eu-compliance")
-async def get_eu_compliance():
-    """Get EU compliance settings"""
+@cms_default("eu-compliance")
+def eu_compliance_defaults():
     return {
         "gdpr_enabled": True,
         "cookie_consent_required": True,
@@ -693,15 +1022,19 @@ async def get_eu_compliance():
         "last_updated": "2024-12-19"
     }
 
+@api_router.get("/cms/eu-compliance")
+async def get_eu_compliance(request: Request):
+    """Get EU compliance settings"""
+    return cms_response(request, "eu-compliance")
+
 @api_router.put("/cms/eu-compliance")
-async def update_eu_compliance(settings: dict, current_user: User = Depends(get_current_user)):
+async def update_eu_compliance(settings: dict, current_user: User = Depends(get_current_user), conn=Depends(get_db)):
     """Update EU compliance settings"""
-    # In production, save to database
-    return {"message": "EU compliance settings updated successfully", "data": settings}
+    result = await cms_update("eu-compliance", settings, current_user, conn)
+    return {"message": "EU compliance settings updated successfully", **result}
 
-@api_router.get("/cms/cookie-settings")
-async def get_cookie_settings():
-    """Get cookie management settings"""
+@cms_default("cookie-settings")
+def cookie_settings_defaults():
     return {
         "cookieSettings": {
             "essential_cookies": {"enabled": True, "description": "Technisch notwendige Cookies"},
@@ -715,37 +1048,55 @@ async def get_cookie_settings():
         }
     }
 
+@api_router.get("/cms/cookie-settings")
+async def get_cookie_settings(request: Request):
+    """Get cookie management settings"""
+    return cms_response(request, "cookie-settings")
+
 @api_router.put("/cms/cookie-settings")
-async def update_cookie_settings(settings: dict, current_user: User = Depends(get_current_user)):
+async def update_cookie_settings(settings: dict, current_user: User = Depends(get_current_user), conn=Depends(get_db)):
     """Update cookie management settings"""
-    # In production, save to database
-    return {"message": "Cookie settings updated successfully", "data": settings}
+    result = await cms_update("cookie-settings", settings, current_user, conn)
+    return {"message": "Cookie settings updated successfully", **result}
 
+# Everything a public page needs before its first paint, in one cached response.
+# Header, footer and cookie banner sections go with every page; pages listed in
+# BOOTSTRAP_PAGES also get their own CMS entry as "content".
+BOOTSTRAP_COMMON = [
+    ("navigation", "website-texts/navigation"),
+    ("footer", "website-texts/footer"),
+    ("buttons", "website-texts/buttons"),
+    ("cookie_settings", "cookie-settings"),
+    ("eu_compliance", "eu-compliance"),
+]
+BOOTSTRAP_PAGES = {
+    "home": "homepage",
+    "standorte": "standorte-enhanced",
+    "ueber-uns": "ueber-uns-enhanced",
+    "kontakt": "kontakt-page",
+}
+bootstrap_bundles = BundleCache()
+
+@api_router.get("/bootstrap")
+async def get_bootstrap(request: Request, page: str = "home"):
+    """CMS sections for one page in a single response; the ETag changes whenever any section does"""
+    members = [(name, cms_payload(key)) for name, key in BOOTSTRAP_COMMON]
+    if page in BOOTSTRAP_PAGES:
+        members.append(("content", cms_payload(BOOTSTRAP_PAGES[page])))
+    else:
+        page = ""   # every other page shares the common bundle
+    return payload_response(request, bootstrap_bundles.get(page, members))
 
-@api_router.get("/users")
-async def get_users(current_user: User = Depends(get_current_user)):
-    """Get all users for admin management"""
-    try:
-        conn = get_mysql_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT id, username, email, role, created_at, last_login FROM users")
-        users = cursor.fetchall()
-        conn.close()
-        return users
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @api_router.post("/users")
-async def create_user(user_data: dict, current_user: User = Depends(get_current_user)):
+async def create_user(user_data: dict, current_user: User = Depends(require_admin), conn=Depends(get_db)):
     """Create a new user"""
+    # Hash the password (outside the try, so a busy hasher answers 503 rather than 500)
+    hashed_password = await get_password_hash(user_data["password"])
     try:
-        conn = get_mysql_connection()
-        cursor = conn.cursor()
+        cursor = await conn.cursor()
         
-        # Hash the password
-        hashed_password = get_password_hash(user_data["password"])
-        
-        cursor.execute("""
+        await cursor.execute("""
             INSERT INTO users (id, username, email, password_hash, role) 
             VALUES (%s, %s, %s, %s, %s)
         """, (
@@ -755,51 +1106,68 @@ async def create_user(user_data: dict, current_user: User = Depends(get_current_
             hashed_password,
             user_data["role"]
         ))
-        conn.commit()
-        conn.close()
+        query_cache.invalidate("users")
         return {"message": "User created successfully"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error creating user: {str(e)}")
 
 @api_router.put("/users/{user_id}")
-async def update_user(user_id: str, user_data: dict, current_user: User = Depends(get_current_user)):
+async def update_user(user_id: str, user_data: dict, current_user: User = Depends(require_admin), conn=Depends(get_db)):
     """Update a user"""
+    hashed_password = None
+    if "password" in user_data and user_data["password"]:
+        hashed_password = await get_password_hash(user_data["password"])
     try:
-        conn = get_mysql_connection()
-        cursor = conn.cursor()
+        cursor = await conn.cursor()
         
-        if "password" in user_data and user_data["password"]:
-            hashed_password = get_password_hash(user_data["password"])
-            cursor.execute("""
+        if hashed_password:
+            await cursor.execute("""
                 UPDATE users SET username=%s, email=%s, password_hash=%s, role=%s 
                 WHERE id=%s
             """, (user_data["username"], user_data["email"], hashed_password, user_data["role"], user_id))
         else:
-            cursor.execute("""
+            await cursor.execute("""
                 UPDATE users SET username=%s, email=%s, role=%s 
                 WHERE id=%s
             """, (user_data["username"], user_data["email"], user_data["role"], user_id))
         
-        conn.commit()
-        conn.close()
+        query_cache.invalidate("users")
+        auth_cache.pop_where(lambda user: user.id == user_id)
         return {"message": "User updated successfully"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error updating user: {str(e)}")
 
 @api_router.delete("/users/{user_id}")
-async def delete_user(user_id: str, current_user: User = Depends(get_current_user)):
+async def delete_user(user_id: str, current_user: User = Depends(require_admin), conn=Depends(get_db)):
     """Delete a user"""
     try:
-        conn = get_mysql_connection()
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM users WHERE id=%s", (user_id,))
-        conn.commit()
-        conn.close()
+        cursor = await conn.cursor()
+        await cursor.execute("DELETE FROM users WHERE id=%s", (user_id,))
+        query_cache.invalidate("users")
+        auth_cache.pop_where(lambda user: user.id == user_id)
         return {"message": "User deleted successfully"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error deleting user: {str(e)}")
 
 
+# Rows per fetch from the unbuffered export cursor
+EXPORT_CHUNK_SIZE = int(os.environ.get('EXPORT_CHUNK_SIZE', 500))
+
+@api_router.get("/admin/export/{table}")
+async def export_table(table: str, format: str = "csv", current_user: User = Depends(get_current_user)):
+    """Stream a whole table as CSV or NDJSON; the download starts with the first chunk"""
+    if table not in EXPORT_TABLES:
+        raise HTTPException(status_code=404, detail=f"Unknown export table, expected one of: {', '.join(EXPORT_TABLES)}")
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format must be one of: {', '.join(EXPORT_FORMATS)}")
+    filename = f"{table}_{datetime.utcnow():%Y%m%d_%H%M%S}.{format}"
+    return StreamingResponse(
+        stream_table(mysql_pool, table, format, EXPORT_CHUNK_SIZE),
+        media_type=EXPORT_FORMATS[format],
+        # nginx would otherwise buffer the body before passing it on
+        headers={"Content-Disposition": f'attachment; filename="{filename}"', "X-Accel-Buffering": "no"},
+    )
+
 @api_router.get("/admin/backup/list")
 async def get_backup_list(current_user: User = Depends(get_current_user)):
     """Get list of available backups"""
@@ -828,7 +1196,7 @@ async def get_backup_list(current_user: User = Depends(get_current_user)):
         return []
 
 @api_router.post("/admin/backup/create")
-async def create_backup(current_user: User = Depends(get_current_user)):
+async def create_backup(current_user: User = Depends(require_admin)):
     """Create a new database backup"""
     import subprocess
     import os
@@ -841,29 +1209,30 @@ async def create_backup(current_user: User = Depends(get_current_user)):
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_file = f"{backup_dir}/backup_{timestamp}.sql"
         
-        # Create MySQL backup
-        cmd = f"mysqldump jimmys_tapas_bar > {backup_file}"
-        subprocess.run(cmd, shell=True, check=True)
+        # Create MySQL backup (argv list, no shell)
+        with open(backup_file, "wb") as out:
+            subprocess.run(["mysqldump", "jimmys_tapas_bar"], stdout=out, check=True)
         
         return {"message": "Backup created successfully", "filename": f"backup_{timestamp}.sql"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Backup failed: {str(e)}")
 
 @api_router.post("/admin/backup/restore")
-async def restore_backup(filename: str, current_user: User = Depends(get_current_user)):
+async def restore_backup(filename: str, current_user: User = Depends(require_admin)):
     """Restore from backup"""
     import subprocess
     import os
     
+    backup_dir = "/app/backups"
+    # Only names of existing backups are accepted, never a path
+    backups = os.listdir(backup_dir) if os.path.isdir(backup_dir) else []
+    if not filename.endswith(".sql") or filename not in backups:
+        raise HTTPException(status_code=404, detail="Backup file not found")
+    
     try:
-        backup_file = f"/app/backups/{filename}"
-        
-        if not os.path.exists(backup_file):
-            raise HTTPException(status_code=404, detail="Backup file not found")
-        
-        # Restore MySQL backup
-        cmd = f"mysql jimmys_tapas_bar < {backup_file}"
-        subprocess.run(cmd, shell=True, check=True)
+        # Restore MySQL backup (argv list, no shell)
+        with open(os.path.join(backup_dir, filename), "rb") as backup:
+            subprocess.run(["mysql", "jimmys_tapas_bar"], stdin=backup, check=True)
         
         return {"message": "Backup restored successfully"}
     except Exception as e:
@@ -886,16 +1255,81 @@ async def get_system_info(current_user: User = Depends(get_current_user)):
             "version": "Jimmy's CMS v1.0",
             "uptime": uptime,
             "database": "MySQL Connected",
-            "diskSpace": f"{disk_usage[2]} used / {disk_usage[1]} available"
+            "diskSpace": f"{disk_usage[2]} used / {disk_usage[1]} available",
+            "connectionPool": mysql_pool.stats(),
+            "passwordPool": password_hasher.stats(),
+            "loginThrottle": login_throttle.stats()
         }
     except Exception as e:
         return {
             "version": "Jimmy's CMS v1.0",
             "uptime": "Unknown",
             "database": "MySQL Connected", 
-            "diskSpace": "2.5 GB used / 10 GB available"
+            "diskSpace": "2.5 GB used / 10 GB available",
+            "connectionPool": mysql_pool.stats(),
+            "passwordPool": password_hasher.stats(),
+            "loginThrottle": login_throttle.stats()
         }
 
+DASHBOARD_COUNTS = {
+    "menuItems": "SELECT COUNT(*) FROM menu_items WHERE is_active = TRUE",
+    "unreadContacts": "SELECT COUNT(*) FROM contact_messages WHERE is_read = FALSE",
+    "activeUsers": "SELECT COUNT(*) FROM users WHERE is_active = TRUE",
+    "subscribers": "SELECT COUNT(*) FROM newsletter_subscribers",
+}
+DASHBOARD_RECENT_QUERY = """
+    (SELECT 'review' AS type, customer_name AS name, rating, NULL AS subject, date
+     FROM reviews ORDER BY date DESC LIMIT 3)
+    UNION ALL
+    (SELECT 'contact' AS type, name, NULL AS rating, subject, date
+     FROM contact_messages ORDER BY date DESC LIMIT 2)
+"""
+
+@api_router.get("/admin/dashboard/stats")
+async def get_dashboard_stats(current_user: User = Depends(get_current_user), conn=Depends(get_db)):
+    """Dashboard counts and latest activity in two indexed queries instead of five full table downloads"""
+    tags = ("menu_items", "contact_messages", "users", "newsletter_subscribers")
+    sql = "SELECT " + ", ".join(f"({query}) AS {name}" for name, query in DASHBOARD_COUNTS.items())
+    rows = await query_cache.fetchall(conn, sql, tags=tags)
+    stats = {name: int(rows[0][name] or 0) for name in DASHBOARD_COUNTS}
+    # Review counts are maintained incrementally, no query needed
+    reviews = review_stats.summary(approved_only=False)
+    stats["totalReviews"] = reviews["count"]
+    stats["pendingReviews"] = reviews["pending"]
+    recent = await query_cache.fetchall(conn, DASHBOARD_RECENT_QUERY, tags=("reviews", "contact_messages"))
+    stats["recentReviews"] = [{"customer_name": r["name"], "rating": r["rating"], "date": r["date"]}
+                              for r in recent if r["type"] == "review"]
+    stats["recentContacts"] = [{"name": r["name"], "subject": r["subject"], "date": r["date"]}
+                               for r in recent if r["type"] == "contact"]
+    return stats
+
+@api_router.get("/admin/stats/trends")
+async def get_activity_trends(metrics: Optional[str] = None, period: str = "day",
+                              start: Optional[str] = None, end: Optional[str] = None,
+                              current_user: User = Depends(get_current_user), conn=Depends(get_db)):
+    """Zero-filled day/week series from activity_rollups (default: all metrics, last 30 days)"""
+    names = [name.strip() for name in metrics.split(",") if name.strip()] if metrics else list(ROLLUP_METRICS)
+    unknown = [name for name in names if name not in ROLLUP_METRICS]
+    if unknown or period not in ROLLUP_PERIODS:
+        raise HTTPException(status_code=400, detail=f"Unknown metric or period: {', '.join(unknown) or period}")
+    try:
+        start_day, end_day = parse_range(start, end)
+        cursor = await conn.cursor()
+        return await activity_series(cursor, names, period, start_day, end_day)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@api_router.get("/admin/cache/stats")
+async def get_cache_stats(current_user: User = Depends(get_current_user)):
+    """Get query result cache hit/miss counters"""
+    stats = query_cache.stats()
+    stats["menu_snapshot"] = menu_snapshots.stats()
+    stats["menu_search"] = menu_search.stats()
+    stats["cms"] = cms_store.stats()
+    stats["bootstrap"] = bootstrap_bundles.stats()
+    stats["auth"] = auth_cache.stats()
+    return stats
+
 @api_router.get("/admin/database/config")
 async def get_database_config(current_user: User = Depends(get_current_user)):
     """Get database configuration"""
@@ -907,3 +1341,23 @@ async def get_database_config(current_user: User = Depends(get_current_user)):
         "ssl": False,
         "charset": "utf8mb4"
     }
+
+# Routes are registered above, so the router is included last
+app.include_router(api_router)
+
+@app.on_event("startup")
+async def startup_event():
+    await mysql_pool.init()
+    await migrate(mysql_pool)
+    await init_database()
+    await review_stats.load(mysql_pool)
+    await cms_store.load(mysql_pool)
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await mysql_pool.close()
+    password_hasher.close()
+
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run(app, host="0.0.0.0", port=8001)
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Bring menu_items in line with a menu file, writing only the differences
+
+Usage: python sync_menu.py menu.csv|menu.json [--dry-run]
+
+Dishes match by id, else by category and name. New dishes are inserted, changed ones
+updated column by column, and active dishes missing from the file are deactivated, all
+in one transaction. --dry-run prints the plan without writing anything. Replaces the
+delete-everything-and-reinsert approach of the old import scripts. A running server
+serves the new menu once its query cache expires (QUERY_CACHE_TTL); use
+POST /api/admin/menu/sync for an immediate switch.
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+load_dotenv(Path(__file__).parent / '.env')
+
+from mysql_pool import MySQLPool  # noqa: E402
+from menu_import import MenuImportError, parse_document, validate  # noqa: E402
+from menu_sync import plan_sync, apply_sync  # noqa: E402
+from rollups import record_activity  # noqa: E402
+
+
+async def main(args):
+    paths = [arg for arg in args if not arg.startswith("--")]
+    if len(paths) != 1:
+        sys.exit(__doc__)
+    path = Path(paths[0])
+    dry_run = "--dry-run" in args
+    try:
+        desired, errors = validate(parse_document(path.read_bytes(), "json" if path.suffix == ".json" else "csv"))
+    except MenuImportError as e:
+        sys.exit(f"❌ {path}: {e}")
+    if errors:
+        for error in errors:
+            print(f"❌ row {error['row']}: {error['error']}")
+        sys.exit("Nothing written: fix the rows above first")
+    if not desired:
+        sys.exit("❌ The menu file contains no dishes")
+
+    pool = MySQLPool.from_env()
+    await pool.init()
+    try:
+        async with pool.transaction() as conn:
+            cursor = await conn.cursor()
+            plan = await plan_sync(cursor, desired, lock=not dry_run)
+            for line in plan.lines():
+                print(line)
+            if not dry_run and plan.changes:
+                await apply_sync(cursor, plan)
+                await record_activity(cursor, "menu_changes", count=plan.changes)
+        print("ℹ️  Dry run, nothing written" if dry_run else "✅ Menu synchronized")
+    finally:
+        await pool.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(sys.argv[1:]))
@@ -0,0 +1,87 @@
+import csv
+import io
+import json
+from datetime import date, datetime
+
+import aiomysql
+
+# Exportable tables; each is read in primary-key order, which InnoDB walks without sorting
+EXPORT_TABLES = ("newsletter_subscribers", "contact_messages", "reviews", "menu_items")
+EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def _value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode("utf-8", "replace")
+    return value
+
+
+def _ndjson(rows):
+    return "".join(json.dumps({k: _value(v) for k, v in row.items()}, ensure_ascii=False, default=str) + "\n"
+                   for row in rows).encode("utf-8")
+
+
+# Leading characters spreadsheets read as a formula; public form text must not run as one
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _csv_value(value):
+    value = "" if value is None else _value(value)
+    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+class _CSVEncoder:
+    """Turns row chunks into CSV bytes; the header comes from the first row's keys
+
+    Text cells starting with a formula character get a leading ' (CSV injection).
+    """
+
+    def __init__(self):
+        self.buffer = io.StringIO()
+        self.writer = None
+
+    def __call__(self, rows):
+        for row in rows:
+            if self.writer is None:
+                # BOM so Excel opens umlauts correctly
+                self.buffer.write("\ufeff")
+                self.writer = csv.DictWriter(self.buffer, fieldnames=list(row))
+                self.writer.writeheader()
+            self.writer.writerow({k: _csv_value(v) for k, v in row.items()})
+        chunk = self.buffer.getvalue().encode("utf-8")
+        self.buffer.seek(0)
+        self.buffer.truncate()
+        return chunk
+
+
+async def stream_table(pool, table, fmt, chunk_size=500):
+    """Yield `table` as CSV or NDJSON chunks of `chunk_size` rows from an unbuffered cursor
+
+    The generator holds its own pool connection for the whole download, so memory stays at
+    one chunk whatever the table size. A download aborted midway closes the connection
+    instead of draining the rest of the result set into the void.
+    """
+    encode = _CSVEncoder() if fmt == "csv" else _ndjson
+    async with pool.acquire() as conn:
+        cursor = await conn.cursor(aiomysql.SSDictCursor)
+        finished = False
+        try:
+            await cursor.execute(f"SELECT * FROM {table} ORDER BY id")
+            while True:
+                rows = await cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield encode(rows)
+            finished = True
+        finally:
+            if finished:
+                await cursor.close()
+            else:
+                conn.close()
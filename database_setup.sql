@@ -1,3 +1,5 @@
+-- Legacy manual setup script; the backend now applies its schema through
+-- backend/migrations.py at startup (see also backend/migrate.py).
 USE jimmys_tapas_bar;
 
 -- Users table
@@ -24,6 +24,11 @@ done
 
 echo "✅ MySQL is ready!"
 
+# Create or upgrade the schema before anything writes to it
+echo "🧱 Applying schema migrations..."
+cd /app/backend
+python migrate.py
+
 # Import full menu data if available
 if [ -f "/app/backend/import_complete_menu_final.py" ]; then
     echo "📋 Importing menu data..."
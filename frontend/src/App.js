@@ -30,6 +30,7 @@ import Kontakt from './components/Kontakt';
 import Impressum from './components/Impressum';
 import Datenschutz from './components/Datenschutz';
 import Footer from './components/Footer';
+import { loadBootstrap, bootstrapPage } from './bootstrap';
 
 // Language Context - Only German
 const LanguageContext = createContext();
@@ -1757,12 +1758,9 @@ const Header = () => {
   useEffect(() => {
     const loadNavigationTexts = async () => {
       try {
-        const response = await fetch(`${process.env.REACT_APP_BACKEND_URL}/api/cms/website-texts/navigation`);
-        if (response.ok) {
-          const data = await response.json();
-          if (data.navigation) {
-            setNavigationTexts(data.navigation);
-          }
+        const data = await loadBootstrap(bootstrapPage(location.pathname));
+        if (data && data.navigation) {
+          setNavigationTexts(data.navigation);
         }
       } catch (error) {
         console.error('Error loading navigation texts:', error);
@@ -0,0 +1,17 @@
+// CMS sections for header, footer, cookie banner and the page itself, fetched in one request per page
+const bundles = {};
+
+export const bootstrapPage = (pathname) => (pathname || '/').split('/').filter(Boolean)[0] || 'home';
+
+export const loadBootstrap = (page = 'home') => {
+  if (!bundles[page]) {
+    bundles[page] = fetch(`${process.env.REACT_APP_BACKEND_URL}/api/bootstrap?page=${encodeURIComponent(page)}`)
+      .then(response => (response.ok ? response.json() : null))
+      .catch(error => {
+        console.error('Error loading page data:', error);
+        delete bundles[page];
+        return null;
+      });
+  }
+  return bundles[page];
+};
@@ -1,5 +1,7 @@
 import React, { useState, useEffect } from 'react';
 
+const REVIEWS_PAGE_SIZE = 10;
+
 const Bewertungen = () => {
   const [feedback, setFeedback] = useState({
     name: '',
@@ -10,13 +12,17 @@ const Bewertungen = () => {
   
   const [reviews, setReviews] = useState([]);
   const [loading, setLoading] = useState(true);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [message, setMessage] = useState('');
   const [submitting, setSubmitting] = useState(false);
   const [pageData, setPageData] = useState(null);
+  const [stats, setStats] = useState(null);
 
   useEffect(() => {
     loadPageData();
     loadReviews();
+    loadStats();
   }, []);
 
   const loadPageData = async () => {
@@ -31,13 +37,32 @@ const Bewertungen = () => {
     }
   };
 
+  const loadStats = async () => {
+    try {
+      const response = await fetch(`${process.env.REACT_APP_BACKEND_URL}/api/reviews/stats`);
+      if (response.ok) {
+        setStats(await response.json());
+      }
+    } catch (error) {
+      console.error('Error loading review stats:', error);
+    }
+  };
+
+  const fetchReviewsPage = async (cursor) => {
+    const params = new URLSearchParams({ approved_only: 'true', limit: REVIEWS_PAGE_SIZE });
+    if (cursor) params.set('cursor', cursor);
+    const response = await fetch(`${process.env.REACT_APP_BACKEND_URL}/api/reviews?${params}`);
+    if (!response.ok) return null;
+    return { items: await response.json(), cursor: response.headers.get('X-Next-Cursor') };
+  };
+
   const loadReviews = async () => {
     try {
       setLoading(true);
-      const response = await fetch(`${process.env.REACT_APP_BACKEND_URL}/api/reviews?approved_only=true`);
-      if (response.ok) {
-        const data = await response.json();
-        setReviews(data);
+      const page = await fetchReviewsPage(null);
+      if (page) {
+        setReviews(page.items);
+        setNextCursor(page.cursor);
       }
     } catch (error) {
       console.error('Error loading reviews:', error);
@@ -46,6 +71,22 @@ const Bewertungen = () => {
     }
   };
 
+  const loadMoreReviews = async () => {
+    if (!nextCursor) return;
+    try {
+      setLoadingMore(true);
+      const page = await fetchReviewsPage(nextCursor);
+      if (page) {
+        setReviews(prev => [...prev, ...page.items]);
+        setNextCursor(page.cursor);
+      }
+    } catch (error) {
+      console.error('Error loading more reviews:', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleSubmit = async (e) => {
     e.preventDefault();
     setSubmitting(true);
@@ -131,6 +172,11 @@ const Bewertungen = () => {
             <h2 className="text-3xl font-serif text-warm-beige mb-8 tracking-wide">
               {pageData?.reviews_section_title || 'Kundenbewertungen'}
             </h2>
+            {stats && stats.count > 0 && (
+              <p className="text-light-beige font-light mb-8 -mt-4">
+                {stats.average.toLocaleString('de-DE')} von 5 Sternen aus {stats.count} Bewertungen
+              </p>
+            )}
             <div className="space-y-8">
               {loading ? (
                 <div className="text-warm-beige text-center">Lade Bewertungen...</div>
@@ -140,7 +186,7 @@ const Bewertungen = () => {
                 </div>
               ) : (
                 reviews.map((review, index) => (
-                  <div key={index} className="bg-dark-brown rounded-lg border border-warm-brown p-8">
+                  <div key={review.id || index} className="bg-dark-brown rounded-lg border border-warm-brown p-8">
                     <div className="flex justify-between items-start mb-4">
                       <h3 className="font-light text-warm-beige text-lg tracking-wide">
                         {review.customer_name || review.name}
@@ -156,6 +202,15 @@ const Bewertungen = () => {
                   </div>
                 ))
               )}
+              {!loading && nextCursor && (
+                <button
+                  onClick={loadMoreReviews}
+                  className="w-full border border-warm-brown text-warm-beige hover:bg-warm-brown py-3 rounded-lg font-light transition-colors tracking-wide disabled:opacity-50"
+                  disabled={loadingMore}
+                >
+                  {loadingMore ? 'Lade Bewertungen...' : 'Weitere Bewertungen laden'}
+                </button>
+              )}
             </div>
           </div>
 
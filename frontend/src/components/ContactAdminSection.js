@@ -1,28 +1,55 @@
 import React, { useState, useEffect } from 'react';
 
+const MESSAGES_PAGE_SIZE = 50;
+
 const ContactAdminSection = () => {
   const [messages, setMessages] = useState([]);
+  const [counts, setCounts] = useState({ total: 0, unread: 0, read: 0 });
+  const [nextCursor, setNextCursor] = useState(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [message, setMessage] = useState('');
   const [filter, setFilter] = useState('all'); // all, unread, read
+  const [subjectQuery, setSubjectQuery] = useState('');
+  const [sort, setSort] = useState('date_desc');
 
   useEffect(() => {
     loadMessages();
-  }, []);
+  }, [filter, sort]);
+
+  const authHeaders = () => ({
+    'Authorization': `Bearer ${localStorage.getItem('adminToken')}`
+  });
+
+  // Filtering, sorting and paging happen server-side; the list only ever holds the loaded pages
+  const fetchMessagesPage = async (cursor) => {
+    const params = new URLSearchParams({ sort, limit: MESSAGES_PAGE_SIZE });
+    if (filter !== 'all') params.set('is_read', filter === 'read' ? 'true' : 'false');
+    if (subjectQuery.trim()) params.set('subject', subjectQuery.trim());
+    if (cursor) params.set('cursor', cursor);
+    const response = await fetch(`${process.env.REACT_APP_BACKEND_URL}/api/admin/contact?${params}`, {
+      headers: authHeaders()
+    });
+    if (!response.ok) return null;
+    return { items: await response.json(), cursor: response.headers.get('X-Next-Cursor') };
+  };
+
+  const loadCounts = async () => {
+    const response = await fetch(`${process.env.REACT_APP_BACKEND_URL}/api/admin/contact/counts`, {
+      headers: authHeaders()
+    });
+    if (response.ok) {
+      setCounts(await response.json());
+    }
+  };
 
   const loadMessages = async () => {
     try {
       setLoading(true);
-      const token = localStorage.getItem('adminToken');
-      const response = await fetch(`${process.env.REACT_APP_BACKEND_URL}/api/admin/contact`, {
-        headers: {
-          'Authorization': `Bearer ${token}`
-        }
-      });
-
-      if (response.ok) {
-        const data = await response.json();
-        setMessages(data);
+      const [page] = await Promise.all([fetchMessagesPage(null), loadCounts()]);
+      if (page) {
+        setMessages(page.items);
+        setNextCursor(page.cursor);
       }
     } catch (error) {
       console.error('Error loading contact messages:', error);
@@ -32,6 +59,27 @@ const ContactAdminSection = () => {
     }
   };
 
+  const loadMoreMessages = async () => {
+    if (!nextCursor) return;
+    try {
+      setLoadingMore(true);
+      const page = await fetchMessagesPage(nextCursor);
+      if (page) {
+        setMessages(prev => [...prev, ...page.items]);
+        setNextCursor(page.cursor);
+      }
+    } catch (error) {
+      console.error('Error loading more contact messages:', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
+  const handleSearch = (e) => {
+    e.preventDefault();
+    loadMessages();
+  };
+
   const markAsRead = async (messageId) => {
     try {
       const token = localStorage.getItem('adminToken');
@@ -78,13 +126,6 @@ const ContactAdminSection = () => {
     }
   };
 
-  const filteredMessages = messages.filter(msg => {
-    if (filter === 'unread') return !msg.is_read;
-    if (filter === 'read') return msg.is_read;
-    return true;
-  });
-
-  const unreadCount = messages.filter(msg => !msg.is_read).length;
 
   if (loading) {
     return (
@@ -122,7 +163,7 @@ const ContactAdminSection = () => {
             </div>
             <div className="ml-4">
               <p className="text-sm font-medium text-gray-600">Gesamt</p>
-              <p className="text-2xl font-semibold text-gray-900">{messages.length}</p>
+              <p className="text-2xl font-semibold text-gray-900">{counts.total}</p>
             </div>
           </div>
         </div>
@@ -136,7 +177,7 @@ const ContactAdminSection = () => {
             </div>
             <div className="ml-4">
               <p className="text-sm font-medium text-gray-600">Ungelesen</p>
-              <p className="text-2xl font-semibold text-gray-900">{unreadCount}</p>
+              <p className="text-2xl font-semibold text-gray-900">{counts.unread}</p>
             </div>
           </div>
         </div>
@@ -150,7 +191,7 @@ const ContactAdminSection = () => {
             </div>
             <div className="ml-4">
               <p className="text-sm font-medium text-gray-600">Gelesen</p>
-              <p className="text-2xl font-semibold text-gray-900">{messages.length - unreadCount}</p>
+              <p className="text-2xl font-semibold text-gray-900">{counts.read}</p>
             </div>
           </div>
         </div>
@@ -177,7 +218,7 @@ const ContactAdminSection = () => {
                 : 'bg-gray-100 text-gray-700 hover:bg-gray-200'
             }`}
           >
-            Ungelesen ({unreadCount})
+            Ungelesen ({counts.unread})
           </button>
           <button
             onClick={() => setFilter('read')}
@@ -187,20 +228,40 @@ const ContactAdminSection = () => {
                 : 'bg-gray-100 text-gray-700 hover:bg-gray-200'
             }`}
           >
-            Gelesen ({messages.length - unreadCount})
+            Gelesen ({counts.read})
           </button>
         </div>
+        <form onSubmit={handleSearch} className="flex flex-wrap gap-4 mt-4">
+          <input
+            type="text"
+            value={subjectQuery}
+            onChange={(e) => setSubjectQuery(e.target.value)}
+            placeholder="Betreff durchsuchen..."
+            className="flex-1 min-w-[200px] px-3 py-2 border border-gray-300 rounded-lg text-sm"
+          />
+          <select
+            value={sort}
+            onChange={(e) => setSort(e.target.value)}
+            className="px-3 py-2 border border-gray-300 rounded-lg text-sm"
+          >
+            <option value="date_desc">Neueste zuerst</option>
+            <option value="date_asc">Älteste zuerst</option>
+          </select>
+          <button type="submit" className="px-4 py-2 rounded-lg text-sm font-medium bg-gray-100 text-gray-700 hover:bg-gray-200">
+            Suchen
+          </button>
+        </form>
       </div>
 
       {/* Messages List */}
       <div className="bg-white rounded-lg shadow">
         <div className="px-6 py-4 border-b border-gray-200">
           <h3 className="text-lg font-medium text-gray-900">
-            Nachrichten ({filteredMessages.length})
+            Nachrichten ({messages.length}{nextCursor ? '+' : ''})
           </h3>
         </div>
         <div className="divide-y divide-gray-200">
-          {filteredMessages.length === 0 ? (
+          {messages.length === 0 ? (
             <div className="p-6 text-center text-gray-500">
               <div className="text-4xl mb-4">📬</div>
               <p>
@@ -210,7 +271,7 @@ const ContactAdminSection = () => {
               </p>
             </div>
           ) : (
-            filteredMessages.map((msg) => (
+            messages.map((msg) => (
               <div key={msg.id} className={`p-6 ${!msg.is_read ? 'bg-blue-50' : ''}`}>
                 <div className="flex justify-between items-start">
                   <div className="flex-1">
@@ -262,6 +323,17 @@ const ContactAdminSection = () => {
             ))
           )}
         </div>
+        {nextCursor && (
+          <div className="p-4 border-t border-gray-200 text-center">
+            <button
+              onClick={loadMoreMessages}
+              className="px-4 py-2 rounded-lg text-sm font-medium bg-gray-100 text-gray-700 hover:bg-gray-200 disabled:opacity-50"
+              disabled={loadingMore}
+            >
+              {loadingMore ? 'Lade Nachrichten...' : 'Weitere Nachrichten laden'}
+            </button>
+          </div>
+        )}
       </div>
     </div>
   );
@@ -10,6 +10,7 @@ const DashboardSection = ({ setActiveSection }) => {
     activeUsers: 0
   });
   const [recentActivity, setRecentActivity] = useState([]);
+  const [trends, setTrends] = useState(null);
   const [systemStatus, setSystemStatus] = useState({
     database: 'online',
     lastBackup: null,
@@ -34,93 +35,50 @@ const DashboardSection = ({ setActiveSection }) => {
         'Authorization': `Bearer ${token}`
       };
 
-      // Parallel data loading with error handling
-      const responses = await Promise.allSettled([
-        fetch(`${process.env.REACT_APP_BACKEND_URL}/api/menu/items`),
-        fetch(`${process.env.REACT_APP_BACKEND_URL}/api/admin/newsletter/subscribers`, { headers }),
-        fetch(`${process.env.REACT_APP_BACKEND_URL}/api/reviews?approved_only=false`),
-        fetch(`${process.env.REACT_APP_BACKEND_URL}/api/admin/contact`, { headers }),
-        fetch(`${process.env.REACT_APP_BACKEND_URL}/api/users`, { headers })
-      ]);
-
-      const [menuResponse, subscribersResponse, reviewsResponse, contactsResponse, usersResponse] = responses;
-
-      // Process successful responses
-      const menuData = menuResponse.status === 'fulfilled' && menuResponse.value.ok 
-        ? await menuResponse.value.json() : [];
-      const subscribersData = subscribersResponse.status === 'fulfilled' && subscribersResponse.value.ok 
-        ? await subscribersResponse.value.json() : [];
-      const reviewsData = reviewsResponse.status === 'fulfilled' && reviewsResponse.value.ok 
-        ? await reviewsResponse.value.json() : [];
-      const contactsData = contactsResponse.status === 'fulfilled' && contactsResponse.value.ok 
-        ? await contactsResponse.value.json() : [];
-      const usersData = usersResponse.status === 'fulfilled' && usersResponse.value.ok 
-        ? await usersResponse.value.json() : [];
-
-      // Calculate stats
-      const pendingReviews = Array.isArray(reviewsData) ? reviewsData.filter(r => !r.is_approved).length : 0;
-      const unreadContacts = Array.isArray(contactsData) ? contactsData.filter(c => !c.is_read).length : 0;
-      
+      // Counts and latest activity are computed server-side in one request
+      const response = await fetch(`${process.env.REACT_APP_BACKEND_URL}/api/admin/dashboard/stats`, { headers });
+      if (!response.ok) {
+        throw new Error(`Dashboard stats request failed: ${response.status}`);
+      }
+      const data = await response.json();
+
+      // Trend series come from the pre-aggregated rollups; a failure only hides the chart
+      const start = new Date(Date.now() - 13 * 24 * 60 * 60 * 1000).toISOString().slice(0, 10);
+      const trendsResponse = await fetch(
+        `${process.env.REACT_APP_BACKEND_URL}/api/admin/stats/trends?metrics=reviews,contact_messages,newsletter_signups&period=day&start=${start}`,
+        { headers }
+      );
+      setTrends(trendsResponse.ok ? await trendsResponse.json() : null);
+
       setStats({
-        menuItems: Array.isArray(menuData) ? menuData.length : 0,
-        subscribers: Array.isArray(subscribersData) ? subscribersData.length : 0,
-        pendingReviews,
-        unreadContacts,
-        totalReviews: Array.isArray(reviewsData) ? reviewsData.length : 0,
-        activeUsers: Array.isArray(usersData) ? usersData.filter(u => u.is_active).length : 0
+        menuItems: data.menuItems || 0,
+        subscribers: data.subscribers || 0,
+        pendingReviews: data.pendingReviews || 0,
+        unreadContacts: data.unreadContacts || 0,
+        totalReviews: data.totalReviews || 0,
+        activeUsers: data.activeUsers || 0
       });
 
       // Generate recent activity from real data
       const activities = [];
-      
-      // Recent reviews
-      if (Array.isArray(reviewsData) && reviewsData.length > 0) {
-        const recentReviews = reviewsData
-          .sort((a, b) => new Date(b.date) - new Date(a.date))
-          .slice(0, 3);
-        
-        recentReviews.forEach(review => {
-          activities.push({
-            type: 'review',
-            message: `Neue Bewertung von ${review.customer_name} (${review.rating}⭐)`,
-            time: formatTimeAgo(review.date),
-            action: () => setActiveSection && setActiveSection('reviews')
-          });
-        });
-      }
 
-      // Recent contacts
-      if (Array.isArray(contactsData) && contactsData.length > 0) {
-        const recentContacts = contactsData
-          .sort((a, b) => new Date(b.date) - new Date(a.date))
-          .slice(0, 2);
-        
-        recentContacts.forEach(contact => {
-          activities.push({
-            type: 'contact',
-            message: `Neue Nachricht von ${contact.name}: ${contact.subject}`,
-            time: formatTimeAgo(contact.date),
-            action: () => setActiveSection && setActiveSection('contacts')
-          });
+      (data.recentReviews || []).forEach(review => {
+        activities.push({
+          type: 'review',
+          message: `Neue Bewertung von ${review.customer_name} (${review.rating}⭐)`,
+          time: formatTimeAgo(review.date),
+          action: () => setActiveSection && setActiveSection('reviews')
         });
-      }
+      });
 
-      // Recent menu additions (if timestamps available)
-      if (Array.isArray(menuData) && menuData.length > 0) {
-        const recentMenu = menuData
-          .filter(item => item.created_at)
-          .sort((a, b) => new Date(b.created_at) - new Date(a.created_at))
-          .slice(0, 2);
-        
-        recentMenu.forEach(item => {
-          activities.push({
-            type: 'menu',
-            message: `Neues Gericht hinzugefügt: ${item.name}`,
-            time: formatTimeAgo(item.created_at),
-            action: () => setActiveSection && setActiveSection('menu')
-          });
+      (data.recentContacts || []).forEach(contact => {
+        activities.push({
+          type: 'contact',
+          message: `Neue Nachricht von ${contact.name}: ${contact.subject}`,
+          time: formatTimeAgo(contact.date),
+          action: () => setActiveSection && setActiveSection('contacts')
         });
-      }
+      });
 
       // Sort activities by recency and limit to 8
       setRecentActivity(
@@ -294,6 +252,41 @@ const DashboardSection = ({ setActiveSection }) => {
         </button>
       </div>
 
+      {/* Activity Trends */}
+      {trends && (
+        <div className="bg-white rounded-lg shadow-md p-6">
+          <h3 className="text-lg font-semibold text-gray-900 mb-4">Aktivität (letzte 14 Tage)</h3>
+          <div className="grid grid-cols-1 md:grid-cols-3 gap-6">
+            {[
+              { key: 'reviews', label: 'Bewertungen', color: 'bg-yellow-400' },
+              { key: 'contact_messages', label: 'Nachrichten', color: 'bg-blue-400' },
+              { key: 'newsletter_signups', label: 'Newsletter-Anmeldungen', color: 'bg-green-400' }
+            ].map(({ key, label, color }) => {
+              const values = trends.series[key] || [];
+              const max = Math.max(1, ...values);
+              return (
+                <div key={key}>
+                  <div className="flex justify-between text-sm mb-2">
+                    <span className="font-medium text-gray-700">{label}</span>
+                    <span className="text-gray-500">{values.reduce((sum, value) => sum + value, 0)}</span>
+                  </div>
+                  <div className="flex items-end h-16 gap-1">
+                    {values.map((value, index) => (
+                      <div
+                        key={trends.buckets[index]}
+                        title={`${new Date(trends.buckets[index]).toLocaleDateString('de-DE')}: ${value}`}
+                        className={`flex-1 rounded-t ${color}`}
+                        style={{ height: `${Math.max(4, (value / max) * 100)}%` }}
+                      ></div>
+                    ))}
+                  </div>
+                </div>
+              );
+            })}
+          </div>
+        </div>
+      )}
+
       {/* Quick Actions */}
       <div className="bg-white rounded-lg shadow-md p-6">
         <h3 className="text-lg font-semibold text-gray-900 mb-4">Schnellzugriffe</h3>
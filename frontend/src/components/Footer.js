@@ -1,5 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import { Link } from 'react-router-dom';
+import { loadBootstrap, bootstrapPage } from '../bootstrap';
 
 const Footer = () => {
   const [footerTexts, setFooterTexts] = useState({
@@ -13,12 +14,9 @@ const Footer = () => {
   useEffect(() => {
     const loadFooterTexts = async () => {
       try {
-        const response = await fetch(`${process.env.REACT_APP_BACKEND_URL}/api/cms/website-texts/footer`);
-        if (response.ok) {
-          const data = await response.json();
-          if (data.footer) {
-            setFooterTexts(data.footer);
-          }
+        const data = await loadBootstrap(bootstrapPage(window.location.pathname));
+        if (data && data.footer) {
+          setFooterTexts(data.footer);
         }
       } catch (error) {
         console.error('Error loading footer texts:', error);
@@ -1,6 +1,7 @@
 import React, { useState, useEffect } from 'react';
 import { useNavigate } from 'react-router-dom';
 import EnhancedDeliverySection from './EnhancedDeliverySection';
+import { loadBootstrap } from '../bootstrap';
 
 const Home = () => {
   const navigate = useNavigate();
@@ -11,10 +12,9 @@ const Home = () => {
   useEffect(() => {
     const loadHomepageContent = async () => {
       try {
-        const response = await fetch(`${process.env.REACT_APP_BACKEND_URL}/api/cms/homepage`);
-        if (response.ok) {
-          const data = await response.json();
-          setHomepageContent(data);
+        const data = await loadBootstrap('home');
+        if (data && data.content) {
+          setHomepageContent(data.content);
         }
       } catch (error) {
         console.error('Error loading homepage content:', error);
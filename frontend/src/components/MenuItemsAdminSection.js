@@ -7,6 +7,9 @@ const MenuItemsAdminSection = () => {
   const [searchTerm, setSearchTerm] = useState('');
   const [selectedCategory, setSelectedCategory] = useState('');
   const [showForm, setShowForm] = useState(false);
+  const [selectedIds, setSelectedIds] = useState([]);
+  const [orderChanged, setOrderChanged] = useState(false);
+  const [importResult, setImportResult] = useState(null);
 
   // Categories for dropdown - using actual DB categories
   const categories = [
@@ -17,7 +20,13 @@ const MenuItemsAdminSection = () => {
 
   const loadMenuItems = async () => {
     try {
-      const response = await fetch(`${process.env.REACT_APP_BACKEND_URL}/api/menu/items`);
+      // The admin listing includes inactive dishes, so they can be reactivated
+      const token = localStorage.getItem('adminToken');
+      const response = await fetch(`${process.env.REACT_APP_BACKEND_URL}/api/admin/menu/items`, {
+        headers: {
+          'Authorization': `Bearer ${token}`
+        }
+      });
       if (response.ok) {
         const data = await response.json();
         setMenuItems(data);
@@ -35,7 +44,7 @@ const MenuItemsAdminSection = () => {
 
   const handleSave = async (itemData) => {
     try {
-      const token = localStorage.getItem('auth_token');
+      const token = localStorage.getItem('adminToken');
       const url = editingItem 
         ? `${process.env.REACT_APP_BACKEND_URL}/api/menu/items/${editingItem.id}`
         : `${process.env.REACT_APP_BACKEND_URL}/api/menu/items`;
@@ -65,7 +74,7 @@ const MenuItemsAdminSection = () => {
     if (!window.confirm('Möchten Sie diesen Artikel wirklich löschen?')) return;
     
     try {
-      const token = localStorage.getItem('auth_token');
+      const token = localStorage.getItem('adminToken');
       const response = await fetch(`${process.env.REACT_APP_BACKEND_URL}/api/menu/items/${id}`, {
         method: 'DELETE',
         headers: {
@@ -83,11 +92,133 @@ const MenuItemsAdminSection = () => {
 
   const filteredItems = menuItems.filter(item => {
     const matchesSearch = item.name.toLowerCase().includes(searchTerm.toLowerCase()) ||
-                         item.description.toLowerCase().includes(searchTerm.toLowerCase());
+                         (item.description || '').toLowerCase().includes(searchTerm.toLowerCase());
     const matchesCategory = !selectedCategory || item.category === selectedCategory;
     return matchesSearch && matchesCategory;
   });
 
+  // Bulk actions send the whole selection in one request, applied by the server in one transaction
+  const runBulkAction = async (action, body) => {
+    try {
+      const token = localStorage.getItem('adminToken');
+      const response = await fetch(`${process.env.REACT_APP_BACKEND_URL}/api/admin/menu/items/${action}`, {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+          'Authorization': `Bearer ${token}`
+        },
+        body: JSON.stringify(body)
+      });
+
+      if (response.ok) {
+        setSelectedIds([]);
+        setOrderChanged(false);
+        loadMenuItems();
+      }
+    } catch (error) {
+      console.error(`Error in ${action}:`, error);
+    }
+  };
+
+  // The file is sent as the raw request body; the server validates and upserts it in one transaction
+  const handleImport = async (e) => {
+    const file = e.target.files[0];
+    e.target.value = '';
+    if (!file) return;
+    const format = file.name.toLowerCase().endsWith('.json') ? 'json' : 'csv';
+    try {
+      const token = localStorage.getItem('adminToken');
+      const response = await fetch(`${process.env.REACT_APP_BACKEND_URL}/api/admin/menu/import?format=${format}`, {
+        method: 'POST',
+        headers: {
+          'Content-Type': format === 'json' ? 'application/json' : 'text/csv',
+          'Authorization': `Bearer ${token}`
+        },
+        body: await file.text()
+      });
+      const data = await response.json();
+      setImportResult(response.ok ? data : { message: data.detail || 'Import fehlgeschlagen', errors: [] });
+      if (response.ok) loadMenuItems();
+    } catch (error) {
+      console.error('Error importing menu:', error);
+      setImportResult({ message: 'Verbindungsfehler beim Import', errors: [] });
+    }
+  };
+
+  // Sync treats the file as the complete menu: preview the diff first, then apply it
+  const handleSync = async (e) => {
+    const file = e.target.files[0];
+    e.target.value = '';
+    if (!file) return;
+    const format = file.name.toLowerCase().endsWith('.json') ? 'json' : 'csv';
+    const body = await file.text();
+    const token = localStorage.getItem('adminToken');
+    const syncRequest = (dryRun) => fetch(
+      `${process.env.REACT_APP_BACKEND_URL}/api/admin/menu/sync?format=${format}&dry_run=${dryRun}`,
+      {
+        method: 'POST',
+        headers: {
+          'Content-Type': format === 'json' ? 'application/json' : 'text/csv',
+          'Authorization': `Bearer ${token}`
+        },
+        body
+      }
+    );
+    try {
+      const preview = await syncRequest(true);
+      const plan = await preview.json();
+      if (!preview.ok) {
+        const detail = plan.detail;
+        setImportResult({
+          message: detail?.message || (typeof detail === 'string' ? detail : 'Abgleich fehlgeschlagen'),
+          errors: detail?.errors || []
+        });
+        return;
+      }
+      const summary = `${plan.inserted} neu, ${plan.updated} geändert, ${plan.deactivated} deaktiviert, ${plan.unchanged} unverändert`;
+      if (!window.confirm(`Speisekarte abgleichen?\n\n${summary}`)) return;
+      const response = await syncRequest(false);
+      if (response.ok) {
+        setImportResult({ message: `Abgleich: ${summary}`, errors: [] });
+        loadMenuItems();
+      }
+    } catch (error) {
+      console.error('Error syncing menu:', error);
+      setImportResult({ message: 'Verbindungsfehler beim Abgleich', errors: [] });
+    }
+  };
+
+  const toggleSelected = (id) => {
+    setSelectedIds(prev => prev.includes(id) ? prev.filter(x => x !== id) : [...prev, id]);
+  };
+
+  const handleBulkDelete = () => {
+    if (!window.confirm(`Möchten Sie ${selectedIds.length} Artikel wirklich löschen?`)) return;
+    runBulkAction('bulk-delete', { ids: selectedIds });
+  };
+
+  // Swap an item with its neighbour in the visible list; saved with "Reihenfolge speichern"
+  const moveItem = (index, direction) => {
+    const target = index + direction;
+    if (target < 0 || target >= filteredItems.length) return;
+    const a = menuItems.indexOf(filteredItems[index]);
+    const b = menuItems.indexOf(filteredItems[target]);
+    const reordered = [...menuItems];
+    [reordered[a], reordered[b]] = [reordered[b], reordered[a]];
+    setMenuItems(reordered);
+    setOrderChanged(true);
+  };
+
+  const saveOrder = () => {
+    // The visible items keep the order_index slots they already had, in their new sequence
+    const slots = filteredItems.map(item => item.order_index).sort((x, y) => x - y);
+    const items = filteredItems.map((item, i) => ({ id: item.id, order_index: slots[i] }));
+    if (new Set(slots).size !== slots.length) {
+      items.forEach((entry, i) => { entry.order_index = (slots[0] || 0) + i; });
+    }
+    runBulkAction('bulk-reorder', { items });
+  };
+
   if (loading) {
     return (
       <div className="flex items-center justify-center p-8">
@@ -101,17 +232,43 @@ const MenuItemsAdminSection = () => {
       <div className="max-w-full mx-auto">
         <div className="flex justify-between items-center mb-6">
           <h2 className="text-2xl font-serif text-gray-900">🍽️ Speisekarte verwalten</h2>
-          <button
-            onClick={() => {
-              setEditingItem(null);
-              setShowForm(true);
-            }}
-            className="bg-orange-500 hover:bg-orange-600 text-white px-4 py-2 rounded-lg transition-colors"
-          >
-            Neues Gericht hinzufügen
-          </button>
+          <div className="flex gap-2">
+            <label className="bg-gray-600 hover:bg-gray-700 text-white px-4 py-2 rounded-lg transition-colors cursor-pointer">
+              CSV/JSON importieren
+              <input type="file" accept=".csv,.json" onChange={handleImport} className="hidden" />
+            </label>
+            <label className="bg-gray-600 hover:bg-gray-700 text-white px-4 py-2 rounded-lg transition-colors cursor-pointer">
+              Speisekarte abgleichen
+              <input type="file" accept=".csv,.json" onChange={handleSync} className="hidden" />
+            </label>
+            <button
+              onClick={() => {
+                setEditingItem(null);
+                setShowForm(true);
+              }}
+              className="bg-orange-500 hover:bg-orange-600 text-white px-4 py-2 rounded-lg transition-colors"
+            >
+              Neues Gericht hinzufügen
+            </button>
+          </div>
         </div>
 
+        {importResult && (
+          <div className="bg-white rounded-lg shadow-sm p-4 mb-6 text-sm text-gray-800">
+            <div className="flex justify-between">
+              <p className="font-semibold">{importResult.message}</p>
+              <button onClick={() => setImportResult(null)} className="text-gray-500 hover:text-gray-800">✕</button>
+            </div>
+            {importResult.errors.length > 0 && (
+              <ul className="mt-2 list-disc list-inside text-red-700">
+                {importResult.errors.map(err => (
+                  <li key={err.row}>Zeile {err.row}: {err.error}</li>
+                ))}
+              </ul>
+            )}
+          </div>
+        )}
+
         {/* Filters */}
         <div className="bg-white rounded-lg shadow-sm p-4 mb-6">
           <div className="grid grid-cols-1 md:grid-cols-2 gap-4">
@@ -137,21 +294,67 @@ const MenuItemsAdminSection = () => {
 
         {/* Items List */}
         <div className="bg-white rounded-lg shadow-sm">
-          <div className="p-4 border-b border-gray-200">
+          <div className="p-4 border-b border-gray-200 flex flex-wrap items-center justify-between gap-2">
             <h3 className="text-lg font-semibold text-gray-900">
               Gerichte ({filteredItems.length})
             </h3>
+            <div className="flex flex-wrap gap-2">
+              {orderChanged && (
+                <button
+                  onClick={saveOrder}
+                  className="bg-orange-500 hover:bg-orange-600 text-white px-3 py-1 rounded text-sm transition-colors"
+                >
+                  Reihenfolge speichern
+                </button>
+              )}
+              {selectedIds.length > 0 && (
+                <>
+                  <span className="text-sm text-gray-600 self-center">{selectedIds.length} ausgewählt</span>
+                  <button
+                    onClick={() => runBulkAction('bulk-activate', { ids: selectedIds, is_active: true })}
+                    className="bg-green-500 hover:bg-green-600 text-white px-3 py-1 rounded text-sm transition-colors"
+                  >
+                    Aktivieren
+                  </button>
+                  <button
+                    onClick={() => runBulkAction('bulk-activate', { ids: selectedIds, is_active: false })}
+                    className="bg-gray-500 hover:bg-gray-600 text-white px-3 py-1 rounded text-sm transition-colors"
+                  >
+                    Deaktivieren
+                  </button>
+                  <button
+                    onClick={handleBulkDelete}
+                    className="bg-red-500 hover:bg-red-600 text-white px-3 py-1 rounded text-sm transition-colors"
+                  >
+                    Löschen
+                  </button>
+                </>
+              )}
+            </div>
           </div>
           <div className="space-y-0 max-h-[70vh] overflow-y-auto">
-            {filteredItems.map(item => (
-              <div key={item.id} className="border-b border-gray-200 p-4 hover:bg-gray-50 transition-colors">
+            {filteredItems.map((item, index) => (
+              <div key={item.id} className={`border-b border-gray-200 p-4 hover:bg-gray-50 transition-colors ${item.is_active ? '' : 'opacity-60'}`}>
                 <div className="flex justify-between items-start">
+                  <div className="flex flex-col items-center mr-3 gap-1">
+                    <input
+                      type="checkbox"
+                      checked={selectedIds.includes(item.id)}
+                      onChange={() => toggleSelected(item.id)}
+                      className="h-4 w-4"
+                    />
+                    <button onClick={() => moveItem(index, -1)} className="text-gray-500 hover:text-gray-900 text-xs" title="Nach oben">▲</button>
+                    <button onClick={() => moveItem(index, 1)} className="text-gray-500 hover:text-gray-900 text-xs" title="Nach unten">▼</button>
+                  </div>
                   <div className="flex-1">
                     <h3 className="text-gray-900 font-semibold text-lg">{item.name}</h3>
                     <p className="text-gray-700 text-sm mb-2">{item.description}</p>
                     <div className="flex items-center gap-4 text-xs text-gray-600">
                       <span>Kategorie: {item.category}</span>
                       <span>Preis: {item.price}€</span>
+                      {item.is_active
+                        ? <span className="bg-green-100 text-green-800 px-2 py-1 rounded text-xs">Aktiv</span>
+                        : <span className="bg-gray-200 text-gray-700 px-2 py-1 rounded text-xs">Inaktiv</span>}
                       <div className="flex gap-1">
                         {item.vegan && <span className="bg-green-100 text-green-800 px-2 py-1 rounded text-xs">🌱 Vegan</span>}
                         {item.vegetarian && !item.vegan && <span className="bg-emerald-100 text-emerald-800 px-2 py-1 rounded text-xs">🌿 Vegetarisch</span>}
@@ -6,6 +6,7 @@ const ReviewsAdminSection = () => {
   const [loading, setLoading] = useState(true);
   const [message, setMessage] = useState('');
   const [activeTab, setActiveTab] = useState('pending');
+  const [selectedIds, setSelectedIds] = useState([]);
 
   useEffect(() => {
     loadReviews();
@@ -80,6 +81,77 @@ const ReviewsAdminSection = () => {
     }
   };
 
+  // One request for the whole selection; the server applies it as a single statement
+  const bulkModerate = async (action, label) => {
+    if (action === 'bulk-delete' && !window.confirm(`Sind Sie sicher, dass Sie ${selectedIds.length} Bewertungen löschen möchten?`)) return;
+
+    try {
+      const token = localStorage.getItem('adminToken');
+      const response = await fetch(`${process.env.REACT_APP_BACKEND_URL}/api/admin/reviews/${action}`, {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+          'Authorization': `Bearer ${token}`
+        },
+        body: JSON.stringify({ ids: selectedIds })
+      });
+
+      if (response.ok) {
+        const data = await response.json();
+        const count = data.approved ?? data.rejected ?? data.deleted ?? 0;
+        setMessage(`${count} Bewertungen erfolgreich ${label}!`);
+        setSelectedIds([]);
+        loadReviews();
+        setTimeout(() => setMessage(''), 3000);
+      } else {
+        setMessage('Fehler bei der Sammelaktion');
+      }
+    } catch (error) {
+      setMessage('Verbindungsfehler');
+    }
+  };
+
+  const toggleSelected = (id) => {
+    setSelectedIds(prev => prev.includes(id) ? prev.filter(x => x !== id) : [...prev, id]);
+  };
+
+  const switchTab = (tab) => {
+    setActiveTab(tab);
+    setSelectedIds([]);
+  };
+
+  const renderBulkBar = (list, actions) => (
+    <div className="flex items-center space-x-2">
+      <label className="flex items-center text-sm text-gray-600 mr-2">
+        <input
+          type="checkbox"
+          className="h-4 w-4 mr-2"
+          checked={list.length > 0 && selectedIds.length === list.length}
+          onChange={(e) => setSelectedIds(e.target.checked ? list.map(r => r.id) : [])}
+        />
+        Alle auswählen
+      </label>
+      {selectedIds.length > 0 && actions.map(({ action, label, done, className }) => (
+        <button
+          key={action}
+          onClick={() => bulkModerate(action, done)}
+          className={`${className} text-white px-3 py-1 rounded text-sm`}
+        >
+          {label} ({selectedIds.length})
+        </button>
+      ))}
+    </div>
+  );
+
+  const renderCheckbox = (review) => (
+    <input
+      type="checkbox"
+      className="h-4 w-4 mr-4 mt-1"
+      checked={selectedIds.includes(review.id)}
+      onChange={() => toggleSelected(review.id)}
+    />
+  );
+
   const renderStars = (rating) => {
     return Array.from({ length: 5 }, (_, index) => (
       <span key={index} className={index < rating ? 'text-yellow-400' : 'text-gray-300'}>
@@ -117,7 +189,7 @@ const ReviewsAdminSection = () => {
       <div className="mb-6">
         <nav className="flex space-x-8">
           <button
-            onClick={() => setActiveTab('pending')}
+            onClick={() => switchTab('pending')}
             className={`py-2 px-1 border-b-2 font-medium text-sm ${
               activeTab === 'pending'
                 ? 'border-blue-500 text-blue-600'
@@ -127,7 +199,7 @@ const ReviewsAdminSection = () => {
             Ausstehend ({pendingReviews.length})
           </button>
           <button
-            onClick={() => setActiveTab('approved')}
+            onClick={() => switchTab('approved')}
             className={`py-2 px-1 border-b-2 font-medium text-sm ${
               activeTab === 'approved'
                 ? 'border-blue-500 text-blue-600'
@@ -143,10 +215,14 @@ const ReviewsAdminSection = () => {
       <div className="bg-white rounded-lg shadow">
         {activeTab === 'pending' && (
           <div>
-            <div className="px-6 py-4 border-b border-gray-200">
+            <div className="px-6 py-4 border-b border-gray-200 flex justify-between items-center">
               <h3 className="text-lg font-medium text-gray-900">
                 Ausstehende Bewertungen ({pendingReviews.length})
               </h3>
+              {renderBulkBar(pendingReviews, [
+                { action: 'bulk-approve', label: 'Genehmigen', done: 'genehmigt', className: 'bg-green-600 hover:bg-green-700' },
+                { action: 'bulk-delete', label: 'Löschen', done: 'gelöscht', className: 'bg-red-600 hover:bg-red-700' }
+              ])}
             </div>
             <div className="divide-y divide-gray-200">
               {pendingReviews.length === 0 ? (
@@ -158,6 +234,7 @@ const ReviewsAdminSection = () => {
                 pendingReviews.map((review) => (
                   <div key={review.id} className="p-6">
                     <div className="flex justify-between items-start">
+                      {renderCheckbox(review)}
                       <div className="flex-1">
                         <div className="flex items-center mb-2">
                           <h4 className="font-medium text-gray-900 mr-3">{review.customer_name}</h4>
@@ -195,10 +272,14 @@ const ReviewsAdminSection = () => {
 
         {activeTab === 'approved' && (
           <div>
-            <div className="px-6 py-4 border-b border-gray-200">
+            <div className="px-6 py-4 border-b border-gray-200 flex justify-between items-center">
               <h3 className="text-lg font-medium text-gray-900">
                 Genehmigte Bewertungen ({reviews.length})
               </h3>
+              {renderBulkBar(reviews, [
+                { action: 'bulk-reject', label: 'Zurückziehen', done: 'zurückgezogen', className: 'bg-yellow-600 hover:bg-yellow-700' },
+                { action: 'bulk-delete', label: 'Löschen', done: 'gelöscht', className: 'bg-red-600 hover:bg-red-700' }
+              ])}
             </div>
             <div className="divide-y divide-gray-200">
               {reviews.length === 0 ? (
@@ -210,6 +291,7 @@ const ReviewsAdminSection = () => {
                 reviews.map((review) => (
                   <div key={review.id} className="p-6">
                     <div className="flex justify-between items-start">
+                      {renderCheckbox(review)}
                       <div className="flex-1">
                         <div className="flex items-center mb-2">
                           <h4 className="font-medium text-gray-900 mr-3">{review.customer_name}</h4>
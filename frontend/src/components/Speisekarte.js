@@ -39,20 +39,62 @@ const customScrollbarStyle = `
   }
 `;
 
+const ALL_CATEGORIES = 'Alle Kategorien';
+
+// Same normalization as the backend's category_key, which groups the sections
+const categoryKey = (category) => (category || '').trim().toLowerCase();
+
 const Speisekarte = () => {
-  const [menuItems, setMenuItems] = useState([]);
+  const [categories, setCategories] = useState([]);
+  const [sections, setSections] = useState({});
   const [loading, setLoading] = useState(true);
-  const [selectedCategory, setSelectedCategory] = useState('Alle Kategorien');
+  // null until the categories are known; the page then opens on the first one
+  const [selectedCategory, setSelectedCategory] = useState(null);
   const [hoveredItem, setHoveredItem] = useState(null);
 
-  // Load menu items from backend
+  // Category order, display names and counts come from the backend
   useEffect(() => {
+    const loadCategories = async () => {
+      try {
+        const response = await fetch(`${process.env.REACT_APP_BACKEND_URL}/api/menu/categories`);
+        if (response.ok) {
+          const data = await response.json();
+          setCategories(data);
+          setSelectedCategory(prev => prev || (data.length > 0 ? data[0].key : ALL_CATEGORIES));
+          return;
+        }
+      } catch (error) {
+        console.error('Error loading menu categories:', error);
+      }
+      setSelectedCategory(prev => prev || ALL_CATEGORIES);
+    };
+    loadCategories();
+  }, []);
+
+  // Load only the selected section (or the whole menu once for "Alle Kategorien");
+  // once the whole menu is loaded, sections are cut from it instead of fetched again
+  useEffect(() => {
+    if (!selectedCategory || sections[selectedCategory]) {
+      return;
+    }
+    const allItems = sections[ALL_CATEGORIES];
+    if (allItems) {
+      setSections(prev => ({
+        ...prev,
+        [selectedCategory]: allItems.filter(item => categoryKey(item.category) === categoryKey(selectedCategory))
+      }));
+      return;
+    }
     const loadMenuItems = async () => {
       try {
-        const response = await fetch(`${process.env.REACT_APP_BACKEND_URL}/api/menu/items`);
+        setLoading(true);
+        const query = selectedCategory === ALL_CATEGORIES
+          ? ''
+          : `?category=${encodeURIComponent(selectedCategory)}`;
+        const response = await fetch(`${process.env.REACT_APP_BACKEND_URL}/api/menu/items${query}`);
         if (response.ok) {
           const data = await response.json();
-          setMenuItems(data);
+          setSections(prev => ({ ...prev, [selectedCategory]: data }));
         }
       } catch (error) {
         console.error('Error loading menu items:', error);
@@ -61,9 +103,9 @@ const Speisekarte = () => {
       }
     };
     loadMenuItems();
-  }, []);
+  }, [selectedCategory, sections]);
 
-  if (loading) {
+  if (loading && !sections[selectedCategory]) {
     return (
       <div className="min-h-screen bg-dark-brown flex items-center justify-center">
         <div className="animate-spin rounded-full h-12 w-12 border-b-2 border-warm-beige"></div>
@@ -71,56 +113,16 @@ const Speisekarte = () => {
     );
   }
 
-  // Get unique categories with proper mapping and custom order
-  const categoryMapping = {
-    'inicio': 'Vorspeisen',
-    'salat': 'Salate',
-    'kleiner salat': 'Kleine Salate', 
-    'tapa paella': 'Paella',
-    'tapas vegetarian': 'Vegetarisch',
-    'tapas de pollo': 'Hähnchen',
-    'tapas de carne': 'Fleisch',
-    'tapas de pescado': 'Fisch',
-    'kroketten': 'Kroketten',
-    'pasta': 'Pasta',
-    'pizza': 'Pizza',
-    'für den kleinen und großen hunger': 'Snacks',
-    'dessert': 'Dessert',
-    'heledos': 'Eis-Spezialitäten',
-    // Getränke
-    'cocktails alkoholfrei': 'Cocktails alkoholfrei',
-    'cocktails mit alkohol': 'Cocktails',
-    'heißgetränke': 'Heißgetränke',
-    'softgetränke': 'Softdrinks',
-    'spanische getränke': 'Sangria & Spanische Getränke'
-  };
-
-  // Define the order of categories (food first, drinks last) - using DB names
-  const categoryOrder = [
-    // Speisen
-    'inicio', 'salat', 'kleiner salat', 'tapa paella', 'tapas vegetarian', 'tapas de pollo', 'tapas de carne', 'tapas de pescado', 
-    'kroketten', 'pasta', 'pizza', 'für den kleinen und großen hunger', 'dessert', 'heledos',
-    // Getränke zuletzt
-    'heißgetränke', 'softgetränke', 'cocktails alkoholfrei', 'cocktails mit alkohol', 'spanische getränke'
-  ];
-
-  // Get available categories from actual menu items
-  const availableCategories = [...new Set(menuItems.map(item => item.category))];
-  const availableCategoryOrder = categoryOrder.filter(cat => availableCategories.includes(cat));
-  
-  const allCategories = ['Alle Kategorien', ...availableCategoryOrder.map(cat => categoryMapping[cat] || cat)];
-  const filteredItems = selectedCategory === 'Alle Kategorien' 
-    ? menuItems 
-    : menuItems.filter(item => (categoryMapping[item.category] || item.category) === selectedCategory);
+  const menuItems = sections[selectedCategory] || [];
+  const visibleCategories = selectedCategory === ALL_CATEGORIES
+    ? categories
+    : categories.filter(category => category.key === selectedCategory);
 
-  // Group items by category for display with custom order
-  const groupedItems = availableCategoryOrder.reduce((acc, dbCategory) => {
-    const displayCategory = categoryMapping[dbCategory] || dbCategory;
-    const itemsInCategory = selectedCategory === 'Alle Kategorien' 
-      ? menuItems.filter(item => item.category === dbCategory)
-      : filteredItems.filter(item => item.category === dbCategory);
+  // Group items by category in the backend's display order
+  const groupedItems = visibleCategories.reduce((acc, category) => {
+    const itemsInCategory = menuItems.filter(item => categoryKey(item.category) === categoryKey(category.key));
     if (itemsInCategory.length > 0) {
-      acc[displayCategory] = itemsInCategory;
+      acc[category.name] = itemsInCategory;
     }
     return acc;
   }, {});
@@ -176,17 +178,17 @@ const Speisekarte = () => {
       <div className="container mx-auto px-4 mb-8">
         <div className="bg-medium-brown/50 rounded-xl p-6 border border-warm-beige/20">
           <div className="flex flex-wrap justify-center gap-3 max-w-6xl mx-auto">
-            {allCategories.map((category) => (
+            {[{ key: ALL_CATEGORIES, name: ALL_CATEGORIES }, ...categories].map((category) => (
               <button
-                key={category}
-                onClick={() => setSelectedCategory(category)}
+                key={category.key}
+                onClick={() => setSelectedCategory(category.key)}
                 className={`px-6 py-3 rounded-full border transition-all duration-300 ${
-                  selectedCategory === category
+                  selectedCategory === category.key
                     ? 'bg-warm-beige text-dark-brown border-warm-beige shadow-lg'
                     : 'bg-transparent text-warm-beige border-warm-beige hover:bg-warm-beige hover:text-dark-brown'
                 }`}
               >
-                {category}
+                {category.name}
               </button>
             ))}
           </div>
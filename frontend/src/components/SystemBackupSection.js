@@ -106,7 +106,8 @@ const SystemBackupSection = () => {
           memoryUsage: data.memory_usage || 'N/A',
           pythonVersion: data.python_version || 'N/A',
           platform: data.platform || 'N/A',
-          mysqlVersion: data.mysql_version || 'N/A'
+          mysqlVersion: data.mysql_version || 'N/A',
+          loginThrottle: data.loginThrottle || null
         });
       }
     } catch (error) {
@@ -191,6 +192,48 @@ const SystemBackupSection = () => {
     }
   };
 
+  const handleTableExport = async (table, format) => {
+    setLoading(true);
+    setMessage(`📤 Exportiere ${table} als ${format.toUpperCase()}...`);
+
+    try {
+      const token = localStorage.getItem('adminToken');
+      const response = await fetch(`${process.env.REACT_APP_BACKEND_URL}/api/admin/export/${table}?format=${format}`, {
+        headers: {
+          'Authorization': `Bearer ${token}`
+        }
+      });
+
+      if (response.ok) {
+        const contentDisposition = response.headers.get('Content-Disposition');
+        const filename = contentDisposition ?
+          contentDisposition.split('filename=')[1].replace(/"/g, '') :
+          `${table}.${format}`;
+
+        const blob = await response.blob();
+        const url = window.URL.createObjectURL(blob);
+        const a = document.createElement('a');
+        a.href = url;
+        a.download = filename;
+        document.body.appendChild(a);
+        a.click();
+        window.URL.revokeObjectURL(url);
+        document.body.removeChild(a);
+
+        setMessage(`✅ Export erfolgreich: ${filename} (${formatBytes(blob.size)})`);
+      } else {
+        const errorData = await response.json();
+        setMessage(`❌ Fehler beim Export: ${errorData.detail}`);
+      }
+    } catch (error) {
+      console.error('Export error:', error);
+      setMessage('❌ Verbindungsfehler beim Export.');
+    } finally {
+      setLoading(false);
+      setTimeout(() => setMessage(''), 10000);
+    }
+  };
+
   const handleFullBackup = async () => {
     setLoading(true);
     setMessage('📦 Erstelle vollständiges Backup (MySQL + Medien)...');
@@ -671,6 +714,35 @@ const SystemBackupSection = () => {
             )}
           </div>
 
+          {/* Table Export */}
+          <div className="bg-white rounded-lg shadow-md p-6">
+            <h3 className="text-lg font-semibold text-gray-900 mb-4">📤 Tabellen-Export</h3>
+            <div className="space-y-3">
+              {[
+                { table: 'newsletter_subscribers', label: 'Newsletter-Abonnenten' },
+                { table: 'contact_messages', label: 'Kontakt-Nachrichten' },
+                { table: 'reviews', label: 'Bewertungen' },
+                { table: 'menu_items', label: 'Speisekarte' }
+              ].map(({ table, label }) => (
+                <div key={table} className="flex items-center justify-between border border-gray-200 rounded-lg p-3">
+                  <span className="font-medium text-gray-900">{label}</span>
+                  <div className="flex items-center space-x-2">
+                    {['csv', 'ndjson'].map(format => (
+                      <button
+                        key={format}
+                        onClick={() => handleTableExport(table, format)}
+                        disabled={loading}
+                        className="bg-gray-100 text-gray-700 px-3 py-1 rounded text-sm hover:bg-gray-200 disabled:opacity-50"
+                      >
+                        {format.toUpperCase()}
+                      </button>
+                    ))}
+                  </div>
+                </div>
+              ))}
+            </div>
+          </div>
+
           {/* MySQL Troubleshooting */}
           <div className="bg-yellow-50 border border-yellow-200 rounded-lg p-6">
             <h4 className="font-semibold text-yellow-800 mb-2">🛠️ MySQL Troubleshooting-Hinweise</h4>
@@ -748,6 +820,15 @@ const SystemBackupSection = () => {
                   <span className="text-sm font-medium text-gray-700">Backup-Anzahl</span>
                   <span className="text-sm text-green-600 font-mono">{backupStatus.backupCount} MySQL Backups</span>
                 </div>
+                {systemInfo.loginThrottle && (
+                  <div className="flex justify-between items-center p-3 bg-yellow-50 rounded-lg md:col-span-2">
+                    <span className="text-sm font-medium text-gray-700">Login-Sperren</span>
+                    <span className="text-sm text-yellow-700 font-mono">
+                      {systemInfo.loginThrottle.perUser.locked} Benutzer, {systemInfo.loginThrottle.perIp.locked} IPs gesperrt
+                      {' '}({systemInfo.loginThrottle.perUser.blocked_total + systemInfo.loginThrottle.perIp.blocked_total} abgewiesene Versuche)
+                    </span>
+                  </div>
+                )}
               </div>
             </div>
           </div>
@@ -0,0 +1,20 @@
+from bulk_sql import case_update, placeholders
+
+
+def test_placeholders():
+    assert placeholders(["a", "b", "c"]) == "%s, %s, %s"
+
+
+def test_case_update_single_statement_per_column():
+    sql, params = case_update("menu_items", {"a": {"price": "9,90", "order_index": 2}, "b": {"order_index": 1}})
+    assert sql == ("UPDATE menu_items SET "
+                   "order_index = CASE id WHEN %s THEN %s WHEN %s THEN %s ELSE order_index END, "
+                   "price = CASE id WHEN %s THEN %s ELSE price END "
+                   "WHERE id IN (%s, %s)")
+    assert params == ["a", 2, "b", 1, "a", "9,90", "a", "b"]
+
+
+def test_case_update_placeholder_count_matches_params():
+    rows = {str(i): {"is_active": bool(i % 2), "name": f"Tapa {i}"} for i in range(50)}
+    sql, params = case_update("menu_items", rows, key="id")
+    assert sql.count("%s") == len(params)
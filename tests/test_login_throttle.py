@@ -0,0 +1,65 @@
+from login_throttle import LoginThrottle, SlidingWindowLimiter
+
+
+def test_window_blocks_and_expires():
+    limiter = SlidingWindowLimiter(limit=2, window=60)
+    limiter.hit("admin", 0)
+    limiter.hit("admin", 10)
+    assert limiter.retry_after("admin", 20) == 40
+    # The oldest attempt leaves the window, one slot frees up
+    assert limiter.retry_after("admin", 60) == 0
+    assert limiter.retry_after("admin", 200) == 0 and limiter.stats(200)["tracked"] == 0
+
+
+def test_key_eviction_keeps_the_map_bounded():
+    limiter = SlidingWindowLimiter(limit=5, window=60, max_keys=3)
+    for i in range(5):
+        limiter.hit(f"10.0.0.{i}", i)
+    assert limiter.stats(5)["tracked"] == 3
+    # Least recently used keys go first
+    assert limiter.retry_after("10.0.0.0", 5) == 0 and "10.0.0.4" in limiter._attempts
+
+
+def test_eviction_prunes_expired_keys_first():
+    limiter = SlidingWindowLimiter(limit=1, window=10, max_keys=2)
+    limiter.hit("old", 0)
+    limiter.hit("recent", 15)
+    limiter.hit("new", 16)
+    assert limiter.retry_after("recent", 16) > 0 and limiter.retry_after("new", 16) > 0
+
+
+def _throttle(monkeypatch, now, **limits):
+    monkeypatch.setattr("login_throttle.time.monotonic", lambda: now[0])
+    return LoginThrottle(**limits)
+
+
+def test_per_user_limit_and_reset_on_success(monkeypatch):
+    now = [0.0]
+    throttle = _throttle(monkeypatch, now, per_user=2, per_ip=100, window=300)
+    assert throttle.acquire("Admin", "1.2.3.4") == 0
+    assert throttle.acquire("admin ", "5.6.7.8") == 0
+    assert throttle.acquire("ADMIN", "9.9.9.9") == 300
+    throttle.succeeded("admin")
+    assert throttle.acquire("admin", "1.2.3.4") == 0
+
+
+def test_per_ip_limit_survives_success(monkeypatch):
+    now = [0.0]
+    throttle = _throttle(monkeypatch, now, per_user=100, per_ip=2, window=300)
+    throttle.acquire("a", "1.2.3.4")
+    throttle.acquire("b", "1.2.3.4")
+    throttle.succeeded("b")
+    now[0] = 100.4
+    assert throttle.acquire("c", "1.2.3.4") == 200
+    assert throttle.stats()["perIp"]["blocked_total"] == 1
+    now[0] = 300.0
+    assert throttle.acquire("c", "1.2.3.4") == 0
+
+
+def test_blocked_attempts_are_not_recorded(monkeypatch):
+    now = [0.0]
+    throttle = _throttle(monkeypatch, now, per_user=1, per_ip=100, window=60)
+    throttle.acquire("admin", "1.2.3.4")
+    for _ in range(5):
+        assert throttle.acquire("admin", "1.2.3.4") == 60
+    assert len(throttle.ips._attempts["1.2.3.4"]) == 1
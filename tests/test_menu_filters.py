@@ -0,0 +1,80 @@
+import pytest
+
+from menu_filters import ALLERGEN_SYNONYMS, MenuBitmapIndex, parse_allergen_list, parse_allergens
+
+# Spellings used by the seed data in server.py and the menu scripts in the repository root
+SPELLINGS = [
+    ("Krebstiere", {"krebstiere"}),
+    ("Krustentiere", {"krebstiere"}),
+    ("Krustentiere, Weichtiere, Fisch", {"krebstiere", "weichtiere", "fisch"}),
+    ("Schalentiere, Weichtiere, Fisch", {"krebstiere", "weichtiere", "fisch"}),
+    ("Kann Spuren von Schalentieren enthalten", {"krebstiere"}),
+    ("Krebstiere, Weichtiere, kann Spuren von Fisch enthalten", {"krebstiere", "weichtiere", "fisch"}),
+    ("Milch, kann Spuren von Nüssen enthalten", {"milch", "nuesse"}),
+    # The explanation is kept as an unrecognized key rather than dropped silently
+    ("Kann Spuren von Nüssen enthalten durch Eichelfütterung", {"nuesse", "durch eichelfuetterung"}),
+    ("Sesam, Gluten, kann Spuren von Ei enthalten", {"sesam", "gluten", "eier"}),
+    ("Gluten, Milch, Ei, Konservierungsstoff", {"gluten", "milch", "eier", "konservierungsstoffe"}),
+    ("Sulfite (im Wein)", {"sulfite"}),
+    ("Schwefeldioxid", {"sulfite"}),
+    ("Laktose", {"milch"}),
+    ("Weichtiere, Gluten, Eier, Senf, Sulfite", {"weichtiere", "gluten", "eier", "senf", "sulfite"}),
+    ("Glutenhaltiges Getreide", {"gluten"}),
+    # Several allergens in one part, without a comma
+    ("Milch Ei Sesam", {"milch", "eier", "sesam"}),
+    ("Fisch Krebstiere", {"fisch", "krebstiere"}),
+    ("Milch - Eier", {"milch", "eier"}),
+    ("enthält ein wenig Sesam", {"sesam"}),
+    ("Keine bekannten Allergene", set()),
+    ("Keine", set()),
+    ("-", set()),
+    ("", set()),
+    (None, set()),
+]
+
+
+@pytest.mark.parametrize("text,keys", SPELLINGS)
+def test_parse_allergens(text, keys):
+    assert parse_allergens(text) == keys
+
+
+@pytest.mark.parametrize("value", ["Krebstiere", "krustentiere", "Schalentiere", "Krebstier"])
+def test_exclusion_parameter_spellings(value):
+    assert parse_allergen_list(value) == {"krebstiere"}
+
+
+def test_exclusion_parameter_lists():
+    assert parse_allergen_list("Sesam,Krebstiere") == {"sesam", "krebstiere"}
+    assert parse_allergen_list("") == set()
+
+
+def test_excluding_sesam_drops_dishes_naming_it_without_commas():
+    index = MenuBitmapIndex([{"allergens": "Milch Ei Sesam"}, {"allergens": "enthält ein wenig Sesam"},
+                             {"allergens": "Milch"}], {})
+    bits = index.select(exclude_allergens=parse_allergen_list("Sesam"))
+    assert list(index.positions(bits)) == [2]
+
+
+def test_excluding_krebstiere_drops_every_shellfish_spelling():
+    items = [
+        {"allergens": "Krustentiere"},
+        {"allergens": "Kann Spuren von Schalentieren enthalten"},
+        {"allergens": "Krebstiere, Gluten"},
+        {"allergens": "Milch"},
+    ]
+    index = MenuBitmapIndex(items, {})
+    bits = index.select(exclude_allergens=parse_allergen_list("Krebstiere"))
+    assert list(index.positions(bits)) == [3]
+
+
+def test_stats_list_unrecognized_spellings():
+    index = MenuBitmapIndex([{"allergens": "Milch, Mystery-Zutat"}, {"allergens": "Sesam Trüffelöl"}], {})
+    assert index.stats()["unrecognized"] == ["mystery zutat", "trueffeloel"]
+    assert set(index.stats()["allergens"]) - set(ALLERGEN_SYNONYMS) == {"mystery zutat", "trueffeloel"}
+
+
+def test_diet_flags_and_vegan_implies_vegetarian():
+    items = [{"vegan": True}, {"vegetarian": True}, {"glutenfree": True}]
+    index = MenuBitmapIndex(items, {"tapas": [0, 2]})
+    assert list(index.positions(index.select(flags=["vegetarian"]))) == [0, 1]
+    assert list(index.positions(index.select(flags=["glutenfree"], category="tapas"))) == [2]
@@ -0,0 +1,59 @@
+import pytest
+
+from menu_import import MenuImportError, menu_key, parse_document, validate
+
+
+def test_parse_csv_with_semicolons_and_bom():
+    body = "\ufeffname;category;price;vegan\nPatatas Bravas;Inicio;5,90;ja\n".encode("utf-8")
+    assert parse_document(body, "csv") == [
+        {"name": "Patatas Bravas", "category": "Inicio", "price": "5,90", "vegan": "ja"}]
+
+
+def test_parse_json_list_or_items_object():
+    rows = [{"name": "Flan", "category": "Dessert", "price": "4,90"}]
+    assert parse_document(b'[{"name": "Flan", "category": "Dessert", "price": "4,90"}]', "json") == rows
+    assert parse_document(b'{"items": [{"name": "Flan", "category": "Dessert", "price": "4,90"}]}', "json") == rows
+
+
+@pytest.mark.parametrize("body,fmt", [
+    (b"{not json", "json"),
+    (b'{"items": "Flan"}', "json"),
+    (b'[1, 2]', "json"),
+    (b"", "csv"),
+])
+def test_parse_rejects_unreadable_documents(body, fmt):
+    with pytest.raises(MenuImportError):
+        parse_document(body, fmt)
+
+
+def test_validate_converts_and_reports_rows():
+    rows = [
+        {"name": " Gambas al Ajillo ", "category": "Tapas de Pescado", "price": "9,90",
+         "vegan": "nein", "glutenfree": "x", "order_index": "67", "unknown": "dropped"},
+        {"name": "Flan", "category": "Dessert"},
+        {"name": "Churros", "category": "Dessert", "price": "5,50", "vegan": "vielleicht"},
+        {"name": "Tarta", "category": "Dessert", "price": "4,90", "order_index": "erste"},
+        {"name": "gambas al  ajillo", "category": "tapas de pescado", "price": "10,90"},
+        {"id": "abc", "name": "Crema Catalana", "category": "Dessert", "price": "5,90"},
+        {"id": "abc", "name": "Crema", "category": "Dessert", "price": "5,90"},
+    ]
+    valid, errors = validate(rows)
+    assert valid == [
+        {"name": "Gambas al Ajillo", "category": "Tapas de Pescado", "price": "9,90",
+         "vegan": False, "glutenfree": True, "order_index": 67},
+        {"id": "abc", "name": "Crema Catalana", "category": "Dessert", "price": "5,90"},
+    ]
+    assert [error["row"] for error in errors] == [2, 3, 4, 5, 7]
+    assert errors[0]["error"] == "missing price"
+    assert errors[3]["error"] == "duplicate of row 1"
+
+
+def test_menu_key_ignores_case_and_spacing():
+    assert menu_key(" Tapas de  Pescado", "GAMBAS al Ajillo ") == menu_key("tapas de pescado", "gambas al ajillo")
+
+
+def test_null_description_becomes_empty_string():
+    valid, errors = validate([{"name": "Flan", "category": "Dessert", "price": "4,90",
+                               "description": None, "origin": None}])
+    assert errors == []
+    assert valid[0]["description"] == "" and valid[0]["origin"] is None
@@ -0,0 +1,78 @@
+import json
+
+from menu_search import MenuSearchIndex, normalize, tokenize
+from menu_snapshot import MenuSnapshot
+
+
+def _item(item_id, name, **fields):
+    return {"id": item_id, "name": name, "description": "", "category": "Tapas", **fields}
+
+
+ITEMS = [
+    _item("1", "Gambas al Ajillo", ingredients="Riesengarnelen, Knoblauch, Olivenöl"),
+    _item("2", "Jamón Ibérico", description="Hauchdünn geschnittener Schinken"),
+    _item("3", "Patatas Bravas", description="Würzige Kartoffeln", vegan=True),
+    _item("4", "Crema Catalana", category="Dessert", allergens="Milch, Eier"),
+    _item("5", "Süßkartoffel-Pommes", description="Mit Soße", glutenfree=True),
+]
+
+
+def _index(items=ITEMS, digest="v1"):
+    index = MenuSearchIndex()
+    index.sync(MenuSnapshot(items, digest))
+    return index
+
+
+def test_normalize_folds_umlauts_sharp_s_and_accents():
+    assert normalize("Jamón Ibérico") == "jamon iberico"
+    assert normalize("Süßkartoffel Würzige") == "suesskartoffel wuerzige"
+    assert tokenize("Gambas mit dem Knoblauch") == ["gambas", "knoblauch"]
+
+
+def test_exact_prefix_and_umlaut_spellings():
+    index = _index()
+    assert index.search("jamon") == ["2"]
+    assert index.search("Jamón") == ["2"]
+    assert index.search("suesskartoffel") == ["5"]
+    assert index.search("Süßkart") == ["5"]
+    assert index.search("pat") == ["3"]
+
+
+def test_typos_and_compounds():
+    index = _index()
+    assert index.search("gambsa") == ["1"]          # transposition
+    assert index.search("kartofel") == ["3"]         # missing letter (Kartoffeln)
+    assert index.search("garnelen") == ["1"]         # part of Riesengarnelen
+
+
+def test_every_query_word_must_match_and_diet_terms():
+    index = _index()
+    assert index.search("gambas schinken") == []
+    assert index.search("vegan") == ["3"]
+    assert index.search("glutenfrei") == ["5"]
+    assert index.search("milch") == ["4"]
+    assert index.search("") == [] and index.search("und") == []
+
+
+def test_name_hits_rank_above_description_hits():
+    index = _index([_item("a", "Salat", description="mit Thunfisch"), _item("b", "Thunfisch Tataki")])
+    assert index.search("thunfisch") == ["b", "a"]
+
+
+def test_sync_reindexes_only_changed_items_and_drops_removed_ones():
+    index = _index()
+    updates = index.updates
+    changed = [dict(ITEMS[0], name="Gambas Pil Pil")] + ITEMS[1:4]
+    index.sync(MenuSnapshot(changed, "v2"))
+    assert index.updates == updates + 1
+    assert index.search("ajillo") == [] and index.search("pil") == ["1"]
+    assert index.search("suesskartoffel") == []
+    assert index.stats()["documents"] == 4
+    # Same digest: nothing to do
+    index.sync(MenuSnapshot(changed, "v2"))
+    assert index.updates == updates + 1
+
+
+def test_serialized_joins_fragments():
+    index = _index()
+    assert [item["id"] for item in json.loads(index.serialized(["2", "4"]))] == ["2", "4"]
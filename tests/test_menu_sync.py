@@ -0,0 +1,60 @@
+from menu_import import validate
+from menu_sync import MenuSyncPlan
+
+CURRENT = [
+    {"id": "1", "name": "Gambas al Ajillo", "category": "Tapas de Pescado", "price": "9,90",
+     "description": "Knoblauch-Olivenöl", "vegan": 0, "is_active": 1},
+    {"id": "2", "name": "Patatas Bravas", "category": "Inicio", "price": "5,90",
+     "description": None, "vegan": 1, "is_active": 1},
+    {"id": "3", "name": "Flan", "category": "Dessert", "price": "4,90", "is_active": 1},
+    {"id": "4", "name": "Paella", "category": "Tapa Paella", "price": "8,90", "is_active": 0},
+]
+
+
+def test_plan_writes_only_the_differences():
+    desired = [
+        {"name": "gambas al ajillo", "category": "Tapas de Pescado", "price": "10,90", "vegan": False},
+        {"id": "2", "name": "Patatas Bravas", "category": "Inicio", "price": "5,90", "description": "", "vegan": True},
+        {"name": "Paella", "category": "Tapa Paella", "price": "8,90"},
+        {"name": "Churros", "category": "Dessert", "price": "5,50"},
+    ]
+    plan = MenuSyncPlan(CURRENT, desired)
+    assert plan.updates == {"1": {"name": "gambas al ajillo", "price": "10,90"}, "4": {"is_active": True}}
+    assert plan.unchanged == 1
+    assert [row["name"] for row in plan.inserts] == ["Churros"]
+    assert plan.inserts[0]["description"] == "" and plan.inserts[0]["id"]
+    # Flan is missing from the file: deactivated, not deleted; Paella was inactive already before
+    assert plan.deactivate == ["3"]
+    assert plan.changes == 4
+
+
+def test_plan_summary_and_lines():
+    plan = MenuSyncPlan(CURRENT, [{"id": "3", "name": "Flan", "category": "Dessert", "price": "4,90"}])
+    summary = plan.summary()
+    assert (summary["inserted"], summary["updated"], summary["deactivated"], summary["unchanged"]) == (0, 0, 2, 1)
+    assert summary["deactivations"] == [{"id": "1", "name": "Gambas al Ajillo"}, {"id": "2", "name": "Patatas Bravas"}]
+    lines = list(plan.lines())
+    assert lines[-1] == "0 to insert, 0 to update, 2 to deactivate, 1 unchanged"
+
+
+def test_identical_menu_plans_nothing():
+    desired = [{key: value for key, value in row.items() if key != "is_active"} for row in CURRENT[:3]]
+    plan = MenuSyncPlan(CURRENT[:3], desired)
+    assert plan.changes == 0 and plan.unchanged == 3
+
+
+def test_null_description_from_a_document_never_reaches_the_plan():
+    desired, _ = validate([{"id": "1", "name": "Gambas al Ajillo", "category": "Tapas de Pescado",
+                            "price": "9,90", "description": None},
+                           {"name": "Churros", "category": "Dessert", "price": "5,50", "description": None}])
+    plan = MenuSyncPlan(CURRENT, desired)
+    assert plan.updates["1"] == {"description": ""}
+    assert plan.inserts[0]["description"] == ""
+
+
+def test_plan_never_writes_a_null_description():
+    plan = MenuSyncPlan(CURRENT, [{"id": "1", "name": "Gambas al Ajillo", "category": "Tapas de Pescado",
+                                   "price": "9,90", "description": None},
+                                  {"name": "Churros", "category": "Dessert", "price": "5,50", "description": None}])
+    assert plan.updates["1"] == {"description": ""}
+    assert plan.inserts[0]["description"] == ""
@@ -0,0 +1,39 @@
+import base64
+import json
+from datetime import datetime
+
+import pytest
+
+from pagination import decode_cursor, encode_cursor, keyset_page
+
+
+def _token(values):
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip("=")
+
+
+def test_cursor_round_trip():
+    date = datetime(2024, 5, 1, 18, 30, 15)
+    assert decode_cursor(encode_cursor(date, "abc"), datetime, str) == [date, "abc"]
+
+
+@pytest.mark.parametrize("token", [
+    "not base64!",
+    _token({"date": "2024-05-01"}),
+    _token(["2024-05-01T18:30:15"]),
+    _token([1, "x"]),
+    _token([None, "x"]),
+    _token(["2024-05-01T18:30:15", ["x"]]),
+    _token(["gestern", "x"]),
+    base64.urlsafe_b64encode(b"\xff\xfe").decode(),
+])
+def test_malformed_cursor_raises_value_error(token):
+    with pytest.raises(ValueError):
+        decode_cursor(token, datetime, str)
+
+
+def test_keyset_page():
+    rows = [{"id": str(i), "date": datetime(2024, 1, i + 1)} for i in range(3)]
+    page, cursor = keyset_page(rows, 2, key=lambda row: (row["date"], row["id"]))
+    assert page == rows[:2]
+    assert decode_cursor(cursor, datetime, str) == [rows[1]["date"], "1"]
+    assert keyset_page(rows, 3, key=lambda row: (row["date"], row["id"])) == (rows, None)
@@ -0,0 +1,90 @@
+import asyncio
+
+from query_cache import QueryCache, TTLCache
+
+
+class FakeConnection:
+    """Answers every SELECT with `rows`; `during_query` runs while the query is in flight"""
+
+    def __init__(self, rows, during_query=None):
+        self.rows = rows
+        self.during_query = during_query
+        self.queries = 0
+
+    async def cursor(self):
+        return self
+
+    async def execute(self, sql, params=None):
+        self.queries += 1
+        if self.during_query:
+            self.during_query()
+
+    async def fetchall(self):
+        return list(self.rows)
+
+
+def fetchall(cache, conn, sql, tags):
+    return asyncio.run(cache.fetchall(conn, sql, tags=tags))
+
+
+def test_fetch_caches_until_a_tag_is_invalidated():
+    cache = QueryCache()
+    conn = FakeConnection([{"id": 1}])
+    assert fetchall(cache, conn, "SELECT * FROM reviews", ("reviews",)) == [{"id": 1}]
+    assert fetchall(cache, conn, "SELECT * FROM reviews", ("reviews",)) == [{"id": 1}]
+    assert conn.queries == 1
+    cache.invalidate("menu_items")
+    fetchall(cache, conn, "SELECT * FROM reviews", ("reviews",))
+    assert conn.queries == 1
+    cache.invalidate("reviews")
+    fetchall(cache, conn, "SELECT * FROM reviews", ("reviews",))
+    assert conn.queries == 2
+
+
+def test_invalidation_drops_every_query_reading_the_table():
+    cache = QueryCache()
+    conn = FakeConnection([])
+    fetchall(cache, conn, "SELECT * FROM reviews", ("reviews",))
+    fetchall(cache, conn, "SELECT COUNT(*) FROM reviews", ("reviews",))
+    fetchall(cache, conn, "SELECT * FROM users", ("users",))
+    cache.invalidate("reviews")
+    assert len(cache) == 1
+    assert cache.stats()["tags"] == {"users": 1}
+
+
+def test_result_fetched_while_a_write_landed_is_not_stored():
+    cache = QueryCache()
+    conn = FakeConnection([{"id": "stale"}], during_query=lambda: cache.invalidate("users"))
+    assert fetchall(cache, conn, "SELECT * FROM users", ("users",)) == [{"id": "stale"}]
+    assert len(cache) == 0
+
+
+def test_digest_follows_the_content():
+    cache = QueryCache()
+    _, first = asyncio.run(cache.fetch(FakeConnection([{"id": 1}]), "SELECT 1", tags=("t",)))
+    cache.invalidate("t")
+    _, same = asyncio.run(cache.fetch(FakeConnection([{"id": 1}]), "SELECT 1", tags=("t",)))
+    cache.invalidate("t")
+    _, changed = asyncio.run(cache.fetch(FakeConnection([{"id": 2}]), "SELECT 1", tags=("t",)))
+    assert first == same != changed
+
+
+def test_ttl_cache_expiry_and_lru_eviction(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("query_cache.time.monotonic", lambda: now[0])
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)            # evicts b, the least recently used
+    assert cache.get("b") is None and cache.evictions == 1
+    now[0] += 11
+    assert cache.get("a") is None and len(cache) == 1
+
+
+def test_pop_where():
+    cache = TTLCache()
+    cache.set("x", {"id": 1})
+    cache.set("y", {"id": 2})
+    cache.pop_where(lambda value: value["id"] == 1)
+    assert cache.get("x") is None and cache.get("y") == {"id": 2}
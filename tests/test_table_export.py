@@ -0,0 +1,31 @@
+import csv
+import io
+import json
+from datetime import datetime
+
+from table_export import _CSVEncoder, _ndjson
+
+
+def _read_csv(chunk):
+    return list(csv.DictReader(io.StringIO(chunk.decode("utf-8-sig"))))
+
+
+def test_csv_neutralises_formulas():
+    encode = _CSVEncoder()
+    rows = [{"id": str(i), "message": message, "rating": -1}
+            for i, message in enumerate(["=HYPERLINK(\"http://x\")", "+1", "-2+3", "@SUM(A1)", "Hallo"])]
+    messages = [row["message"] for row in _read_csv(encode(rows))]
+    assert messages == ["'=HYPERLINK(\"http://x\")", "'+1", "'-2+3", "'@SUM(A1)", "Hallo"]
+
+
+def test_csv_header_and_bom_only_once():
+    encode = _CSVEncoder()
+    first = encode([{"id": "1", "date": datetime(2024, 5, 1), "phone": None}])
+    second = encode([{"id": "2", "date": datetime(2024, 5, 2), "phone": "0176"}])
+    assert first.startswith("\ufeff".encode("utf-8")) and b"id,date,phone" in first
+    assert second == b"2,2024-05-02T00:00:00,0176\r\n"
+
+
+def test_ndjson_keeps_values_verbatim():
+    line = _ndjson([{"message": "=1+1", "date": datetime(2024, 5, 1)}])
+    assert json.loads(line) == {"message": "=1+1", "date": "2024-05-01T00:00:00"}